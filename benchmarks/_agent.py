@@ -0,0 +1,179 @@
+"""Simulated SNMP printer agents for benchmarks.
+
+Each agent answers SNMPv1/v2c GET, GETNEXT and GETBULK requests from an
+in-memory MIB of a typical color laser printer. Run as a script it serves a
+range of loopback ports until stdin closes:
+
+    python benchmarks/_agent.py --port 20161 --count 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import sys
+from typing import Any
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.type import univ
+from pysnmp.proto import api
+
+V2C = api.PROTOCOL_MODULES[api.SNMP_VERSION_2C]
+
+COLORS = ("Black", "Cyan", "Magenta", "Yellow")
+HR_DEVICE_PRINTER = "1.3.6.1.2.1.25.3.1.5"
+
+
+def printer_mib(serial: str, supplies: int = 4, trays: int = 3) -> dict[str, Any]:
+    """Return the MIB values of a simulated color laser printer."""
+    mib: dict[str, Any] = {
+        "1.3.6.1.2.1.1.1.0": V2C.OctetString("HP Color LaserJet MFP M479fdw"),
+        "1.3.6.1.2.1.1.3.0": V2C.TimeTicks(12345),
+        "1.3.6.1.2.1.1.4.0": V2C.OctetString("IT"),
+        "1.3.6.1.2.1.1.5.0": V2C.OctetString(f"printer-{serial}"),
+        "1.3.6.1.2.1.1.6.0": V2C.OctetString("Office"),
+        "1.3.6.1.2.1.2.2.1.6.1": V2C.OctetString(b"\x00\x11\x22\x33\x44\x55"),
+        "1.3.6.1.2.1.25.2.2.0": V2C.Integer(262144),
+        "1.3.6.1.2.1.25.3.2.1.2.1": V2C.ObjectIdentifier(HR_DEVICE_PRINTER),
+        "1.3.6.1.2.1.25.3.2.1.3.1": V2C.OctetString("HP Color LaserJet"),
+        "1.3.6.1.2.1.25.3.2.1.5.1": V2C.Integer(2),
+        "1.3.6.1.2.1.25.3.5.1.1.1": V2C.Integer(3),
+        "1.3.6.1.2.1.25.3.5.1.2.1": V2C.OctetString(b"\x00"),
+        "1.3.6.1.2.1.43.5.1.1.17.1": V2C.OctetString(serial),
+        "1.3.6.1.2.1.43.10.2.1.4.1.1": V2C.Counter32(12000),
+        "1.3.6.1.2.1.43.6.1.1.3.1.1": V2C.OctetString("Front cover"),
+        "1.3.6.1.2.1.43.6.1.1.4.1.1": V2C.Integer(4),
+        "1.3.6.1.2.1.43.16.5.1.2.1.1": V2C.OctetString("Ready"),
+    }
+    for index in range(1, supplies + 1):
+        color = COLORS[(index - 1) % len(COLORS)]
+        row = f"1.{index}"
+        mib[f"1.3.6.1.2.1.43.11.1.1.4.{row}"] = V2C.Integer(3)
+        mib[f"1.3.6.1.2.1.43.11.1.1.5.{row}"] = V2C.Integer(3)
+        mib[f"1.3.6.1.2.1.43.11.1.1.6.{row}"] = V2C.OctetString(
+            f"{color} Cartridge HP 415A"
+        )
+        mib[f"1.3.6.1.2.1.43.11.1.1.7.{row}"] = V2C.Integer(19)
+        mib[f"1.3.6.1.2.1.43.11.1.1.8.{row}"] = V2C.Integer(100)
+        mib[f"1.3.6.1.2.1.43.11.1.1.9.{row}"] = V2C.Integer(80 - index)
+    for index in range(1, trays + 1):
+        row = f"1.{index}"
+        mib[f"1.3.6.1.2.1.43.8.2.1.9.{row}"] = V2C.Integer(250)
+        mib[f"1.3.6.1.2.1.43.8.2.1.10.{row}"] = V2C.Integer(100)
+        mib[f"1.3.6.1.2.1.43.8.2.1.13.{row}"] = V2C.OctetString(f"Tray {index}")
+    return mib
+
+
+class SimulatedPrinter(asyncio.DatagramProtocol):
+    """Answer SNMP requests from an in-memory MIB."""
+
+    def __init__(self, mib: dict[str, Any], community: str = "public") -> None:
+        """Initialize the agent."""
+        self.mib = {tuple(int(arc) for arc in k.split(".")): v for k, v in mib.items()}
+        self.oids = sorted(self.mib)
+        self.community = community
+        self.requests = 0
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport to answer on."""
+        self.transport = transport  # type: ignore[assignment]
+
+    def _next(self, oid: tuple[int, ...] | None) -> tuple[int, ...] | None:
+        """Return the OID following `oid` in the MIB."""
+        if oid is None:
+            return None
+        position = bisect.bisect_right(self.oids, oid)
+        return self.oids[position] if position < len(self.oids) else None
+
+    def _varbind(self, requested: Any, oid: tuple[int, ...] | None) -> tuple:
+        """Return the varbind of a GETNEXT result."""
+        if oid is None:
+            return requested, V2C.EndOfMibView("")
+        return univ.ObjectIdentifier(oid), self.mib[oid]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Answer one request."""
+        self.requests += 1
+        version = int(api.decodeMessageVersion(data))
+        proto = api.PROTOCOL_MODULES[version]
+        request, _ = decoder.decode(data, asn1Spec=proto.Message())
+        if str(proto.apiMessage.get_community(request)) != self.community:
+            return
+
+        response = proto.apiMessage.get_response(request)
+        pdu = proto.apiMessage.get_pdu(request)
+        varbinds = proto.apiPDU.get_varbinds(pdu)
+        error_status = error_index = 0
+        results: list[tuple] = []
+        if pdu.isSameTypeWith(proto.GetRequestPDU()):
+            for position, (oid, _) in enumerate(varbinds):
+                value = self.mib.get(tuple(oid))
+                if value is not None:
+                    results.append((oid, value))
+                elif version == api.SNMP_VERSION_1:
+                    error_status, error_index, results = 2, position + 1, varbinds
+                    break
+                else:
+                    results.append((oid, V2C.NoSuchInstance("")))
+        elif pdu.isSameTypeWith(proto.GetNextRequestPDU()):
+            for position, (oid, _) in enumerate(varbinds):
+                following = self._next(tuple(oid))
+                if following is None and version == api.SNMP_VERSION_1:
+                    error_status, error_index, results = 2, position + 1, varbinds
+                    break
+                results.append(self._varbind(oid, following))
+        elif pdu.isSameTypeWith(V2C.GetBulkRequestPDU()):
+            non_repeaters = int(V2C.apiBulkPDU.get_non_repeaters(pdu))
+            repetitions = int(V2C.apiBulkPDU.get_max_repetitions(pdu))
+            for oid, _ in varbinds[:non_repeaters]:
+                results.append(self._varbind(oid, self._next(tuple(oid))))
+            columns: list[Any] = [tuple(oid) for oid, _ in varbinds[non_repeaters:]]
+            for _ in range(repetitions):
+                if not any(columns):
+                    break
+                for position, oid in enumerate(columns):
+                    following = self._next(oid)
+                    results.append(
+                        self._varbind(univ.ObjectIdentifier(oid or (0, 0)), following)
+                    )
+                    columns[position] = following
+
+        response_pdu = proto.apiMessage.get_pdu(response)
+        proto.apiPDU.set_error_status(response_pdu, error_status)
+        proto.apiPDU.set_error_index(response_pdu, error_index)
+        proto.apiPDU.set_varbinds(response_pdu, results)
+        if self.transport is not None:
+            self.transport.sendto(encoder.encode(response), addr)
+
+
+async def start_agents(
+    port: int, count: int, host: str = "127.0.0.1"
+) -> list[SimulatedPrinter]:
+    """Start `count` agents on consecutive ports."""
+    loop = asyncio.get_running_loop()
+    agents = []
+    for offset in range(count):
+        _, agent = await loop.create_datagram_endpoint(
+            lambda offset=offset: SimulatedPrinter(printer_mib(f"SN{offset:06d}")),
+            local_addr=(host, port + offset),
+        )
+        agents.append(agent)
+    return agents
+
+
+async def _serve(port: int, count: int) -> None:
+    """Serve agents until stdin closes."""
+    await start_agents(port, count)
+    print("ready", flush=True)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, sys.stdin.read)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=20161)
+    parser.add_argument("--count", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.port, args.count))
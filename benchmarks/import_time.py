@@ -0,0 +1,117 @@
+"""Measure what loading the integration costs.
+
+Every scenario runs in a fresh interpreter and is repeated, the median is
+reported in milliseconds:
+
+    python benchmarks/import_time.py [--runs 7] [--max-ms 50]
+
+`--max-ms` makes the script exit non-zero when importing the integration
+modules (without the SNMP backend) takes longer, so load cost regressions
+can be caught in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCHMARKS_DIR.parent
+SCRIPTS_DIR = REPO_DIR / "scripts"
+
+_PRELUDE = f"""
+import sys, time
+sys.path.insert(0, {str(SCRIPTS_DIR)!r})
+sys.path.insert(0, {str(REPO_DIR)!r})
+import _integration
+_integration.register()
+"""
+
+# Standard library modules Home Assistant always has loaded
+_STDLIB = "import asyncio, ipaddress, logging, random, re, socket"
+
+# name: (setup code, measured code)
+SCENARIOS = {
+    "integration modules": (
+        _STDLIB,
+        "import snmp_printer.const, snmp_printer.snmp_client, snmp_printer.discovery",
+    ),
+    "snmp backend import": (
+        "import snmp_printer.snmp_client as c",
+        "c.load_backend()",
+    ),
+    "snmp engine creation": (
+        "import snmp_printer.snmp_client as c; c.load_backend()",
+        "c.SNMPClient('127.0.0.1')._create_engine()",
+    ),
+}
+
+# Only measurable when Home Assistant is installed, the HA modules the
+# integration imports are loaded first so only our own cost is counted
+HA_SCENARIOS = {
+    "config flow (HA loaded)": (
+        "import homeassistant.config_entries, homeassistant.helpers.config_validation",
+        "import custom_components.snmp_printer.config_flow",
+    ),
+    "integration setup (HA loaded)": (
+        "import homeassistant.helpers.update_coordinator, "
+        "homeassistant.helpers.storage, homeassistant.helpers.aiohttp_client",
+        "import custom_components.snmp_printer",
+    ),
+}
+
+
+def _measure(setup: str, statement: str) -> float:
+    """Return the time in ms `statement` takes in a fresh interpreter."""
+    code = (
+        f"{_PRELUDE}\n{setup}\n"
+        f"start = time.perf_counter()\n{statement}\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_DIR,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the scenarios and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    scenarios = dict(SCENARIOS)
+    if importlib.util.find_spec("homeassistant") is not None:
+        scenarios.update(HA_SCENARIOS)
+    else:
+        print("homeassistant not installed, skipping config flow scenarios\n")
+
+    results = {}
+    for name, (setup, statement) in scenarios.items():
+        samples = [_measure(setup, statement) for _ in range(args.runs)]
+        results[name] = statistics.median(samples)
+        print(
+            f"{name:32} median {results[name]:8.1f} ms"
+            f"  (min {min(samples):.1f}, max {max(samples):.1f})"
+        )
+
+    if args.max_ms is not None and results["integration modules"] > args.max_ms:
+        print(
+            f"\nintegration modules took {results['integration modules']:.1f} ms, "
+            f"limit is {args.max_ms:.1f} ms"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
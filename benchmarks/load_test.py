@@ -0,0 +1,261 @@
+"""Measure how polling many printers loads the event loop.
+
+For each fleet size, simulated printer agents are started on loopback ports
+in separate processes and an SNMP client is set up per printer, the way
+config entries are. All printers are then polled at once, as coordinators
+set up together are, with the coordinator's queries and snapshot building:
+first the initial poll (engine creation, table walks), then steady polls.
+
+    python benchmarks/load_test.py [--printers 10,50,100,300] [--rounds 3]
+
+Per fleet size this reports the refresh latency of each printer, the event
+loop's lag (how late a 5 ms timer fires) during the polls, the CPU time per
+poll and the memory per printer. `--json` saves the results so a change can
+be compared with an earlier run. The agents share the machine's CPUs with
+the poller, run it on a multi-core machine for meaningful latencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR))
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "scripts"))
+
+import _integration  # noqa: E402
+
+_integration.register()
+
+from snmp_printer.const import REQUEST_MEMO_TTL  # noqa: E402
+from snmp_printer.forecast import SupplyForecaster  # noqa: E402
+from snmp_printer.model import PrinterSnapshot, to_store  # noqa: E402
+from snmp_printer.poll import poll_printer  # noqa: E402
+from snmp_printer.snmp_client import SNMPClient, load_backend  # noqa: E402
+from snmp_printer.throughput import PageRateTracker  # noqa: E402
+
+LAG_TICK = 0.005  # Seconds between event loop lag samples
+
+
+class LagMonitor:
+    """Sample how late the event loop runs a periodic timer."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        """Record the lag of each tick."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LAG_TICK)
+            self.samples.append(loop.time() - started - LAG_TICK)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def take(self) -> list[float]:
+        """Return the samples since the last call."""
+        samples, self.samples = self.samples, []
+        return samples
+
+
+class Printer:
+    """Poll one printer with the coordinator's poll, without Home Assistant.
+
+    The web interface check and saving to the Store are left out, the
+    stored form of the snapshot is still built.
+    """
+
+    def __init__(self, client: SNMPClient) -> None:
+        """Initialize the printer."""
+        self.client = client
+        self.forecaster = SupplyForecaster()
+        self.page_rates = PageRateTracker()
+        self.snapshot: PrinterSnapshot | None = None
+
+    async def poll(self) -> bool:
+        """Poll the printer, return False when it didn't answer."""
+        try:
+            self.snapshot = await poll_printer(
+                self.client, self.forecaster, self.page_rates, self.snapshot
+            )
+        except ConnectionError:
+            return False
+        to_store(self.snapshot)
+        return True
+
+
+def _rss_kib() -> float:
+    """Return the peak resident memory of the process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KiB elsewhere
+    return peak / 1024 if sys.platform == "darwin" else peak
+
+
+def _percentile(values: list[float], share: float) -> float:
+    """Return a percentile of values, 0 for none."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * share), len(values) - 1)]
+
+
+def _start_agents(port: int, count: int, processes: int) -> list[subprocess.Popen]:
+    """Start agents for `count` printers split over processes."""
+    agents = []
+    per_process = -(-count // processes)
+    for first in range(0, count, per_process):
+        agents.append(
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    str(BENCHMARKS_DIR / "_agent.py"),
+                    "--port",
+                    str(port + first),
+                    "--count",
+                    str(min(per_process, count - first)),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+        )
+    for agent in agents:
+        agent.stdout.readline()  # type: ignore[union-attr]
+    return agents
+
+
+async def _round(printers: list[Printer], monitor: LagMonitor) -> dict[str, Any]:
+    """Poll all printers at once and measure the round."""
+
+    async def timed(printer: Printer) -> tuple[float, bool]:
+        started = time.perf_counter()
+        answered = await printer.poll()
+        return time.perf_counter() - started, answered
+
+    monitor.take()
+    cpu_started = time.process_time()
+    results = await asyncio.gather(*(timed(printer) for printer in printers))
+    cpu = time.process_time() - cpu_started
+    lags = monitor.take()
+    latencies = [latency for latency, _ in results]
+    return {
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p95_ms": _percentile(latencies, 0.95) * 1000,
+        "latency_max_ms": max(latencies) * 1000,
+        "lag_p99_ms": _percentile(lags, 0.99) * 1000,
+        "lag_max_ms": max(lags, default=0.0) * 1000,
+        "cpu_ms_per_poll": cpu * 1000 / len(printers),
+        "failed": sum(not answered for _, answered in results),
+    }
+
+
+async def run(count: int, rounds: int, port: int, processes: int) -> dict[str, Any]:
+    """Measure a fleet of `count` printers."""
+    agents = _start_agents(port, count, processes)
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, load_backend)
+        monitor = LagMonitor()
+        monitor.start()
+        rss_before = _rss_kib()
+
+        printers = [
+            Printer(SNMPClient("127.0.0.1", port + offset)) for offset in range(count)
+        ]
+        first = await _round(printers, monitor)
+        steady = []
+        for _ in range(rounds):
+            # Let the client's memo of the previous round expire
+            await asyncio.sleep(REQUEST_MEMO_TTL + 0.5)
+            steady.append(await _round(printers, monitor))
+        return {
+            "printers": count,
+            "first": first,
+            "steady": {key: max(r[key] for r in steady) for key in steady[0]},
+            "kib_per_printer": (_rss_kib() - rss_before) / count,
+        }
+    finally:
+        for agent in agents:
+            agent.stdin.close()  # type: ignore[union-attr]
+            agent.wait()
+
+
+def _measure(count: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Measure a fleet size in a fresh interpreter."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--single",
+            str(count),
+            "--rounds",
+            str(args.rounds),
+            "--port",
+            str(args.port),
+            "--agent-processes",
+            str(args.agent_processes),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    """Run the load test and print the scaling curve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--printers", default="10,50,100,300")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=20161)
+    parser.add_argument("--agent-processes", type=int, default=2)
+    parser.add_argument("--json", type=Path, help="save the results to a file")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        result = asyncio.run(
+            run(args.single, args.rounds, args.port, args.agent_processes)
+        )
+        print(json.dumps(result))
+        return 0
+
+    results = []
+    print(
+        f"{'printers':>8} {'poll':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+        f"{'lag p99':>8} {'lag max':>8} {'CPU ms':>7} {'KiB':>6} {'failed':>6}"
+    )
+    for count in (int(count) for count in args.printers.split(",")):
+        result = _measure(count, args)
+        results.append(result)
+        memory = f"{result['kib_per_printer']:6.0f}"
+        for poll in ("first", "steady"):
+            stats = result[poll]
+            print(
+                f"{count:8} {poll:>6} {stats['latency_p50_ms']:8.1f} "
+                f"{stats['latency_p95_ms']:8.1f} {stats['latency_max_ms']:8.1f} "
+                f"{stats['lag_p99_ms']:8.1f} {stats['lag_max_ms']:8.1f} "
+                f"{stats['cpu_ms_per_poll']:7.2f} "
+                f"{memory if poll == 'first' else '':>6} {stats['failed']:6}"
+            )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
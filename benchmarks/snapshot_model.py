@@ -0,0 +1,162 @@
+"""Compare the coordinator's snapshot model with the plain dicts it replaced.
+
+For a fleet of simulated printers this reports, per printer, the memory the
+published data retains, the memory a poll that changed nothing but the
+uptime adds, and the size and encoding time of the cached data:
+
+    python benchmarks/snapshot_model.py [--printers 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import _integration  # noqa: E402
+
+_integration.register()
+
+from snmp_printer.model import build_snapshot, to_store  # noqa: E402
+
+COLORS = ("Black", "Cyan", "Magenta", "Yellow")
+
+
+def poll_data(printer: int, uptime: int) -> dict[str, Any]:
+    """Return the dicts one poll of a typical color printer produces."""
+    page_counts = {
+        "total": 12000 + printer,
+        "color": 4000,
+        "black_and_white": 8000 + printer,
+        "duplex": None,
+    }
+    status = {
+        "state": "idle",
+        "errors": None,
+        "serial_number": f"SN{printer:06d}",
+        "mac_address": "00:11:22:33:44:55",
+        "memory_size": "262144",
+        "page_count": page_counts["total"],
+        "page_counts": page_counts,
+    }
+    return {
+        "info": {
+            "description": "HP Color LaserJet MFP M479fdw",
+            "name": f"printer-{printer}",
+            "contact": "",
+            "location": "Office",
+            "uptime": str(uptime),
+            **status,
+        },
+        "status": status,
+        "page_count": page_counts,
+        "supplies": [
+            {
+                "index": str(index),
+                "description": f"{color} Cartridge HP 415A",
+                "color": color,
+                "type": "toner",
+                "class": "supplyThatIsConsumed",
+                "max_capacity": 100,
+                "level": 60 - index,
+                "percentage": 60 - index,
+                "days_remaining": 42.5,
+                "pages_remaining": 1500,
+            }
+            for index, color in enumerate(COLORS, 1)
+        ],
+        "input_trays": [
+            {
+                "index": str(index),
+                "description": f"Tray {index}",
+                "max_capacity": 250,
+                "level": 100,
+                "percentage": 40,
+            }
+            for index in range(1, 4)
+        ],
+        "display_text": "Ready",
+        "errors": None,
+        "cover_status": {"state": "closed"},
+        "web_interface_available": True,
+        "page_rates": {
+            "pages_per_hour": {"total": 3, "color": 1, "black_and_white": 2},
+            "pages_per_day": {"total": 40, "color": 10, "black_and_white": 30},
+        },
+        "is_online": True,
+    }
+
+
+def _retained(build: Callable[[], list[Any]]) -> tuple[int, list[Any]]:
+    """Return the bytes the objects returned by `build` keep alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, objects
+
+
+def main() -> int:
+    """Run the comparison and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--printers", type=int, default=500)
+    args = parser.parse_args()
+    count = args.printers
+    polls = [poll_data(printer, 1000) for printer in range(count)]
+    next_polls = [poll_data(printer, 1100) for printer in range(count)]
+
+    dict_bytes, dicts = _retained(lambda: [copy.deepcopy(poll) for poll in polls])
+    model_bytes, snapshots = _retained(lambda: [build_snapshot(p) for p in polls])
+
+    # The previous data stays referenced by entities while the next poll is
+    # built, only what the new poll adds is counted
+    dict_poll_bytes, _ = _retained(lambda: [copy.deepcopy(poll) for poll in next_polls])
+    model_poll_bytes, _ = _retained(
+        lambda: [
+            build_snapshot(poll, previous)
+            for poll, previous in zip(next_polls, snapshots, strict=True)
+        ]
+    )
+
+    start = time.perf_counter()
+    dict_store = json.dumps({"data": dicts})
+    dict_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    model_store = json.dumps({"snapshot": [to_store(s) for s in snapshots]})
+    model_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{count} printers, per printer:")
+    print(f"{'':24} {'dicts':>10} {'snapshot':>10}")
+    print(
+        f"{'retained bytes':24} {dict_bytes / count:10.0f} "
+        f"{model_bytes / count:10.0f}"
+    )
+    print(
+        f"{'bytes added per poll':24} {dict_poll_bytes / count:10.0f} "
+        f"{model_poll_bytes / count:10.0f}"
+    )
+    print(
+        f"{'stored bytes':24} {len(dict_store) / count:10.0f} "
+        f"{len(model_store) / count:10.0f}"
+    )
+    print(
+        f"{'encoding µs':24} {dict_ms * 1000 / count:10.1f} "
+        f"{model_ms * 1000 / count:10.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
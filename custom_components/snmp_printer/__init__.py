@@ -2,19 +2,30 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .api import async_remove_metrics, async_setup_metrics
+from .const import (
+    CONF_RETRIES,
+    CONF_TIMEOUT,
+    CONNECTION_SETTINGS,
+    DATA_VALIDATED,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    VALIDATION_RETRIES,
+    VALIDATION_TIMEOUT,
+)
+from .coordinator import SNMPPrinterCoordinator, entry_option
+from .services import async_setup_services
 from .snmp_client import SNMPClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,33 +35,9 @@ STORAGE_VERSION = 1
 STORAGE_KEY = "snmp_printer_cached_data"
 
 
-async def check_web_interface(host: str, hass: HomeAssistant) -> bool:
-    """Check if the printer has a web interface available."""
-    session = async_get_clientsession(hass)
-
-    # Try HTTP first
-    try:
-        async with asyncio.timeout(3):
-            async with session.get(f"http://{host}", allow_redirects=True) as response:
-                if (
-                    response.status < 500
-                ):  # Any response below 500 means web interface exists
-                    return True
-    except Exception:
-        pass
-
-    # Try HTTPS
-    try:
-        async with asyncio.timeout(3):
-            async with session.get(
-                f"https://{host}", allow_redirects=True, ssl=False
-            ) as response:
-                if response.status < 500:
-                    return True
-    except Exception:
-        pass
-
-    return False
+def connection_settings(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the connection settings of config entry data."""
+    return {key: data.get(key) for key in CONNECTION_SETTINGS}
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -68,119 +55,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         auth_key=entry.data.get("auth_key"),
         priv_protocol=entry.data.get("priv_protocol"),
         priv_key=entry.data.get("priv_key"),
-    )
-
-    # Verify connection
-    try:
-        await snmp_client.get_system_info()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Unable to connect to printer: {err}") from err
-
-    # Get update interval from config or options
-    update_interval = entry.options.get(
-        CONF_UPDATE_INTERVAL,
-        entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        timeout=entry_option(entry, CONF_TIMEOUT, DEFAULT_TIMEOUT),
+        retries=entry_option(entry, CONF_RETRIES, DEFAULT_RETRIES),
     )
 
     # Create storage for cached data
     store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
 
-    # Load cached data
-    cached_data = await store.async_load() or {}
-
-    # Create coordinator
-    async def async_update_data():
-        """Fetch data from SNMP printer."""
-        try:
-            system_info = await snmp_client.get_system_info()
-            device_info = await snmp_client.get_device_info()
-            data = {
-                "info": {**system_info, **device_info},
-                "status": device_info,
-                "cover_status": {"state": await snmp_client.get_cover_status()},
-                "page_count": device_info.get(
-                    "page_counts", {"total": device_info.get("page_count")}
-                ),
-                "supplies": await snmp_client.get_supplies(),
-                "input_trays": await snmp_client.get_input_trays(),
-                "display_text": await snmp_client.get_display_text(),
-                "errors": await snmp_client.get_printer_errors(),
-                "web_interface_available": await check_web_interface(
-                    entry.data[CONF_HOST], hass
-                ),
-            }
-
-            # Save successful data to cache with timestamp
-            cache_data = {
-                "data": data,
-                "timestamp": datetime.now().isoformat(),
-                "host": entry.data[CONF_HOST],
-            }
-            await store.async_save(cache_data)
-
-            # Mark as online
-            data["is_online"] = True
-
-            return data
-        except Exception as err:
-            # Check if this is a connection-related error
-            error_msg = str(err).lower()
-            is_connection_error = any(
-                keyword in error_msg
-                for keyword in [
-                    "timeout",
-                    "unreachable",
-                    "no route",
-                    "connection",
-                    "network",
-                    "host",
-                    "refused",
-                    "failed",
-                    "no response",
-                ]
+    coordinator = SNMPPrinterCoordinator(hass, entry, snmp_client, store)
+
+    # Entities are created from cached data when there is some, the first
+    # live poll then runs in the background so an offline printer doesn't
+    # hold up startup. Without a cache they are created from a probe: the
+    # one the config flow read for a printer just added, otherwise a single
+    # short GET, so an offline printer is retried later instead of timing
+    # out a whole poll.
+    if not await coordinator.async_load_cache():
+        probe = hass.data.get(DATA_VALIDATED, {}).pop(entry.data[CONF_HOST], None)
+        if probe is None:
+            probe = await snmp_client.probe(VALIDATION_TIMEOUT, VALIDATION_RETRIES)
+        if not probe:
+            raise ConfigEntryNotReady(
+                f"Printer {entry.data[CONF_HOST]} is not answering"
             )
-
-            # If we have cached data and this is a connection issue, return cached data
-            if cached_data.get("data") and is_connection_error:
-                _LOGGER.warning(
-                    "Printer %s is offline (%s), using cached data from %s",
-                    entry.data[CONF_HOST],
-                    err,
-                    cached_data.get("timestamp", "unknown"),
-                )
-
-                cached_printer_data = cached_data["data"].copy()
-                cached_printer_data["is_online"] = False
-                cached_printer_data["offline_since"] = cached_data.get("timestamp")
-
-                return cached_printer_data
-
-            # For other errors or when we don't have cached data, re-raise the error
-            raise UpdateFailed(f"Error fetching printer data: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"snmp_printer_{entry.data[CONF_HOST]}",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=update_interval),
-    )
-
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+        await coordinator.async_seed(probe)
 
     # Store coordinator, client, and storage
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "client": snmp_client,
         "store": store,
+        "connection": connection_settings(entry.data),
     }
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async_setup_services(hass)
+    async_setup_metrics(hass, entry, coordinator)
+
     # Register update listener for options
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        f"snmp_printer first refresh {entry.data[CONF_HOST]}",
+    )
 
     return True
 
@@ -188,11 +109,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        async_remove_metrics(hass, entry)
+        hass.data[DOMAIN].pop(entry.entry_id)["coordinator"].cancel_profile()
 
     return unload_ok
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed settings, reloading only for a new connection."""
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        # Not set up, or unloaded by a reload in progress
+        return
+    if connection_settings(entry.data) != entry_data["connection"]:
+        await async_reload_entry(hass, entry)
+        return
+
+    _LOGGER.debug("Applying options of %s without reload", entry.data[CONF_HOST])
+    entry_data["coordinator"].apply_options()
+    async_setup_metrics(hass, entry, entry_data["coordinator"])
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,81 @@
+"""HTTP API of the SNMP Printer integration."""
+
+from __future__ import annotations
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_METRICS, DOMAIN, METRICS_URL
+from .coordinator import SNMPPrinterCoordinator, entry_option
+from .metrics import CONTENT_TYPE, MetricsExporter
+
+DATA_METRICS = f"{DOMAIN}_metrics"
+
+
+class MetricsView(HomeAssistantView):
+    """Serve the metrics of the printers in the OpenMetrics text format."""
+
+    url = METRICS_URL
+    name = "api:snmp_printer:metrics"
+
+    def __init__(self, exporter: MetricsExporter) -> None:
+        """Initialize the view."""
+        self._exporter = exporter
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the rendered metrics."""
+        return web.Response(
+            body=self._exporter.render(), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+
+@callback
+def async_setup_metrics(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SNMPPrinterCoordinator
+) -> None:
+    """Export the metrics of a printer while its metrics option is on.
+
+    Called on setup and when the options change. The view is registered
+    with the first printer that turns the option on.
+    """
+    async_remove_metrics(hass, entry)
+    if not entry_option(entry, CONF_METRICS, False):
+        return
+
+    exporter: MetricsExporter | None = hass.data.get(DATA_METRICS)
+    if exporter is None:
+        exporter = hass.data[DATA_METRICS] = MetricsExporter()
+        hass.http.register_view(MetricsView(exporter))
+
+    @callback
+    def async_update() -> None:
+        """Render the printer's samples after a refresh."""
+        exporter.update(
+            entry.entry_id,
+            entry.data[CONF_HOST],
+            entry.title,
+            coordinator.client.primary_device,
+            coordinator.data,
+            coordinator.last_update_success
+            and coordinator.data is not None
+            and coordinator.data.is_online,
+            coordinator.poll_stats,
+            coordinator.client.round_trip_time,
+        )
+
+    async_update()
+    hass.data[DOMAIN][entry.entry_id]["metrics"] = coordinator.async_add_listener(
+        async_update
+    )
+
+
+@callback
+def async_remove_metrics(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop exporting the metrics of a printer."""
+    unsubscribe = hass.data[DOMAIN][entry.entry_id].pop("metrics", None)
+    if unsubscribe is not None:
+        unsubscribe()
+        hass.data[DATA_METRICS].remove(entry.entry_id)
@@ -9,115 +9,273 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .const import (
     CONF_AUTH_KEY,
     CONF_AUTH_PROTOCOL,
     CONF_COMMUNITY,
+    CONF_HOSTS,
+    CONF_METRICS,
+    CONF_NETWORK,
     CONF_PRIV_KEY,
     CONF_PRIV_PROTOCOL,
+    CONF_RETRIES,
     CONF_SNMP_VERSION,
+    CONF_TIMEOUT,
     CONF_UPDATE_INTERVAL,
+    CONNECTION_SETTINGS,
+    DATA_VALIDATED,
     DEFAULT_COMMUNITY,
     DEFAULT_PORT,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    ENTRY_OPTIONS,
+    HR_DEVICE_PRINTER,
+    VALIDATION_RETRIES,
+    VALIDATION_TIMEOUT,
 )
+from .discovery import NetworkTooLarge, ProbeCache, async_sweep_network
 from .snmp_client import SNMPClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Probe results shared by all discovery flows, bounded and expiring
+_PROBE_CACHE = ProbeCache()
+
 
 class SNMPPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SNMP Printer."""
 
     VERSION = 1
-    _discovered_hosts: set[str] = (
-        set()
-    )  # Class variable for cross-instance deduplication
 
     def __init__(self):
         """Initialize the config flow."""
         self.discovery_info = {}
+        self._scan_results: list[dict[str, Any]] = []
+        self._scan_settings: dict[str, Any] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
-        return await self.async_step_manual()
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
 
-    async def async_step_manual(
+    async def async_step_scan(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle manual printer configuration."""
+        """Sweep a network range for printers that have mDNS turned off."""
         errors = {}
 
         if user_input is not None:
-            # Create SNMP client and test connection
-            client = SNMPClient(
-                host=user_input[CONF_HOST],
-                port=user_input.get(CONF_PORT, DEFAULT_PORT),
-                snmp_version=user_input.get(CONF_SNMP_VERSION, "2c"),
-                community=user_input.get(CONF_COMMUNITY, DEFAULT_COMMUNITY),
-                username=user_input.get(CONF_USERNAME),
-                auth_protocol=user_input.get(CONF_AUTH_PROTOCOL),
-                auth_key=user_input.get(CONF_AUTH_KEY),
-                priv_protocol=user_input.get(CONF_PRIV_PROTOCOL),
-                priv_key=user_input.get(CONF_PRIV_KEY),
-            )
-
             try:
-                # Get printer info to verify connection
-                system_info = await client.get_system_info()
-                device_info = await client.get_device_info()
+                printers = await async_sweep_network(
+                    user_input[CONF_NETWORK],
+                    community=user_input.get(CONF_COMMUNITY, DEFAULT_COMMUNITY),
+                    snmp_version=user_input.get(CONF_SNMP_VERSION, "2c"),
+                )
+            except NetworkTooLarge:
+                errors[CONF_NETWORK] = "network_too_large"
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                configured = {
+                    entry.data.get(CONF_HOST) for entry in self._async_current_entries()
+                }
+                self._scan_results = [
+                    printer for printer in printers if printer["host"] not in configured
+                ]
+                if self._scan_results:
+                    self._scan_settings = user_input
+                    return await self.async_step_scan_select()
+                errors["base"] = "no_printers_found"
 
-                # Use serial number as unique ID, fallback to host
-                unique_id = device_info.get("serial_number", user_input[CONF_HOST])
-
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-
-                # Extract model name from description for better title
-                description = system_info.get("description") or ""
-                location = system_info.get("location") or ""
-                name = system_info.get("name") or ""
-
-                # Try to get model name from description PID field
-                model_name = None
-                if description and "PID:" in description:
-                    parts = description.split("PID:")
-                    if len(parts) > 1:
-                        model_name = parts[1].split(",")[0].split(";")[0].strip()
-                elif location:
-                    model_name = location
-                elif name:
-                    model_name = name
-
-                # Create entry with printer model as title
-                title = model_name or user_input[CONF_HOST]
-
-                return self.async_create_entry(
-                    title=title,
-                    data={
-                        CONF_HOST: user_input[CONF_HOST],
-                        CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
-                        CONF_SNMP_VERSION: user_input.get(CONF_SNMP_VERSION, "2c"),
-                        CONF_COMMUNITY: user_input.get(
-                            CONF_COMMUNITY, DEFAULT_COMMUNITY
-                        ),
-                        CONF_USERNAME: user_input.get(CONF_USERNAME),
-                        CONF_AUTH_PROTOCOL: user_input.get(CONF_AUTH_PROTOCOL),
-                        CONF_AUTH_KEY: user_input.get(CONF_AUTH_KEY),
-                        CONF_PRIV_PROTOCOL: user_input.get(CONF_PRIV_PROTOCOL),
-                        CONF_PRIV_KEY: user_input.get(CONF_PRIV_KEY),
-                        CONF_UPDATE_INTERVAL: user_input.get(
-                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                        ),
-                    },
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_NETWORK,
+                    default=user_input.get(CONF_NETWORK, "") if user_input else "",
+                ): str,
+                vol.Optional(
+                    CONF_SNMP_VERSION,
+                    default=(
+                        user_input.get(CONF_SNMP_VERSION, "2c") if user_input else "2c"
+                    ),
+                ): vol.In(["1", "2c"]),
+                vol.Optional(
+                    CONF_COMMUNITY,
+                    default=(
+                        user_input.get(CONF_COMMUNITY, DEFAULT_COMMUNITY)
+                        if user_input
+                        else DEFAULT_COMMUNITY
+                    ),
+                ): str,
+            }
+        )
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    async def async_step_scan_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick which of the swept printers to add."""
+        if user_input is not None:
+            hosts = user_input[CONF_HOSTS]
+            for host in hosts:
+                # One import flow per printer, they validate and create
+                # their own entries in parallel
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={
+                            CONF_HOST: host,
+                            CONF_PORT: DEFAULT_PORT,
+                            CONF_SNMP_VERSION: self._scan_settings.get(
+                                CONF_SNMP_VERSION, "2c"
+                            ),
+                            CONF_COMMUNITY: self._scan_settings.get(
+                                CONF_COMMUNITY, DEFAULT_COMMUNITY
+                            ),
+                            CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+                        },
+                    )
                 )
+            return self.async_abort(
+                reason="scan_complete",
+                description_placeholders={"count": str(len(hosts))},
+            )
+
+        options = {
+            printer["host"]: (
+                f"{printer['host']} - {printer['description'][:60]}"
+                if printer.get("description")
+                else printer["host"]
+            )
+            for printer in self._scan_results
+        }
 
+        return self.async_show_form(
+            step_id="scan_select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS, default=list(options)): cv.multi_select(
+                        options
+                    )
+                }
+            ),
+            description_placeholders={"count": str(len(options))},
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a printer selected from a network sweep."""
+        try:
+            return await self._async_create_printer_entry(import_data)
+        except AbortFlow:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Could not add printer %s found by network sweep",
+                import_data[CONF_HOST],
+            )
+            return self.async_abort(reason="cannot_connect")
+
+    async def _async_create_printer_entry(
+        self, user_input: dict[str, Any]
+    ) -> FlowResult:
+        """Verify the printer answers and create its config entry."""
+        # Create SNMP client and test connection
+        client = SNMPClient(
+            host=user_input[CONF_HOST],
+            port=user_input.get(CONF_PORT, DEFAULT_PORT),
+            snmp_version=user_input.get(CONF_SNMP_VERSION, "2c"),
+            community=user_input.get(CONF_COMMUNITY, DEFAULT_COMMUNITY),
+            username=user_input.get(CONF_USERNAME),
+            auth_protocol=user_input.get(CONF_AUTH_PROTOCOL),
+            auth_key=user_input.get(CONF_AUTH_KEY),
+            priv_protocol=user_input.get(CONF_PRIV_PROTOCOL),
+            priv_key=user_input.get(CONF_PRIV_KEY),
+            timeout=VALIDATION_TIMEOUT,
+            retries=VALIDATION_RETRIES,
+        )
+
+        # One GET of what identifies the printer verifies the connection,
+        # wrong credentials fail after a single short timeout
+        probe = await client.probe()
+        if not any(probe.values()):
+            raise ConnectionError(f"No response from {user_input[CONF_HOST]}")
+        if probe["device_type"] not in (None, HR_DEVICE_PRINTER):
+            _LOGGER.debug(
+                "hrDevice 1 of %s is not a printer (%s)",
+                user_input[CONF_HOST],
+                probe["device_type"],
+            )
+
+        # Use serial number as unique ID, fallback to host
+        unique_id = probe["serial_number"] or user_input[CONF_HOST]
+
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        # Extract model name from description for better title
+        description = probe["description"] or ""
+        location = probe["location"] or ""
+        name = probe["name"] or ""
+
+        # Try to get model name from description PID field
+        model_name = None
+        if description and "PID:" in description:
+            parts = description.split("PID:")
+            if len(parts) > 1:
+                model_name = parts[1].split(",")[0].split(";")[0].strip()
+        elif location:
+            model_name = location
+        elif name:
+            model_name = name
+
+        # Create entry with printer model as title
+        title = model_name or user_input[CONF_HOST]
+
+        # Handed to the first setup of the entry, see async_setup_entry()
+        self.hass.data.setdefault(DATA_VALIDATED, {})[user_input[CONF_HOST]] = probe
+
+        return self.async_create_entry(
+            title=title,
+            data={
+                CONF_HOST: user_input[CONF_HOST],
+                CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
+                CONF_SNMP_VERSION: user_input.get(CONF_SNMP_VERSION, "2c"),
+                CONF_COMMUNITY: user_input.get(CONF_COMMUNITY, DEFAULT_COMMUNITY),
+                CONF_USERNAME: user_input.get(CONF_USERNAME),
+                CONF_AUTH_PROTOCOL: user_input.get(CONF_AUTH_PROTOCOL),
+                CONF_AUTH_KEY: user_input.get(CONF_AUTH_KEY),
+                CONF_PRIV_PROTOCOL: user_input.get(CONF_PRIV_PROTOCOL),
+                CONF_PRIV_KEY: user_input.get(CONF_PRIV_KEY),
+                CONF_UPDATE_INTERVAL: user_input.get(
+                    CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                ),
+            },
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle manual printer configuration."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                return await self._async_create_printer_entry(user_input)
+            except AbortFlow:
+                raise
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Error connecting to printer")
                 errors["base"] = "cannot_connect"
@@ -237,87 +395,34 @@ class SNMPPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not host:
             return self.async_abort(reason="unknown")
 
-        # Check if we already processed this IP in this session (class variable)
-        if host in SNMPPrinterConfigFlow._discovered_hosts:
-            _LOGGER.debug(
-                "Already processed discovery for %s, skipping duplicate", host
-            )
-            return self.async_abort(reason="already_in_progress")
-
-        # Mark this IP as being processed (class variable)
-        SNMPPrinterConfigFlow._discovered_hosts.add(host)
-
-        # Try to get printer info to set unique ID and get model name
-        # Try v2c first, then fall back to v1 if that fails
-        system_info = None
-        device_info = None
-        working_version = None
-
-        for snmp_version in ["2c", "1"]:
-            try:
-                _LOGGER.info(
-                    "Trying to connect to %s using SNMP v%s", host, snmp_version
-                )
-                client = SNMPClient(
-                    host=host,
-                    port=DEFAULT_PORT,
-                    snmp_version=snmp_version,
-                    community=DEFAULT_COMMUNITY,
-                    timeout=2.5,  # 2.5 seconds per request
-                    retries=1,  # 1 retry = total ~5 seconds max per version
-                )
-                system_info = await client.get_system_info()
-                device_info = await client.get_device_info()
-
-                # Check if we actually got useful data (not all None)
-                has_data = (
-                    system_info.get("description")
-                    or system_info.get("name")
-                    or device_info.get("serial_number")
-                    or device_info.get("mac_address")
-                )
+        # Hosts that are configured already need no SNMP traffic at all
+        self._async_abort_entries_match({CONF_HOST: host})
 
-                if has_data:
-                    working_version = snmp_version
-                    _LOGGER.info(
-                        "Successfully connected to %s using SNMP v%s",
-                        host,
-                        snmp_version,
-                    )
-                    break  # Success, exit the loop
-                else:
-                    _LOGGER.warning(
-                        "SNMP v%s connected to %s but returned no data, trying next version",
-                        snmp_version,
-                        host,
-                    )
-                    system_info = None
-                    device_info = None
-                    continue
-
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning(
-                    "Could not connect to %s using SNMP v%s: %s",
-                    host,
-                    snmp_version,
-                    err,
-                )
-                import traceback
+        # Only one flow probes a host at a time
+        self.context[CONF_HOST] = host
+        if any(
+            flow["context"].get(CONF_HOST) == host
+            for flow in self._async_in_progress(include_uninitialized=True)
+        ):
+            _LOGGER.debug("Discovery for %s already in progress, skipping", host)
+            return self.async_abort(reason="already_in_progress")
 
-                _LOGGER.debug("Traceback: %s", traceback.format_exc())
-                continue  # Try next version
+        # Repeated announcements are answered from the probe cache
+        try:
+            probe = _PROBE_CACHE[host]
+            _LOGGER.debug("Using cached discovery probe for %s", host)
+        except KeyError:
+            probe = await self._async_probe_host(host)
+            _PROBE_CACHE[host] = probe
 
         # If we couldn't connect with either version, abort
-        if system_info is None or device_info is None:
-            _LOGGER.warning(
-                "Could not connect to discovered device at %s with any SNMP version",
-                host,
-            )
-            SNMPPrinterConfigFlow._discovered_hosts.discard(
-                host
-            )  # Remove from set so it can be retried
+        if probe is None:
             return self.async_abort(reason="not_printer")
 
+        system_info = probe["system_info"]
+        device_info = probe["device_info"]
+        working_version = probe["snmp_version"]
+
         try:
             # Log what we got from SNMP
             _LOGGER.debug("System info from %s: %s", host, system_info)
@@ -401,11 +506,71 @@ class SNMPPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             import traceback
 
             _LOGGER.debug("Traceback: %s", traceback.format_exc())
-            SNMPPrinterConfigFlow._discovered_hosts.discard(
-                host
-            )  # Remove from set so it can be retried
+            _PROBE_CACHE.discard(host)  # Forget it so it can be retried
             return self.async_abort(reason="not_printer")
 
+    async def _async_probe_host(self, host: str) -> dict[str, Any] | None:
+        """Probe a discovered host over SNMP, None if it isn't a printer."""
+        # Try v2c first, then fall back to v1 if that fails
+        for snmp_version in ["2c", "1"]:
+            try:
+                _LOGGER.info(
+                    "Trying to connect to %s using SNMP v%s", host, snmp_version
+                )
+                client = SNMPClient(
+                    host=host,
+                    port=DEFAULT_PORT,
+                    snmp_version=snmp_version,
+                    community=DEFAULT_COMMUNITY,
+                    timeout=2.5,  # 2.5 seconds per request
+                    retries=1,  # 1 retry = total ~5 seconds max per version
+                )
+                system_info = await client.get_system_info()
+                device_info = await client.get_device_info()
+
+                # Check if we actually got useful data (not all None)
+                has_data = (
+                    system_info.get("description")
+                    or system_info.get("name")
+                    or device_info.get("serial_number")
+                    or device_info.get("mac_address")
+                )
+
+                if has_data:
+                    _LOGGER.info(
+                        "Successfully connected to %s using SNMP v%s",
+                        host,
+                        snmp_version,
+                    )
+                    return {
+                        "system_info": system_info,
+                        "device_info": device_info,
+                        "snmp_version": snmp_version,
+                    }
+
+                _LOGGER.warning(
+                    "SNMP v%s connected to %s but returned no data, trying next version",
+                    snmp_version,
+                    host,
+                )
+
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "Could not connect to %s using SNMP v%s: %s",
+                    host,
+                    snmp_version,
+                    err,
+                )
+                import traceback
+
+                _LOGGER.debug("Traceback: %s", traceback.format_exc())
+
+        _LOGGER.warning(
+            "Could not connect to discovered device at %s with any SNMP version",
+            host,
+        )
+        return None
+
     async def async_step_zeroconf_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -496,6 +661,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         ),
                     ),
                 ): int,
+                vol.Optional(
+                    CONF_TIMEOUT,
+                    default=self.config_entry.options.get(
+                        CONF_TIMEOUT,
+                        self.config_entry.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+                vol.Optional(
+                    CONF_RETRIES,
+                    default=self.config_entry.options.get(
+                        CONF_RETRIES,
+                        self.config_entry.data.get(CONF_RETRIES, DEFAULT_RETRIES),
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=10)),
+                vol.Optional(
+                    CONF_METRICS,
+                    default=self.config_entry.options.get(CONF_METRICS, False),
+                ): bool,
             }
         )
 
@@ -551,6 +734,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Test connection and save settings."""
         errors = {}
 
+        # Intervals and timeouts only go to the options, which are applied to
+        # the running entry. Only new connection settings need to be tested.
+        options = {
+            **self.config_entry.options,
+            **{key: self._data[key] for key in ENTRY_OPTIONS if key in self._data},
+        }
+        if all(
+            self._data.get(key) == self.config_entry.data.get(key)
+            for key in CONNECTION_SETTINGS
+        ):
+            return self.async_create_entry(title="", data=options)
+
         # Build full config from stored data
         snmp_version = self._data.get(CONF_SNMP_VERSION)
 
@@ -578,15 +773,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         try:
             await client.get_system_info()
 
-            # Update the config entry data (not just options)
-            # This updates the actual configuration
+            # Data and options change together, so the entry is reloaded
+            # once. Finishing the flow with the same options changes nothing.
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
-                data=self._data,
+                data={
+                    key: value
+                    for key, value in self._data.items()
+                    if key not in ENTRY_OPTIONS
+                },
+                options=options,
             )
-
-            # Also store in options for consistency
-            return self.async_create_entry(title="", data=self._data)
+            return self.async_create_entry(title="", data=options)
 
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error connecting to printer with new settings")
@@ -13,12 +13,84 @@ CONF_AUTH_PROTOCOL: Final = "auth_protocol"
 CONF_AUTH_KEY: Final = "auth_key"
 CONF_PRIV_PROTOCOL: Final = "priv_protocol"
 CONF_PRIV_KEY: Final = "priv_key"
+CONF_NETWORK: Final = "network"
+CONF_HOSTS: Final = "hosts"
+CONF_TIMEOUT: Final = "timeout"
+CONF_RETRIES: Final = "retries"
+CONF_METRICS: Final = "metrics"
+
+# Settings the SNMP client's transport is built from ("host" and "port" are
+# Home Assistant's CONF_HOST and CONF_PORT). Changing one reloads the entry,
+# other options are applied to the running entry.
+CONNECTION_SETTINGS: Final = (
+    "host",
+    "port",
+    CONF_SNMP_VERSION,
+    CONF_COMMUNITY,
+    CONF_USERNAME,
+    CONF_AUTH_PROTOCOL,
+    CONF_AUTH_KEY,
+    CONF_PRIV_PROTOCOL,
+    CONF_PRIV_KEY,
+)
+# Settings the options flow keeps in the entry's options, applied to the
+# running entry without a reload
+ENTRY_OPTIONS: Final = (CONF_UPDATE_INTERVAL, CONF_TIMEOUT, CONF_RETRIES, CONF_METRICS)
 
 # Defaults
 DEFAULT_PORT: Final = 161
 DEFAULT_COMMUNITY: Final = "public"
 DEFAULT_UPDATE_INTERVAL: Final = 60
 DEFAULT_SNMP_VERSION: Final = "2c"
+DEFAULT_TIMEOUT: Final = 1.0  # Seconds until the round trip time is known
+DEFAULT_RETRIES: Final = 3
+
+# Validation of a printer added in the config flow, a single GET. Setup
+# checks printers without cached data the same way.
+VALIDATION_TIMEOUT: Final = 1.0  # Seconds
+VALIDATION_RETRIES: Final = 1
+# hass.data key of validation results waiting for their entry's first setup
+DATA_VALIDATED: Final = f"{DOMAIN}_validated"
+
+# Subnet sweep discovery
+DEFAULT_SCAN_RATE: Final = 500  # Requests per second
+DEFAULT_SCAN_TIMEOUT: Final = 10  # Seconds for the whole sweep
+SCAN_REPLY_WAIT: Final = 2.0  # Seconds to wait for replies after the last send
+MAX_SCAN_HOSTS: Final = 4096  # Largest sweep allowed (a /20)
+
+# Zeroconf discovery probe cache
+DISCOVERY_CACHE_SIZE: Final = 256  # Hosts remembered
+DISCOVERY_CACHE_TTL: Final = 3600  # Seconds a printer probe result is reused
+DISCOVERY_NEGATIVE_CACHE_TTL: Final = 900  # Seconds a failed probe is remembered
+
+# Bounds of the retransmit timeout adapted to a printer's round trip time
+ADAPTIVE_TIMEOUT_MIN: Final = 0.3  # Seconds
+ADAPTIVE_TIMEOUT_MAX: Final = 5.0  # Seconds
+
+# Seconds the result of a printer query is reused by identical queries
+REQUEST_MEMO_TTL: Final = 2
+
+# OIDs a printer doesn't support are skipped until they are probed again
+CAPABILITY_REPROBE_INTERVAL: Final = 86400  # Seconds
+# Timeouts or empty answers of an OID in a row before it is skipped
+CAPABILITY_STRIKES: Final = 3
+
+# Seconds the display text is reused while the device status and errors
+# stay the same
+DISPLAY_TEXT_REFRESH_INTERVAL: Final = 600
+
+# Supply depletion forecasting
+SUPPLY_HISTORY_SIZE: Final = 64  # Level changes remembered per supply
+SUPPLY_REFILL_THRESHOLD: Final = 0.1  # Rise, as share of capacity, seen as refill
+
+# Services
+SERVICE_PROFILE: Final = "profile"
+DEFAULT_PROFILE_CYCLES: Final = 5  # Polls profiled per service call
+SERVICE_SET_DISPLAY_TEXT: Final = "set_display_text"
+DISPLAY_WRITE_RATE: Final = 10  # Display text SETs per second to all printers
+
+# OpenMetrics endpoint of the printers with the metrics option turned on
+METRICS_URL: Final = "/api/snmp_printer/metrics"
 
 # Error logging configuration
 DEFAULT_ERROR_LOG_INTERVAL: Final = (
@@ -33,11 +105,16 @@ OID_SYSTEM_CONTACT: Final = "1.3.6.1.2.1.1.4.0"
 OID_SYSTEM_NAME: Final = "1.3.6.1.2.1.1.5.0"
 OID_SYSTEM_LOCATION: Final = "1.3.6.1.2.1.1.6.0"
 
-# Device information
+# Device information, for the device with hrDeviceIndex 1
+OID_DEVICE_TYPE: Final = "1.3.6.1.2.1.25.3.2.1.2.1"
 OID_DEVICE_DESCRIPTION: Final = "1.3.6.1.2.1.25.3.2.1.3.1"
 OID_DEVICE_STATE: Final = "1.3.6.1.2.1.25.3.2.1.5.1"
 OID_DEVICE_ERRORS: Final = "1.3.6.1.2.1.25.3.2.1.6.1"
 
+# hrDeviceTable columns, to find every printer device of an agent
+OID_DEVICE_TYPE_COLUMN: Final = "1.3.6.1.2.1.25.3.2.1.2"
+OID_DEVICE_DESCRIPTION_COLUMN: Final = "1.3.6.1.2.1.25.3.2.1.3"
+
 # Network information
 OID_HARDWARE_ADDRESS: Final = "1.3.6.1.2.1.2.2.1.6.1"
 
@@ -73,6 +150,9 @@ OID_INPUT_TYPE: Final = "1.3.6.1.2.1.43.8.2.1.2.1"
 # Console display
 OID_DISPLAY_BUFFER: Final = "1.3.6.1.2.1.43.16.5.1.2"
 
+# hrDeviceType value identifying a printer (HOST-RESOURCES-TYPES hrDevicePrinter)
+HR_DEVICE_PRINTER: Final = "1.3.6.1.2.1.25.3.1.5"
+
 # Device status mapping
 DEVICE_STATUS = {
     1: "unknown",
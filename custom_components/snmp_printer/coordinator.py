@@ -0,0 +1,310 @@
+"""Data update coordinator for the SNMP Printer integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    CONF_RETRIES,
+    CONF_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    DEFAULT_UPDATE_INTERVAL,
+)
+from .forecast import SupplyForecaster
+from .metrics import PollStats
+from .model import (
+    SNAPSHOT_VERSION,
+    PrinterSnapshot,
+    build_snapshot,
+    from_store,
+    to_store,
+)
+from .poll import poll_printer
+from .profiler import PollProfiler, format_report
+from .snmp_client import SNMPClient
+from .throughput import PageRateTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def check_web_interface(host: str, hass: HomeAssistant) -> bool:
+    """Check if the printer has a web interface available."""
+    session = async_get_clientsession(hass)
+
+    # Try HTTP first
+    try:
+        async with asyncio.timeout(3):
+            async with session.get(f"http://{host}", allow_redirects=True) as response:
+                if (
+                    response.status < 500
+                ):  # Any response below 500 means web interface exists
+                    return True
+    except Exception:
+        pass
+
+    # Try HTTPS
+    try:
+        async with asyncio.timeout(3):
+            async with session.get(
+                f"https://{host}", allow_redirects=True, ssl=False
+            ) as response:
+                if response.status < 500:
+                    return True
+    except Exception:
+        pass
+
+    return False
+
+
+def _write_text(path: str, text: str) -> None:
+    """Write a text file, run in the executor."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+def entry_option(entry: ConfigEntry, key: str, default: Any) -> Any:
+    """Return a setting from the entry's options, else its data."""
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+class SNMPPrinterCoordinator(DataUpdateCoordinator[PrinterSnapshot]):
+    """Poll a printer and fall back to persisted data while it is offline."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: SNMPClient,
+        store: Store,
+    ) -> None:
+        """Initialize the coordinator."""
+        # Get update interval from config or options
+        update_interval = entry_option(
+            entry, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"snmp_printer_{entry.data[CONF_HOST]}",
+            update_interval=timedelta(seconds=update_interval),
+        )
+        self.entry = entry
+        self.client = client
+        self.store = store
+        self._cached_data: dict[str, Any] = {}
+        self._cached_snapshot: PrinterSnapshot | None = None
+        self.forecaster = SupplyForecaster()
+        self.page_rates = PageRateTracker()
+        self.profiler: PollProfiler | None = None
+        self.profile_report: dict[str, Any] | None = None
+        self.poll_stats = PollStats()
+        # Data is what the config flow or setup probed, not a poll yet
+        self.seeded = False
+
+    def apply_options(self) -> None:
+        """Apply settings that don't need a new connection to the printer.
+
+        The update interval takes effect when the next poll is scheduled.
+        """
+        entry = self.entry
+        self.update_interval = timedelta(
+            seconds=entry_option(entry, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        )
+        self.client.apply_settings(
+            entry_option(entry, CONF_TIMEOUT, DEFAULT_TIMEOUT),
+            entry_option(entry, CONF_RETRIES, DEFAULT_RETRIES),
+        )
+
+    async def async_load_cache(self) -> bool:
+        """Load persisted printer data.
+
+        Returns True when there was cached data, the coordinator then holds
+        it as its current (offline) data so entities can be created from it
+        before the printer has been polled.
+        """
+        self._cached_data = await self.store.async_load() or {}
+        if self._cached_data.get("client"):
+            self.client.restore_state(self._cached_data["client"])
+        if self._cached_data.get("supply_history"):
+            self.forecaster.restore(self._cached_data["supply_history"])
+        if self._cached_data.get("page_rates"):
+            self.page_rates.restore(self._cached_data["page_rates"])
+
+        if self._cached_data.get("snapshot_version") == SNAPSHOT_VERSION:
+            self._cached_snapshot = from_store(self._cached_data["snapshot"])
+        elif self._cached_data.get("data"):
+            # Cache written before the snapshot model
+            self._cached_snapshot = build_snapshot(self._cached_data["data"])
+        if self._cached_snapshot is None:
+            return False
+
+        self.data = self._cached_snapshot.offline(self._cached_data.get("timestamp"))
+        return True
+
+    async def async_seed(self, probe: dict[str, Any]) -> None:
+        """Start from what SNMPClient.probe() read, before the first poll.
+
+        The identity from the probe fills the device info, so entities can
+        be created without waiting for a poll. The serial number is read
+        from the primary printer device, the one polls read, so unique IDs
+        stay the same once the first poll is in. The device list is kept by
+        the client and not read again by that poll.
+        """
+        client = self.client
+        await client.get_printer_devices()
+        serial = probe.get("serial_number")
+        if client.primary_device != 1:
+            serial = await client.get_serial_number(client.primary_device)
+        self.data = build_snapshot(
+            {
+                "info": {
+                    "description": probe.get("description"),
+                    "name": probe.get("name"),
+                    "location": probe.get("location"),
+                },
+                "status": {"serial_number": serial},
+            }
+        )
+        self.seeded = True
+
+    def profile_polls(self, cycles: int) -> None:
+        """Profile the next polls, the report is written when they're done.
+
+        Raises ProfilerBusy while polls of any printer are being profiled.
+        """
+        self.profiler = PollProfiler(cycles)
+
+    def cancel_profile(self) -> None:
+        """Stop profiling without a report."""
+        if self.profiler is not None:
+            self.profiler.release()
+            self.profiler = None
+
+    async def _async_save_profile(self, profiler: PollProfiler) -> None:
+        """Keep the report for diagnostics and write it to the config dir."""
+        host = self.entry.data[CONF_HOST]
+        self.profile_report = report = profiler.report()
+        path = self.hass.config.path(f"snmp_printer_profile_{self.entry.entry_id}.txt")
+        text = format_report(
+            f"SNMP Printer poll profile of {host}, {datetime.now().isoformat()}",
+            report,
+        )
+        await self.hass.async_add_executor_job(_write_text, path, text)
+        _LOGGER.info("Wrote poll profile of printer %s to %s", host, path)
+
+    async def _async_update_data(self) -> PrinterSnapshot:
+        """Fetch data from SNMP printer, counted in the poll stats."""
+        stats = self.poll_stats
+        stats.polls += 1
+        started = time.monotonic()
+        try:
+            snapshot = await self._async_profiled_poll()
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            stats.last_duration = time.monotonic() - started
+        if snapshot.is_online:
+            stats.last_success = time.time()
+        else:
+            stats.failures += 1
+        return snapshot
+
+    async def _async_profiled_poll(self) -> PrinterSnapshot:
+        """Fetch data from SNMP printer, profiled when requested."""
+        profiler = self.profiler
+        if profiler is None:
+            return await self._async_poll()
+
+        try:
+            profiler.start(self.client)
+            return await self._async_poll()
+        finally:
+            profiler.stop(self.client)
+            if profiler.done:
+                self.profiler = None
+                self.hass.async_create_task(self._async_save_profile(profiler))
+
+    async def _async_poll(self) -> PrinterSnapshot:
+        """Fetch data from SNMP printer."""
+        host = self.entry.data[CONF_HOST]
+        client = self.client
+
+        try:
+            snapshot = await poll_printer(
+                client,
+                self.forecaster,
+                self.page_rates,
+                self.data,
+                lambda: check_web_interface(host, self.hass),
+            )
+
+            # Save successful data to cache with timestamp
+            self.seeded = False
+            self._cached_snapshot = snapshot
+            self._cached_data = {
+                "snapshot": to_store(snapshot),
+                "snapshot_version": SNAPSHOT_VERSION,
+                "timestamp": datetime.now().isoformat(),
+                "host": host,
+                "client": self.client.export_state(),
+                "supply_history": self.forecaster.as_dict(),
+                "page_rates": self.page_rates.as_dict(),
+            }
+            await self.store.async_save(self._cached_data)
+
+            return snapshot
+        except Exception as err:
+            # SNMPv3 state the printer rejected was dropped by the client, a
+            # restart must not restore it from the store
+            client_state = self.client.export_state()
+            if "usm" in self._cached_data.get("client", {}) and (
+                "usm" not in client_state
+            ):
+                self._cached_data["client"] = client_state
+                await self.store.async_save(self._cached_data)
+
+            # Check if this is a connection-related error
+            error_msg = str(err).lower()
+            is_connection_error = any(
+                keyword in error_msg
+                for keyword in [
+                    "timeout",
+                    "unreachable",
+                    "no route",
+                    "connection",
+                    "network",
+                    "host",
+                    "refused",
+                    "failed",
+                    "no response",
+                ]
+            )
+
+            # If we have cached data and this is a connection issue, return cached data
+            if self._cached_snapshot is not None and is_connection_error:
+                _LOGGER.warning(
+                    "Printer %s is offline (%s), using cached data from %s",
+                    host,
+                    err,
+                    self._cached_data.get("timestamp", "unknown"),
+                )
+
+                return self._cached_snapshot.offline(self._cached_data.get("timestamp"))
+
+            # For other errors or when we don't have cached data, re-raise the error
+            raise UpdateFailed(f"Error fetching printer data: {err}") from err
@@ -0,0 +1,29 @@
+"""Diagnostics support for the SNMP Printer integration."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_AUTH_KEY, CONF_COMMUNITY, CONF_PRIV_KEY, CONF_USERNAME, DOMAIN
+
+TO_REDACT = {CONF_COMMUNITY, CONF_USERNAME, CONF_AUTH_KEY, CONF_PRIV_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "data": coordinator.data and dataclasses.asdict(coordinator.data),
+        "poll_profile": coordinator.profile_report,
+    }
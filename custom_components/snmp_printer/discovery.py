@@ -0,0 +1,264 @@
+"""Active SNMP discovery of printers on a subnet."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import random
+import socket
+import time
+from collections import OrderedDict
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+from .const import (
+    DEFAULT_COMMUNITY,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_RATE,
+    DEFAULT_SCAN_TIMEOUT,
+    DISCOVERY_CACHE_SIZE,
+    DISCOVERY_CACHE_TTL,
+    DISCOVERY_NEGATIVE_CACHE_TTL,
+    HR_DEVICE_PRINTER,
+    MAX_SCAN_HOSTS,
+    OID_DEVICE_TYPE,
+    OID_SYSTEM_DESCRIPTION,
+    SCAN_REPLY_WAIT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_PROTOCOL: SimpleNamespace | None = None
+
+
+def _load_protocol() -> SimpleNamespace:
+    """Import the pysnmp message API and BER codec (blocking, slow)."""
+    global _PROTOCOL  # pylint: disable=global-statement
+    if _PROTOCOL is None:
+        from pyasn1.codec.ber import decoder, encoder
+        from pysnmp.proto import api
+
+        _PROTOCOL = SimpleNamespace(api=api, decoder=decoder, encoder=encoder)
+    return _PROTOCOL
+
+
+class ProbeCache:
+    """Bounded LRU cache of discovery probe results with expiry.
+
+    A result of None records a host that did not answer as a printer, it
+    expires sooner than a positive result so the host is probed again.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DISCOVERY_CACHE_SIZE,
+        ttl: float = DISCOVERY_CACHE_TTL,
+        negative_ttl: float = DISCOVERY_NEGATIVE_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any] | None]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached hosts, expired ones included."""
+        return len(self._entries)
+
+    def __getitem__(self, host: str) -> dict[str, Any] | None:
+        """Return the cached result for a host, KeyError if missing or expired."""
+        expires, result = self._entries[host]
+        if expires <= time.monotonic():
+            del self._entries[host]
+            raise KeyError(host)
+        self._entries.move_to_end(host)
+        return result
+
+    def __setitem__(self, host: str, result: dict[str, Any] | None) -> None:
+        """Remember the probe result for a host."""
+        ttl = self._ttl if result is not None else self._negative_ttl
+        self._entries[host] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(host)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, host: str) -> None:
+        """Forget a host."""
+        self._entries.pop(host, None)
+
+
+class NetworkTooLarge(ValueError):
+    """Raised when a sweep would cover more hosts than allowed."""
+
+
+def parse_network(network: str) -> list[str]:
+    """Return the host addresses of an IPv4 CIDR range.
+
+    Raises ValueError for invalid ranges and NetworkTooLarge when the
+    range holds more than MAX_SCAN_HOSTS addresses.
+    """
+    net = ipaddress.IPv4Network(network.strip(), strict=False)
+    if net.num_addresses > MAX_SCAN_HOSTS + 2:
+        raise NetworkTooLarge(f"{net} has {net.num_addresses} addresses")
+    if net.prefixlen >= 31:
+        return [str(address) for address in net]
+    return [str(address) for address in net.hosts()]
+
+
+class _SweepProtocol(asyncio.DatagramProtocol):
+    """Collect SNMP responses for a sweep on one shared socket."""
+
+    def __init__(
+        self, proto: SimpleNamespace, pending: dict[int, str], port: int
+    ) -> None:
+        """Initialize the protocol."""
+        self._proto = proto
+        self._pending = pending
+        self._port = port
+        self.results: dict[str, dict[str, Any]] = {}
+        self.done = asyncio.Event()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Match a response to its request and record the answer."""
+        api = self._proto.api
+        try:
+            version = int(api.decodeMessageVersion(data))
+            p_mod = api.PROTOCOL_MODULES[version]
+            message, _ = self._proto.decoder.decode(data, asn1Spec=p_mod.Message())
+            pdu = p_mod.apiMessage.get_pdu(message)
+            request_id = int(p_mod.apiPDU.get_request_id(pdu))
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Ignoring undecodable datagram from %s", addr[0])
+            return
+
+        host = self._pending.get(request_id)
+        if host is None or host != addr[0] or addr[1] != self._port:
+            return
+        del self._pending[request_id]
+
+        if p_mod.apiPDU.get_error_status(pdu):
+            # SNMPv1 agents answer with noSuchName when one OID is missing
+            values = {}
+        else:
+            values = {str(oid): value for oid, value in p_mod.apiPDU.get_varbinds(pdu)}
+
+        self.results[host] = {
+            "description": _as_text(api, values.get(OID_SYSTEM_DESCRIPTION)),
+            "device_type": _as_text(api, values.get(OID_DEVICE_TYPE)),
+        }
+
+        if not self._pending:
+            self.done.set()
+
+    def error_received(self, exc: Exception) -> None:
+        """Ignore ICMP errors for single hosts."""
+        _LOGGER.debug("Sweep socket error: %s", exc)
+
+
+def _as_text(api: ModuleType, value: Any) -> str | None:
+    """Return a printable value, or None for exceptions like noSuchObject."""
+    if value is None or value.tagSet in (
+        api.v2c.NoSuchObject.tagSet,
+        api.v2c.NoSuchInstance.tagSet,
+        api.v2c.EndOfMibView.tagSet,
+    ):
+        return None
+    return value.prettyPrint()
+
+
+def _encode_request(
+    proto: SimpleNamespace,
+    p_mod: ModuleType,
+    community: str,
+    request_id: int,
+    oids: tuple[str, ...],
+) -> bytes:
+    """Encode a GET request for the given OIDs."""
+    pdu = p_mod.GetRequestPDU()
+    p_mod.apiPDU.set_defaults(pdu)
+    p_mod.apiPDU.set_request_id(pdu, request_id)
+    p_mod.apiPDU.set_varbinds(pdu, [(oid, p_mod.null) for oid in oids])
+
+    message = p_mod.Message()
+    p_mod.apiMessage.set_defaults(message)
+    p_mod.apiMessage.set_community(message, community)
+    p_mod.apiMessage.set_pdu(message, pdu)
+    return proto.encoder.encode(message)
+
+
+async def async_sweep_network(
+    network: str,
+    community: str = DEFAULT_COMMUNITY,
+    snmp_version: str = "2c",
+    port: int = DEFAULT_PORT,
+    rate: int = DEFAULT_SCAN_RATE,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
+) -> list[dict[str, Any]]:
+    """Sweep a CIDR range and return the printers that answered.
+
+    One GET for sysDescr and hrDeviceType is sent to every address over a
+    single UDP socket, paced to `rate` requests per second. The whole sweep
+    is bounded by `timeout` seconds.
+    """
+    hosts = parse_network(network)
+    loop = asyncio.get_running_loop()
+    proto = await loop.run_in_executor(None, _load_protocol)
+    api = proto.api
+    p_mod = api.PROTOCOL_MODULES[
+        api.SNMP_VERSION_1 if snmp_version == "1" else api.SNMP_VERSION_2C
+    ]
+    oids = (OID_SYSTEM_DESCRIPTION, OID_DEVICE_TYPE)
+
+    pending: dict[int, str] = {}
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: _SweepProtocol(proto, pending, port),
+        family=socket.AF_INET,
+    )
+
+    started = time.monotonic()
+    interval = 1 / rate if rate > 0 else 0
+    request_id = random.randint(1, 1 << 30)
+    try:
+        async with asyncio.timeout(timeout):
+            for count, host in enumerate(hosts):
+                request_id += 1
+                pending[request_id] = host
+                transport.sendto(
+                    _encode_request(proto, p_mod, community, request_id, oids),
+                    (host, port),
+                )
+                # Sleep in small batches so pacing doesn't cost one
+                # event loop wakeup per packet
+                if interval and count % 16 == 15:
+                    await asyncio.sleep(
+                        max(0, started + (count + 1) * interval - time.monotonic())
+                    )
+
+            if pending:
+                protocol.done.clear()
+                async with asyncio.timeout(SCAN_REPLY_WAIT):
+                    await protocol.done.wait()
+    except TimeoutError:
+        pass
+    finally:
+        transport.close()
+
+    _LOGGER.debug(
+        "Swept %d addresses in %s in %.1fs, %d answered",
+        len(hosts),
+        network,
+        time.monotonic() - started,
+        len(protocol.results),
+    )
+
+    return [
+        {"host": host, **result}
+        for host, result in sorted(
+            protocol.results.items(),
+            key=lambda item: ipaddress.IPv4Address(item[0]),
+        )
+        if result["device_type"] == HR_DEVICE_PRINTER
+    ]
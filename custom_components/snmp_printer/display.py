@@ -0,0 +1,90 @@
+"""Rate-limited, collapsing writes of printer display texts."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from .snmp_client import SNMPClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Write:
+    """A display text waiting to be sent to a printer device."""
+
+    text: str
+    done: asyncio.Future[bool]
+
+
+class DisplayWriter:
+    """Write display texts to many printers under a shared rate limit.
+
+    Writes to different printers run concurrently, their starts spaced so
+    no more than `rate` SETs per second are sent in total. Writes to the
+    same printer device are collapsed: while one waits for its turn a newer
+    text replaces it, and every caller gets the result of writing the
+    newest text. A write queued while one is sent waits for it.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the writer for `rate` writes per second."""
+        self._interval = 1 / rate
+        self._next_start = 0.0
+        self._queued: dict[tuple[SNMPClient, int], _Write] = {}
+        self._sending: dict[tuple[SNMPClient, int], asyncio.Task] = {}
+
+    async def write(self, client: SNMPClient, device: int, text: str) -> bool:
+        """Write a text to a printer device, return True when it was set."""
+        key = (client, device)
+        queued = self._queued.get(key)
+        if queued is not None:
+            queued.text = text
+            return await asyncio.shield(queued.done)
+
+        write = _Write(text, asyncio.get_running_loop().create_future())
+        self._queued[key] = write
+        task = asyncio.create_task(self._send(key, write, self._sending.get(key)))
+        self._sending[key] = task
+        task.add_done_callback(lambda _: self._sent(key, task))
+        return await asyncio.shield(write.done)
+
+    def _sent(self, key: tuple[SNMPClient, int], task: asyncio.Task) -> None:
+        """Forget a finished send, unless a newer one is already queued."""
+        if self._sending.get(key) is task:
+            del self._sending[key]
+
+    async def _send(
+        self,
+        key: tuple[SNMPClient, int],
+        write: _Write,
+        previous: asyncio.Task | None,
+    ) -> None:
+        """Send a queued write once the printer and the rate limit allow."""
+        client, device = key
+        try:
+            if previous is not None:
+                await asyncio.wait((previous,))
+            await self._wait_turn()
+            # Texts arriving from here on are queued as the next write
+            del self._queued[key]
+            write.done.set_result(await client.set_display_text(write.text, device))
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Display text write to %s failed: %s", client.host, err)
+        finally:
+            # Failed or cancelled, on unload or a service timeout, the
+            # callers waiting for the write must not wait forever
+            if self._queued.get(key) is write:
+                del self._queued[key]
+            if not write.done.done():
+                write.done.set_result(False)
+
+    async def _wait_turn(self) -> None:
+        """Wait for the next start allowed by the rate limit."""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
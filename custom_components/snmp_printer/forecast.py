@@ -0,0 +1,172 @@
+"""Supply depletion forecasting from a bounded level history."""
+
+from __future__ import annotations
+
+import base64
+import math
+from array import array
+from typing import Any
+
+from .const import SUPPLY_HISTORY_SIZE, SUPPLY_REFILL_THRESHOLD
+
+# Fields of one sample in the interleaved history array
+_TIME, _LEVEL, _PAGES = range(3)
+_FIELDS = 3
+
+
+class SupplyHistory:
+    """Ring buffer of the level changes of one supply.
+
+    Samples of (timestamp, level, total pages) are stored interleaved in a
+    single preallocated array. A sample is only added when the level drops,
+    so the buffer spans many level steps however often the printer is
+    polled. A rise larger than SUPPLY_REFILL_THRESHOLD of the capacity is a
+    refill and starts a new history.
+    """
+
+    __slots__ = ("max_capacity", "_samples", "_size", "_start", "_count")
+
+    def __init__(self, max_capacity: int, size: int = SUPPLY_HISTORY_SIZE) -> None:
+        """Initialize an empty history."""
+        self.max_capacity = max_capacity
+        self._samples = array("d", bytes(8 * _FIELDS * size))
+        self._size = size
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._count
+
+    def _offset(self, position: int) -> int:
+        """Return the array offset of the sample at a chronological position."""
+        return ((self._start + position) % self._size) * _FIELDS
+
+    def add(self, timestamp: float, level: int, pages: int | None) -> None:
+        """Record a level reading."""
+        if self._count:
+            last = self._offset(self._count - 1)
+            last_level = self._samples[last + _LEVEL]
+            if level >= last_level:
+                if level - last_level > SUPPLY_REFILL_THRESHOLD * self.max_capacity:
+                    self.clear()
+                else:
+                    # Unchanged, or jitter that would skew the rate
+                    return
+
+        if self._count == self._size:
+            self._start = (self._start + 1) % self._size
+            self._count -= 1
+
+        offset = self._offset(self._count)
+        self._samples[offset + _TIME] = timestamp
+        self._samples[offset + _LEVEL] = level
+        self._samples[offset + _PAGES] = math.nan if pages is None else pages
+        self._count += 1
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self._start = 0
+        self._count = 0
+
+    def forecast(
+        self, timestamp: float, level: int, pages: int | None
+    ) -> tuple[float | None, int | None]:
+        """Return the estimated days and pages until the supply is empty.
+
+        The depletion rate is taken between the oldest sample and the
+        current reading, so it only looks at two samples and falls while
+        nothing is printed. Either value is None while there is no usage
+        to extrapolate from.
+        """
+        if not self._count:
+            return None, None
+
+        oldest = self._offset(0)
+        used = self._samples[oldest + _LEVEL] - level
+        if used <= 0:
+            return None, None
+
+        days = None
+        elapsed = timestamp - self._samples[oldest + _TIME]
+        if elapsed > 0:
+            days = round(level / used * elapsed / 86400, 1)
+
+        pages_left = None
+        if pages is not None:
+            # NaN if the oldest count is unknown, negative after a reset
+            printed = pages - self._samples[oldest + _PAGES]
+            if printed > 0:
+                pages_left = int(level / used * printed)
+
+        return days, pages_left
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the history in a JSON serializable form."""
+        samples = array("d")
+        for position in range(self._count):
+            offset = self._offset(position)
+            samples.extend(self._samples[offset : offset + _FIELDS])
+        return {
+            "max_capacity": self.max_capacity,
+            "samples": base64.b64encode(samples.tobytes()).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SupplyHistory:
+        """Restore a history saved with as_dict()."""
+        history = cls(data["max_capacity"])
+        samples = array("d")
+        samples.frombytes(base64.b64decode(data["samples"]))
+        # Keep the newest samples if the history size was reduced
+        samples = samples[-history._size * _FIELDS :]
+        history._samples[: len(samples)] = samples
+        history._count = len(samples) // _FIELDS
+        return history
+
+
+class SupplyForecaster:
+    """Keep level histories of a printer's supplies and forecast depletion."""
+
+    def __init__(self) -> None:
+        """Initialize the forecaster."""
+        self._histories: dict[str, SupplyHistory] = {}
+
+    def update(
+        self, supplies: list[dict[str, Any]], pages: int | None, timestamp: float
+    ) -> None:
+        """Record the current levels and add forecasts to the supply dicts.
+
+        Each supply gets `days_remaining` and `pages_remaining`, None when
+        they can't be estimated.
+        """
+        histories = {}
+        for supply in supplies:
+            index = supply["index"]
+            level = supply.get("level", -2)
+            max_capacity = supply.get("max_capacity", -2)
+            days = pages_left = None
+
+            # Only supplies reporting an actual level can be forecast
+            if level >= 0 and max_capacity > 0:
+                history = self._histories.get(index)
+                if history is None or history.max_capacity != max_capacity:
+                    history = SupplyHistory(max_capacity)
+                history.add(timestamp, level, pages)
+                days, pages_left = history.forecast(timestamp, level, pages)
+                histories[index] = history
+
+            supply["days_remaining"] = days
+            supply["pages_remaining"] = pages_left
+
+        self._histories = histories
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all histories in a JSON serializable form."""
+        return {index: history.as_dict() for index, history in self._histories.items()}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore histories saved with as_dict()."""
+        self._histories = {
+            index: SupplyHistory.from_dict(history) for index, history in data.items()
+        }
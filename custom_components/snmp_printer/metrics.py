@@ -0,0 +1,245 @@
+"""Printer metrics in the OpenMetrics text format.
+
+The exporter keeps the rendered samples of every printer and updates those
+of one printer when its coordinator refreshes. Snapshot parts that didn't
+change are the same objects as in the previous snapshot (see model.py), so
+the samples of unchanged devices are reused as they are. A scrape joins the
+rendered samples once after a change and serves the same bytes until the
+next one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .const import DEVICE_STATUS
+from .model import DeviceSnapshot, PrinterSnapshot
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# States of the device state stateset
+DEVICE_STATES = tuple(DEVICE_STATUS.values())
+
+# Page counters of PageCounts, in the `kind` label of the page counter
+PAGE_KINDS = ("total", "color", "black_and_white", "duplex")
+
+# Metric families as (name, type, unit, help), in the order they are served
+FAMILIES = (
+    ("snmp_printer", "info", "", "Printer identity"),
+    ("snmp_printer_up", "gauge", "", "Whether the last poll reached the printer"),
+    ("snmp_printer_device_state", "stateset", "", "State of a printer device"),
+    ("snmp_printer_pages", "counter", "", "Pages printed by a printer device"),
+    (
+        "snmp_printer_supply_level_percent",
+        "gauge",
+        "percent",
+        "Level of a marker supply",
+    ),
+    (
+        "snmp_printer_tray_level_percent",
+        "gauge",
+        "percent",
+        "Paper level of an input tray",
+    ),
+    ("snmp_printer_polls", "counter", "", "Polls of the printer"),
+    (
+        "snmp_printer_poll_failures",
+        "counter",
+        "",
+        "Polls the printer didn't answer",
+    ),
+    (
+        "snmp_printer_poll_duration_seconds",
+        "gauge",
+        "seconds",
+        "Duration of the last poll",
+    ),
+    (
+        "snmp_printer_round_trip_seconds",
+        "gauge",
+        "seconds",
+        "Smoothed round trip time of SNMP requests",
+    ),
+    (
+        "snmp_printer_last_success_timestamp_seconds",
+        "gauge",
+        "seconds",
+        "Time of the last poll the printer answered",
+    ),
+)
+_DEVICE_FAMILIES = (
+    "snmp_printer_device_state",
+    "snmp_printer_pages",
+    "snmp_printer_supply_level_percent",
+    "snmp_printer_tray_level_percent",
+)
+
+
+@dataclass(slots=True)
+class PollStats:
+    """Counters of a coordinator's polls."""
+
+    polls: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+    last_success: float | None = None
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(*pairs: tuple[str, str]) -> str:
+    """Render label pairs, without the braces."""
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+
+
+def _render_device(base: str, index: str, device: DeviceSnapshot) -> dict[str, str]:
+    """Render the samples of one printer device by family."""
+    labels = f'{base},device="{index}"'
+    states = "".join(
+        f'snmp_printer_device_state{{{labels},snmp_printer_device_state="{state}"}}'
+        f" {int(state == device.state)}\n"
+        for state in DEVICE_STATES
+    )
+    pages = "".join(
+        f'snmp_printer_pages_total{{{labels},kind="{kind}"}} {count}\n'
+        for kind in PAGE_KINDS
+        if (count := getattr(device.page_count, kind)) is not None
+    )
+    supplies = "".join(
+        f"snmp_printer_supply_level_percent{{{labels},"
+        + _labels(
+            ("index", supply.index),
+            ("supply", supply.description),
+            ("color", supply.color),
+        )
+        + f"}} {supply.percentage}\n"
+        for supply in device.supplies
+        if supply.percentage is not None
+    )
+    trays = "".join(
+        f"snmp_printer_tray_level_percent{{{labels},"
+        f"{_labels(('index', tray.index), ('tray', tray.description))}}}"
+        f" {tray.percentage}\n"
+        for tray in device.input_trays
+        if tray.percentage is not None
+    )
+    return {
+        "snmp_printer_device_state": states,
+        "snmp_printer_pages": pages,
+        "snmp_printer_supply_level_percent": supplies,
+        "snmp_printer_tray_level_percent": trays,
+    }
+
+
+class _Printer:
+    """The rendered samples of one printer."""
+
+    __slots__ = ("base", "devices", "samples")
+
+    def __init__(self, base: str) -> None:
+        """Initialize with the labels of all samples of the printer."""
+        self.base = base
+        # Rendered samples by hrDeviceIndex, with the device they are of
+        self.devices: dict[str, tuple[DeviceSnapshot, dict[str, str]]] = {}
+        self.samples: dict[str, str] = {}
+
+
+class MetricsExporter:
+    """Render the metrics of many printers, updated one printer at a time."""
+
+    def __init__(self) -> None:
+        """Initialize the exporter without printers."""
+        self._printers: dict[str, _Printer] = {}
+        self._buffer: bytes | None = None
+
+    def update(
+        self,
+        key: str,
+        host: str,
+        name: str,
+        primary_device: int,
+        snapshot: PrinterSnapshot | None,
+        online: bool,
+        stats: PollStats,
+        round_trip: float | None,
+    ) -> None:
+        """Render the samples of a printer after a refresh."""
+        base = _labels(("host", host), ("printer", name))
+        printer = self._printers.get(key)
+        if printer is None or printer.base != base:
+            printer = self._printers[key] = _Printer(base)
+
+        samples = {
+            "snmp_printer_up": f"snmp_printer_up{{{base}}} {int(online)}\n",
+            "snmp_printer_polls": f"snmp_printer_polls_total{{{base}}} {stats.polls}\n",
+            "snmp_printer_poll_failures": (
+                f"snmp_printer_poll_failures_total{{{base}}} {stats.failures}\n"
+            ),
+        }
+        if stats.last_duration is not None:
+            samples["snmp_printer_poll_duration_seconds"] = (
+                f"snmp_printer_poll_duration_seconds{{{base}}} "
+                f"{stats.last_duration:.6f}\n"
+            )
+        if round_trip is not None:
+            samples["snmp_printer_round_trip_seconds"] = (
+                f"snmp_printer_round_trip_seconds{{{base}}} {round_trip:.6f}\n"
+            )
+        if stats.last_success is not None:
+            samples["snmp_printer_last_success_timestamp_seconds"] = (
+                f"snmp_printer_last_success_timestamp_seconds{{{base}}} "
+                f"{stats.last_success:.3f}\n"
+            )
+
+        if snapshot is not None:
+            info = snapshot.info
+            serial = snapshot.device.serial_number or ""
+            samples["snmp_printer"] = (
+                f"snmp_printer_info{{{base},"
+                f"{_labels(('model', info.description or ''), ('serial', serial))}}}"
+                " 1\n"
+            )
+            devices = {str(primary_device): snapshot.device, **snapshot.devices}
+            rendered = {}
+            for index, device in devices.items():
+                known = printer.devices.get(index)
+                if known is not None and known[0] is device:
+                    rendered[index] = known
+                else:
+                    rendered[index] = (device, _render_device(base, index, device))
+            printer.devices = rendered
+            for family in _DEVICE_FAMILIES:
+                samples[family] = "".join(
+                    device_samples[family] for _, device_samples in rendered.values()
+                )
+
+        printer.samples = samples
+        self._buffer = None
+
+    def remove(self, key: str) -> None:
+        """Drop the samples of a printer."""
+        if self._printers.pop(key, None) is not None:
+            self._buffer = None
+
+    def __len__(self) -> int:
+        """Return the number of printers."""
+        return len(self._printers)
+
+    def render(self) -> bytes:
+        """Return the metrics of all printers."""
+        if self._buffer is None:
+            lines = []
+            for name, kind, unit, description in FAMILIES:
+                lines.append(f"# TYPE {name} {kind}\n")
+                if unit:
+                    lines.append(f"# UNIT {name} {unit}\n")
+                lines.append(f"# HELP {name} {description}.\n")
+                lines.extend(
+                    printer.samples.get(name, "") for printer in self._printers.values()
+                )
+            lines.append("# EOF\n")
+            self._buffer = "".join(lines).encode()
+        return self._buffer
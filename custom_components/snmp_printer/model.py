@@ -0,0 +1,356 @@
+"""Typed snapshot of the data polled from a printer.
+
+The coordinator publishes a PrinterSnapshot per poll. Its parts are frozen
+slotted dataclasses: they hold no per-instance dict, and a part that equals
+the one of the previous snapshot is reused instead of kept twice, so a
+printer whose supplies and trays didn't change retains no new objects for
+them. Snapshots are stored as nested lists in field order, see to_store().
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+
+# Bumped when fields change, stored snapshots of another version are dropped
+SNAPSHOT_VERSION = 1
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
+class PageCounts:
+    """Page counters of a printer, or pages printed within a window."""
+
+    total: int | None = None
+    color: int | None = None
+    black_and_white: int | None = None
+    duplex: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PageRates:
+    """Pages printed in the last hour and the last day."""
+
+    pages_per_hour: PageCounts = PageCounts()
+    pages_per_day: PageCounts = PageCounts()
+
+
+@dataclass(slots=True, frozen=True)
+class Supply:
+    """A row of the marker supplies table."""
+
+    index: str
+    description: str = ""
+    color: str = "Unknown"
+    type: str = "unknown"
+    supply_class: str = "unknown"
+    max_capacity: int = -2
+    level: int = -2
+    percentage: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SupplyForecast:
+    """Estimated days and pages until a supply is empty."""
+
+    days_remaining: float | None = None
+    pages_remaining: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Tray:
+    """A row of the input tray table."""
+
+    index: str
+    description: str = ""
+    max_capacity: int = -2
+    level: int = -2
+    percentage: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceSnapshot:
+    """The state of one printer device of an agent."""
+
+    state: str = "unknown"
+    serial_number: str | None = None
+    page_count: PageCounts = PageCounts()
+    supplies: tuple[Supply, ...] = ()
+    input_trays: tuple[Tray, ...] = ()
+    display_text: str | None = None
+    errors: str | None = None
+    # hrDeviceDescr, only set for the agent's additional printer devices
+    description: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SystemInfo:
+    """The system group and agent-wide values of a printer."""
+
+    description: str | None = None
+    name: str | None = None
+    contact: str | None = None
+    location: str | None = None
+    uptime: str | None = None
+    mac_address: str | None = None
+    memory_size: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PrinterSnapshot:
+    """Everything polled from a printer in one update."""
+
+    info: SystemInfo = SystemInfo()
+    # The agent's first printer device, others are in `devices`
+    device: DeviceSnapshot = DeviceSnapshot()
+    cover_status: str = "unknown"
+    web_interface_available: bool = False
+    page_rates: PageRates = PageRates()
+    # Forecasts of the first device's supplies by supply index
+    forecasts: Mapping[str, SupplyForecast] = field(default_factory=dict)
+    # Additional printer devices by hrDeviceIndex
+    devices: Mapping[str, DeviceSnapshot] = field(default_factory=dict)
+    is_online: bool = True
+    offline_since: str | None = None
+
+    def offline(self, since: str | None) -> PrinterSnapshot:
+        """Return this snapshot marked as cached data of an offline printer."""
+        return dataclasses.replace(self, is_online=False, offline_since=since)
+
+
+def _shared(previous: _T | None, value: _T) -> _T:
+    """Return the previous object instead of an equal new one."""
+    return previous if previous is not None and previous == value else value
+
+
+def _shared_rows(
+    previous: tuple[_T, ...], rows: tuple[_T, ...], key: Callable[[_T], str]
+) -> tuple[_T, ...]:
+    """Reuse unchanged rows, and the whole tuple when no row changed."""
+    known = {key(row): row for row in previous}
+    rows = tuple(_shared(known.get(key(row)), row) for row in rows)
+    return _shared(previous, rows)
+
+
+def _page_counts(data: Mapping[str, Any]) -> PageCounts:
+    """Build page counters from a counter dict."""
+    return PageCounts(
+        total=data.get("total"),
+        color=data.get("color"),
+        black_and_white=data.get("black_and_white"),
+        duplex=data.get("duplex"),
+    )
+
+
+def _supply(data: Mapping[str, Any]) -> Supply:
+    """Build a supply from a dict of SNMPClient.get_supplies()."""
+    return Supply(
+        index=data["index"],
+        description=data.get("description", ""),
+        color=data.get("color", "Unknown"),
+        type=data.get("type", "unknown"),
+        supply_class=data.get("class", "unknown"),
+        max_capacity=data.get("max_capacity", -2),
+        level=data.get("level", -2),
+        percentage=data.get("percentage"),
+    )
+
+
+def _tray(data: Mapping[str, Any]) -> Tray:
+    """Build a tray from a dict of SNMPClient.get_input_trays()."""
+    return Tray(
+        index=data["index"],
+        description=data.get("description", ""),
+        max_capacity=data.get("max_capacity", -2),
+        level=data.get("level", -2),
+        percentage=data.get("percentage"),
+    )
+
+
+def build_device(
+    data: Mapping[str, Any], previous: DeviceSnapshot | None = None
+) -> DeviceSnapshot:
+    """Build a device snapshot from the dicts the client returns.
+
+    `data` holds status (get_device_info()), page_count, supplies,
+    input_trays, display_text, errors and an optional description. Parts
+    equal to those of `previous` are reused.
+    """
+    previous = previous or DeviceSnapshot()
+    status = data.get("status") or {}
+    device = DeviceSnapshot(
+        state=status.get("state", "unknown"),
+        serial_number=status.get("serial_number"),
+        page_count=_shared(
+            previous.page_count, _page_counts(data.get("page_count") or {})
+        ),
+        supplies=_shared_rows(
+            previous.supplies,
+            tuple(_supply(supply) for supply in data.get("supplies") or ()),
+            lambda supply: supply.index,
+        ),
+        input_trays=_shared_rows(
+            previous.input_trays,
+            tuple(_tray(tray) for tray in data.get("input_trays") or ()),
+            lambda tray: tray.index,
+        ),
+        display_text=data.get("display_text"),
+        errors=data.get("errors"),
+        description=data.get("description"),
+    )
+    return _shared(previous, device)
+
+
+def build_snapshot(
+    data: Mapping[str, Any], previous: PrinterSnapshot | None = None
+) -> PrinterSnapshot:
+    """Build a printer snapshot from the dicts of one poll.
+
+    `data` has the layout the coordinator used to publish: info, cover
+    status, web interface flag, page rates and the first device's values at
+    the top level, other devices under "devices". Supplies may carry the
+    forecaster's days_remaining and pages_remaining.
+    """
+    previous = previous or PrinterSnapshot()
+    info = data.get("info") or {}
+    rates = data.get("page_rates") or {}
+    forecasts = {
+        supply["index"]: SupplyForecast(
+            supply.get("days_remaining"), supply.get("pages_remaining")
+        )
+        for supply in data.get("supplies") or ()
+        if "days_remaining" in supply
+    }
+    return PrinterSnapshot(
+        info=_shared(
+            previous.info,
+            SystemInfo(
+                description=info.get("description"),
+                name=info.get("name"),
+                contact=info.get("contact"),
+                location=info.get("location"),
+                uptime=info.get("uptime"),
+                mac_address=info.get("mac_address"),
+                memory_size=info.get("memory_size"),
+            ),
+        ),
+        device=build_device(data, previous.device),
+        cover_status=(data.get("cover_status") or {}).get("state", "unknown"),
+        web_interface_available=bool(data.get("web_interface_available")),
+        page_rates=_shared(
+            previous.page_rates,
+            PageRates(
+                pages_per_hour=_page_counts(rates.get("pages_per_hour") or {}),
+                pages_per_day=_page_counts(rates.get("pages_per_day") or {}),
+            ),
+        ),
+        forecasts=_shared(previous.forecasts, forecasts),
+        devices=_shared(
+            previous.devices,
+            {
+                index: build_device(device, previous.devices.get(index))
+                for index, device in (data.get("devices") or {}).items()
+            },
+        ),
+        is_online=data.get("is_online", True),
+        offline_since=data.get("offline_since"),
+    )
+
+
+def _encoder(hint: Any) -> Callable[[Any], Any] | None:
+    """Return the function converting a value of a field type, None if plain."""
+    if dataclasses.is_dataclass(hint):
+        return lambda value: _encode(hint, value)
+    origin = get_origin(hint)
+    if origin is tuple:
+        item = _encoder(get_args(hint)[0])
+        if item is not None:
+            return lambda value: [item(entry) for entry in value]
+    if origin is Mapping:
+        item = _encoder(get_args(hint)[1])
+        if item is not None:
+            return lambda value: {key: item(entry) for key, entry in value.items()}
+    return None
+
+
+def _encode(cls: type, value: Any) -> Any:
+    """Convert a snapshot part to a list of its fields.
+
+    Parts with only plain fields are read with a single attrgetter call,
+    JSON encodes the resulting tuple as a list.
+    """
+    values = _GETTERS[cls](value)
+    encoders = _ENCODERS[cls]
+    if encoders is None:
+        return values
+    return [
+        entry if encode is None else encode(entry)
+        for encode, entry in zip(encoders, values)
+    ]
+
+
+def _decoder(hint: Any) -> Callable[[Any], Any] | None:
+    """Return the function restoring a value of a field type, None if plain."""
+    if dataclasses.is_dataclass(hint):
+        return lambda value: _decode(hint, value)
+    origin = get_origin(hint)
+    if origin is tuple:
+        item = _decoder(get_args(hint)[0])
+        if item is None:
+            return tuple
+        return lambda value: tuple(item(entry) for entry in value)
+    if origin is Mapping:
+        item = _decoder(get_args(hint)[1])
+        if item is not None:
+            return lambda value: {key: item(entry) for key, entry in value.items()}
+    return None
+
+
+def _decode(cls: type[_T], values: list[Any]) -> _T:
+    """Restore a snapshot part from its field list."""
+    return cls(
+        *(
+            value if decode is None else decode(value)
+            for decode, value in zip(_DECODERS[cls], values, strict=True)
+        )
+    )
+
+
+_MODELS = (
+    PageCounts,
+    PageRates,
+    Supply,
+    SupplyForecast,
+    Tray,
+    DeviceSnapshot,
+    SystemInfo,
+    PrinterSnapshot,
+)
+_GETTERS: dict[type, Callable[[Any], tuple[Any, ...]]] = {}
+_ENCODERS: dict[type, tuple[Callable[[Any], Any] | None, ...] | None] = {}
+_DECODERS: dict[type, tuple[Callable[[Any], Any] | None, ...]] = {}
+for _cls in _MODELS:
+    _hints = get_type_hints(_cls)
+    _names = tuple(item.name for item in dataclasses.fields(_cls))
+    _GETTERS[_cls] = operator.attrgetter(*_names)
+    _encoders = tuple(_encoder(_hints[name]) for name in _names)
+    _ENCODERS[_cls] = _encoders if any(_encoders) else None
+    _DECODERS[_cls] = tuple(_decoder(_hints[name]) for name in _names)
+
+
+def to_store(snapshot: PrinterSnapshot) -> list[Any]:
+    """Return a snapshot as compact JSON serializable lists.
+
+    Fields are stored by position instead of by name, which keeps the
+    store small and fast to write. The layout is tied to SNAPSHOT_VERSION.
+    """
+    return _encode(PrinterSnapshot, snapshot)
+
+
+def from_store(data: list[Any]) -> PrinterSnapshot:
+    """Restore a snapshot saved with to_store()."""
+    return _decode(PrinterSnapshot, data)
@@ -0,0 +1,79 @@
+"""One poll of a printer, without Home Assistant.
+
+The coordinator polls through poll_printer(), and so does the load test in
+benchmarks/, so it measures the queries and snapshot building that run in
+Home Assistant.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .forecast import SupplyForecaster
+from .model import PrinterSnapshot, build_snapshot
+from .snmp_client import SNMPClient
+from .throughput import PageRateTracker
+
+
+async def fetch_device(client: SNMPClient, device: int) -> dict[str, Any]:
+    """Fetch the data of one printer device of the agent."""
+    device_info = await client.get_device_info(device)
+    return {
+        "status": device_info,
+        "page_count": device_info.get(
+            "page_counts", {"total": device_info.get("page_count")}
+        ),
+        "supplies": await client.get_supplies(device),
+        "input_trays": await client.get_input_trays(device),
+        "display_text": await client.get_display_text(device),
+        "errors": await client.get_printer_errors(device),
+    }
+
+
+async def poll_printer(
+    client: SNMPClient,
+    forecaster: SupplyForecaster,
+    page_rates: PageRateTracker,
+    previous: PrinterSnapshot | None = None,
+    check_web_interface: Callable[[], Awaitable[bool]] | None = None,
+) -> PrinterSnapshot:
+    """Query a printer and build its snapshot.
+
+    The forecaster and the page rates are updated with what was read, parts
+    equal to those of `previous` are reused. Without `check_web_interface`
+    the web interface is reported unavailable. Raises ConnectionError when
+    the printer doesn't answer.
+    """
+    system_info = await client.get_system_info()
+    if not any(system_info.values()):
+        # Errors are swallowed per OID, a silent printer shows up as
+        # all-None values that must not overwrite the cache
+        raise ConnectionError("No response from printer")
+
+    # The first printer device keeps the flat layout, others of
+    # multi-device agents are nested under "devices"
+    devices = await client.get_printer_devices()
+    primary, *others = devices
+    device_data = await fetch_device(client, primary)
+    data = {
+        "info": {**system_info, **device_data["status"]},
+        **device_data,
+        "cover_status": {"state": await client.get_cover_status()},
+        "web_interface_available": (
+            await check_web_interface() if check_web_interface else False
+        ),
+    }
+    if others:
+        data["devices"] = {
+            str(device): {
+                "description": devices[device],
+                **await fetch_device(client, device),
+            }
+            for device in others
+        }
+    now = time.time()
+    forecaster.update(data["supplies"], data["page_count"].get("total"), now)
+    data["page_rates"] = page_rates.update(data["page_count"], now)
+    return build_snapshot(data, previous)
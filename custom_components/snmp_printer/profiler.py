@@ -0,0 +1,210 @@
+"""Opt-in profiling of printer polls."""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Client methods timed individually, their wall time includes the wait for
+# the printer and the methods they call
+TIMED_METHODS = (
+    "get_system_info",
+    "get_printer_devices",
+    "get_device_info",
+    "get_page_counts",
+    "get_supplies",
+    "get_input_trays",
+    "get_cover_status",
+    "get_display_text",
+    "get_printer_errors",
+)
+
+# Path fragments of the code areas functions are attributed to
+AREAS = (
+    (f"{os.sep}pyasn1{os.sep}", "BER encoding/decoding (pyasn1)"),
+    (f"{os.sep}pysnmp{os.sep}", "SNMP engine (pysnmp)"),
+    (f"{os.sep}snmp_printer{os.sep}", "integration"),
+    (f"{os.sep}asyncio{os.sep}", "event loop"),
+)
+OTHER_AREA = "other"
+
+# Functions listed in the report
+TOP_FUNCTIONS = 25
+
+# cProfile profiles the whole thread and a second profile enabled meanwhile
+# takes its place, so one profiler runs at a time, until its polls are done
+_ACTIVE: PollProfiler | None = None
+
+
+class ProfilerBusy(Exception):
+    """Raised when polls are already being profiled."""
+
+
+def _area(filename: str) -> str:
+    """Return the code area a file belongs to."""
+    for fragment, area in AREAS:
+        if fragment in filename:
+            return area
+    return OTHER_AREA
+
+
+class PollProfiler:
+    """Profile the next polls of a printer.
+
+    CPU time is collected with cProfile while a poll runs. The profiler
+    covers the event loop thread, so callbacks of other tasks that run
+    while the poll waits for the printer are counted too, under their own
+    area. The time the poll spends waiting is its wall time minus the CPU
+    time of the thread. The client's query methods are timed individually.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize a profiler for a number of polls.
+
+        Raises ProfilerBusy while another profiler has polls left.
+        """
+        global _ACTIVE  # pylint: disable=global-statement
+        if _ACTIVE is not None:
+            raise ProfilerBusy(
+                "A poll profile is already running, "
+                "try again once its report is written"
+            )
+        _ACTIVE = self
+        self.cycles = cycles
+        self.completed = 0
+        # CPU time of the thread, a wall clock timer would rank the event
+        # loop's wait for the printer as the hottest function
+        self._profile = cProfile.Profile(time.thread_time)
+        self._wall = 0.0
+        self._cpu = 0.0
+        self._started: tuple[float, float] | None = None
+        self._methods: dict[str, list[float]] = {}
+
+    @property
+    def done(self) -> bool:
+        """Return True once all polls have been profiled."""
+        return self.completed >= self.cycles
+
+    def _timed(
+        self, name: str, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Wrap a client method to record its wall time."""
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._methods.setdefault(name, []).append(elapsed)
+
+        return wrapper
+
+    def start(self, client: Any) -> None:
+        """Start profiling a poll of the client."""
+        for name in TIMED_METHODS:
+            setattr(client, name, self._timed(name, getattr(client, name)))
+        self._started = (time.perf_counter(), time.thread_time())
+        self._profile.enable()
+
+    def stop(self, client: Any) -> None:
+        """Stop profiling the poll of the client."""
+        self._profile.disable()
+        if self._started is not None:
+            wall_started, cpu_started = self._started
+            self._wall += time.perf_counter() - wall_started
+            self._cpu += time.thread_time() - cpu_started
+            self._started = None
+        for name in TIMED_METHODS:
+            # Drop the instance attributes, the class methods show again
+            client.__dict__.pop(name, None)
+        self.completed += 1
+        if self.done:
+            self.release()
+
+    def release(self) -> None:
+        """Let another profiler run, whether or not all polls were profiled."""
+        global _ACTIVE  # pylint: disable=global-statement
+        if _ACTIVE is self:
+            _ACTIVE = None
+
+    def report(self) -> dict[str, Any]:
+        """Return the results as a JSON serializable dict."""
+        # Not pstats.Stats, it fails on a profile without calls
+        self._profile.create_stats()
+        functions = []
+        areas: dict[str, float] = {}
+        for (filename, line, name), entry in self._profile.stats.items():  # type: ignore[attr-defined]
+            _, calls, tottime, cumtime, _ = entry
+            area = _area(filename)
+            areas[area] = areas.get(area, 0.0) + tottime
+            functions.append(
+                {
+                    "function": f"{name} ({os.path.basename(filename)}:{line})",
+                    "area": area,
+                    "calls": calls,
+                    "own_ms": round(tottime * 1000, 2),
+                    "cumulative_ms": round(cumtime * 1000, 2),
+                }
+            )
+        functions.sort(key=lambda function: function["own_ms"], reverse=True)
+
+        polls = max(self.completed, 1)
+        return {
+            "polls": self.completed,
+            "wall_ms_per_poll": round(self._wall * 1000 / polls, 2),
+            "cpu_ms_per_poll": round(self._cpu * 1000 / polls, 2),
+            "wait_ms_per_poll": round(
+                max(self._wall - self._cpu, 0.0) * 1000 / polls, 2
+            ),
+            "areas_ms_per_poll": {
+                area: round(seconds * 1000 / polls, 2)
+                for area, seconds in sorted(
+                    areas.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            "methods": {
+                name: {
+                    "calls": len(times),
+                    "wall_ms_per_call": round(sum(times) * 1000 / len(times), 2),
+                }
+                for name, times in sorted(
+                    self._methods.items(), key=lambda item: sum(item[1]), reverse=True
+                )
+            },
+            "functions": functions[:TOP_FUNCTIONS],
+        }
+
+
+def format_report(title: str, report: dict[str, Any]) -> str:
+    """Return a report as plain text, hottest entries first."""
+    lines = [
+        title,
+        "",
+        f"Polls profiled: {report['polls']}",
+        f"Per poll: {report['wall_ms_per_poll']} ms wall, "
+        f"{report['cpu_ms_per_poll']} ms CPU, "
+        f"{report['wait_ms_per_poll']} ms waiting",
+        "",
+        "CPU by area (ms per poll):",
+    ]
+    lines.extend(
+        f"  {ms:10.2f}  {area}" for area, ms in report["areas_ms_per_poll"].items()
+    )
+    lines += ["", "Client methods (wall ms per call, including waits):"]
+    lines.extend(
+        f"  {method['wall_ms_per_call']:10.2f}  {name} x{method['calls']}"
+        for name, method in report["methods"].items()
+    )
+    lines += ["", "Hottest functions (own ms, cumulative ms, calls):"]
+    lines.extend(
+        f"  {function['own_ms']:10.2f} {function['cumulative_ms']:10.2f} "
+        f"{function['calls']:8}  {function['function']}  [{function['area']}]"
+        for function in report["functions"]
+    )
+    return "\n".join(lines) + "\n"
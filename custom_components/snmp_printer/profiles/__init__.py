@@ -0,0 +1,86 @@
+"""Vendor OID profiles and per-printer fetch plans.
+
+Each vendor module defines a PROFILE naming the exact OIDs of counters and
+the display that its printers expose. Profiles are imported only when a
+printer of that vendor is seen.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields a profile can name an OID for
+FIELD_TOTAL = "total"
+FIELD_COLOR = "color"
+FIELD_BLACK_AND_WHITE = "black_and_white"
+FIELD_DUPLEX = "duplex"
+FIELD_DISPLAY_TEXT = "display_text"
+
+PAGE_COUNT_FIELDS = (FIELD_TOTAL, FIELD_COLOR, FIELD_BLACK_AND_WHITE, FIELD_DUPLEX)
+
+# Profile modules and the sysDescr words that select them
+PROFILE_MODULES: dict[str, tuple[str, ...]] = {
+    "hp": ("Hewlett-Packard", "HP", "JETDIRECT"),
+    "canon": ("Canon",),
+    "xerox": ("Xerox",),
+}
+# Whole words only, "HP" must not match inside another vendor's model name
+_PROFILE_PATTERNS = {
+    module: re.compile("|".join(rf"\b{re.escape(word)}\b" for word in words))
+    for module, words in PROFILE_MODULES.items()
+}
+
+
+@dataclass(frozen=True)
+class VendorProfile:
+    """OIDs a vendor's printers expose, optionally per model."""
+
+    manufacturer: str
+    oids: Mapping[str, str]
+    # (model keyword, OIDs) pairs added when sysDescr contains the keyword
+    models: tuple[tuple[str, Mapping[str, str]], ...] = ()
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """The vendor OIDs to request from one printer."""
+
+    manufacturer: str | None = None
+    oids: Mapping[str, str] = field(default_factory=dict)
+
+    def fields(self, fields: tuple[str, ...]) -> dict[str, str]:
+        """Return the planned OIDs of the given fields."""
+        return {name: oid for name, oid in self.oids.items() if name in fields}
+
+
+def profile_module(description: str) -> str | None:
+    """Return the profile module matching a sysDescr."""
+    for module, pattern in _PROFILE_PATTERNS.items():
+        if pattern.search(description):
+            return module
+    return None
+
+
+def compile_plan(description: str | None) -> FetchPlan:
+    """Compile the fetch plan of a printer from its sysDescr.
+
+    This imports the vendor's profile module and should run in an executor.
+    """
+    module = profile_module(description or "")
+    if module is None:
+        return FetchPlan()
+
+    profile: VendorProfile = importlib.import_module(f".{module}", __name__).PROFILE
+    oids = dict(profile.oids)
+    for keyword, model_oids in profile.models:
+        if keyword in description:
+            oids.update(model_oids)
+
+    _LOGGER.debug("Using %s profile with %s", profile.manufacturer, sorted(oids))
+    return FetchPlan(profile.manufacturer, oids)
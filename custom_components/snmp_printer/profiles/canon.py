@@ -0,0 +1,10 @@
+"""Canon printers (CANON-MIB service counters)."""
+
+from . import FIELD_TOTAL, VendorProfile
+
+PROFILE = VendorProfile(
+    manufacturer="Canon",
+    oids={
+        FIELD_TOTAL: "1.3.6.1.4.1.1602.1.11.1.3.1.4.101",  # Total 1
+    },
+)
@@ -0,0 +1,30 @@
+"""HP printers (HP-LASERJET-COMMON-MIB)."""
+
+from . import (
+    FIELD_BLACK_AND_WHITE,
+    FIELD_COLOR,
+    FIELD_DISPLAY_TEXT,
+    FIELD_DUPLEX,
+    FIELD_TOTAL,
+    VendorProfile,
+)
+
+_PAGE_COUNTS = "1.3.6.1.4.1.11.2.3.9.4.2.1.4.1.2"
+
+PROFILE = VendorProfile(
+    manufacturer="HP",
+    oids={
+        FIELD_TOTAL: f"{_PAGE_COUNTS}.5.0",  # total-engine-page-count
+        FIELD_DUPLEX: f"{_PAGE_COUNTS}.22.0",  # duplex-page-count
+        FIELD_DISPLAY_TEXT: "1.3.6.1.4.1.11.2.3.9.1.1.3.0",  # gdStatusDisplay
+    },
+    models=(
+        (
+            "Color",
+            {
+                FIELD_BLACK_AND_WHITE: f"{_PAGE_COUNTS}.6.0",  # total-mono-page-count
+                FIELD_COLOR: f"{_PAGE_COUNTS}.7.0",  # total-color-page-count
+            },
+        ),
+    ),
+)
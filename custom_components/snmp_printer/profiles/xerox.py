@@ -0,0 +1,15 @@
+"""Xerox printers (XEROX-HOST-RESOURCES-EXT-MIB)."""
+
+from . import FIELD_BLACK_AND_WHITE, FIELD_COLOR, FIELD_TOTAL, VendorProfile
+
+# xcmHrDevDetailValueInteger of the printer's impression counters
+_COUNTERS = "1.3.6.1.4.1.253.8.53.13.2.1.6.1.20"
+
+PROFILE = VendorProfile(
+    manufacturer="Xerox",
+    oids={
+        FIELD_TOTAL: f"{_COUNTERS}.1",
+        FIELD_COLOR: f"{_COUNTERS}.33",
+        FIELD_BLACK_AND_WHITE: f"{_COUNTERS}.34",
+    },
+)
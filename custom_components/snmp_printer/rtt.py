@@ -0,0 +1,73 @@
+"""Round trip time estimation for adaptive SNMP timeouts."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import ADAPTIVE_TIMEOUT_MAX, ADAPTIVE_TIMEOUT_MIN
+
+# Smoothing factors and clock granularity of RFC 6298
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+_GRANULARITY = 0.01
+
+# pysnmp registers a target for every distinct timeout, so the timeout is
+# rounded up to a coarse step to keep their number small
+_TIMEOUT_STEP = 0.1
+
+
+class RttEstimator:
+    """Smoothed round trip time and its variance, like TCP's RTO.
+
+    The retransmit timeout is the smoothed RTT plus four times its mean
+    deviation, within ADAPTIVE_TIMEOUT_MIN and ADAPTIVE_TIMEOUT_MAX. Until
+    the first sample the initial timeout is used. A request that timed out
+    doubles the timeout, which stays until the next sample (RFC 6298 5.5).
+    """
+
+    __slots__ = ("initial", "srtt", "rttvar", "backed_off")
+
+    def __init__(self, initial: float) -> None:
+        """Initialize the estimator."""
+        self.initial = initial
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.backed_off: float | None = None
+
+    def sample(self, rtt: float) -> None:
+        """Add the round trip time of a request answered without retransmits."""
+        self.backed_off = None
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+            return
+        self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+        self.srtt = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+
+    def backoff(self) -> None:
+        """Double the timeout after a request timed out."""
+        # Never below a longer timeout configured for the first requests
+        limit = max(ADAPTIVE_TIMEOUT_MAX, self.initial)
+        self.backed_off = round(min(self.timeout * 2, limit), 1)
+
+    @property
+    def timeout(self) -> float:
+        """Return the retransmit timeout in seconds."""
+        if self.backed_off is not None:
+            return self.backed_off
+        if self.srtt is None or self.rttvar is None:
+            return self.initial
+        rto = self.srtt + max(_GRANULARITY, 4 * self.rttvar)
+        # Rounded first, float noise would otherwise add a step to 0.6
+        rto = math.ceil(round(rto / _TIMEOUT_STEP, 6)) * _TIMEOUT_STEP
+        return round(min(max(rto, ADAPTIVE_TIMEOUT_MIN), ADAPTIVE_TIMEOUT_MAX), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimator state in a JSON serializable form."""
+        return {"srtt": self.srtt, "rttvar": self.rttvar}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore state saved with as_dict()."""
+        self.srtt = data.get("srtt")
+        self.rttvar = data.get("rttvar")
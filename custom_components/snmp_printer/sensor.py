@@ -13,7 +13,8 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, PERCENTAGE, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -22,6 +23,8 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .const import DOMAIN
+from .coordinator import SNMPPrinterCoordinator
+from .model import DeviceSnapshot, PageCounts, PrinterSnapshot, Supply, Tray
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,47 +39,202 @@ async def async_setup_entry(
 
     entities = []
 
+    # Whether the cover and display sensors are enabled follows what a poll
+    # read. Data probed when the printer was added has none of it, they are
+    # added after the first poll then.
+    polled: list[PrinterSensorBase] = [
+        PrinterCoverStatusSensor(coordinator, entry),
+        PrinterDisplayTextSensor(coordinator, entry),
+    ]
+    if not coordinator.seeded:
+        entities.extend(polled)
+        polled = []
+
     # Add main status sensor
     entities.append(PrinterStatusSensor(coordinator, entry))
 
-    # Add cover status sensor
-    entities.append(PrinterCoverStatusSensor(coordinator, entry))
-
     # Add page count sensor
     entities.append(PrinterPageCountSensor(coordinator, entry))
 
+    # Add page throughput sensors
+    entities.append(PrinterPageRateSensor(coordinator, entry, "pages_per_hour"))
+    entities.append(PrinterPageRateSensor(coordinator, entry, "pages_per_day"))
+
     # Add error sensor
     entities.append(PrinterErrorSensor(coordinator, entry))
 
-    # Add display text sensor
-    entities.append(PrinterDisplayTextSensor(coordinator, entry))
+    # Not updated before adding, the coordinator already holds the data and
+    # a refresh per entity would wait for the printer again
+    async_add_entities(entities)
+
+    # Supply, tray and additional device sensors follow the printer's
+    # tables, they are added and removed as rows come and go
+    reconciler = SensorReconciler(hass, coordinator, entry, async_add_entities, polled)
+    reconciler.async_reconcile()
+    entry.async_on_unload(coordinator.async_add_listener(reconciler.async_reconcile))
+
+
+# Key of a group of sensors: (hrDeviceIndex or None, kind, row index)
+_GroupKey = tuple[str | None, str, str]
+
+
+class SensorReconciler:
+    """Keep the structural sensors in line with the printer's tables.
 
-    # Add supply sensors (toner, ink, drums, etc.)
-    if coordinator.data and "supplies" in coordinator.data:
-        for supply in coordinator.data["supplies"]:
-            entities.append(PrinterSupplySensor(coordinator, entry, supply))
+    After every coordinator update the supplies and trays of each printer
+    device are compared with the sensors that exist for them. Sensors are
+    only created for new rows and removed for rows that are gone, the rest
+    of the entry is left alone, so a new cartridge slot or optional tray
+    never needs a reload. An empty table is as likely a failed walk as a
+    printer without rows and removes nothing.
 
-    # Add tray sensors
-    if coordinator.data and "input_trays" in coordinator.data:
-        for tray in coordinator.data["input_trays"]:
-            entities.append(PrinterTraySensor(coordinator, entry, tray))
+    Sensors in `polled` are held back until the coordinator's data comes
+    from a poll instead of a probe.
+    """
 
-    async_add_entities(entities, True)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: SNMPPrinterCoordinator,
+        entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+        polled: list[PrinterSensorBase] | None = None,
+    ) -> None:
+        """Initialize the reconciler."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._entry = entry
+        self._async_add_entities = async_add_entities
+        self._polled = polled or []
+        self._groups: dict[_GroupKey, list[PrinterSensorBase]] = {}
+        self._tables: tuple[Any, ...] = ()
+
+    def _create_group(
+        self, key: _GroupKey, row: DeviceSnapshot | Supply | Tray
+    ) -> list[PrinterSensorBase]:
+        """Create the sensors of a device, supply or tray."""
+        coordinator, entry = self._coordinator, self._entry
+        device = key[0]
+        if isinstance(row, Supply):
+            sensors: list[PrinterSensorBase] = [
+                PrinterSupplySensor(coordinator, entry, row, device)
+            ]
+            if device is None:
+                # Forecasts are only kept for the first printer device
+                sensors.extend(
+                    PrinterSupplyForecastSensor(coordinator, entry, row, forecast)
+                    for forecast in ("days_remaining", "pages_remaining")
+                )
+            return sensors
+        if isinstance(row, Tray):
+            return [PrinterTraySensor(coordinator, entry, row, device)]
+        return [
+            PrinterStatusSensor(coordinator, entry, device),
+            PrinterPageCountSensor(coordinator, entry, device),
+            PrinterErrorSensor(coordinator, entry, device),
+            PrinterDisplayTextSensor(coordinator, entry, device),
+        ]
+
+    @callback
+    def async_reconcile(self) -> None:
+        """Add and remove sensors for changed rows."""
+        data = self._coordinator.data
+        if not data:
+            return
+
+        if self._polled and not self._coordinator.seeded:
+            # Added with the polled device info, they also give the device
+            # its configuration URL
+            self._async_add_entities(self._polled)
+            self._polled = []
+
+        # Unchanged tables are shared between snapshots, see model.py
+        tables = (data.device.supplies, data.device.input_trays, data.devices)
+        if len(tables) == len(self._tables) and all(
+            table is known for table, known in zip(tables, self._tables)
+        ):
+            return
+        self._tables = tables
+
+        current: dict[_GroupKey, DeviceSnapshot | Supply | Tray] = {}
+        # Tables that came back empty, their sensors are kept
+        unknown: set[tuple[str | None, str]] = set()
+        devices: list[tuple[str | None, DeviceSnapshot]] = [(None, data.device)]
+        for device, device_data in data.devices.items():
+            devices.append((device, device_data))
+            current[(device, "device", "")] = device_data
+        for device, device_data in devices:
+            for kind, rows in (
+                ("supply", device_data.supplies),
+                ("tray", device_data.input_trays),
+            ):
+                if not rows:
+                    unknown.add((device, kind))
+                for row in rows:
+                    current[(device, kind, row.index)] = row
+
+        new_sensors = []
+        for key, row in current.items():
+            if key not in self._groups:
+                self._groups[key] = self._create_group(key, row)
+                new_sensors.extend(self._groups[key])
+
+        entity_registry = er.async_get(self._hass)
+        for key in [key for key in self._groups if key not in current]:
+            device, kind, _ = key
+            if (device, kind) in unknown or kind == "device":
+                continue
+            _LOGGER.debug("Removing sensors of %s %s", kind, key)
+            for sensor in self._groups.pop(key):
+                if sensor.registry_entry:
+                    entity_registry.async_remove(sensor.entity_id)
+                else:
+                    self._hass.async_create_task(sensor.async_remove())
+
+        if new_sensors:
+            self._async_add_entities(new_sensors)
 
 
 class PrinterSensorBase(CoordinatorEntity, SensorEntity):
-    """Base class for printer sensors."""
+    """Base class for printer sensors.
+
+    Sensors of the agent's first printer device read coordinator.data.device.
+    Sensors of other devices get their hrDeviceIndex as `device` and read
+    that device's entry of coordinator.data.devices.
+    """
+
+    coordinator: DataUpdateCoordinator[PrinterSnapshot]
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
+        self._device = device
         self._attr_has_entity_name = True
 
+    @property
+    def device_data(self) -> DeviceSnapshot | None:
+        """Return the data of the printer device this sensor belongs to."""
+        data = self.coordinator.data
+        if not data:
+            return None
+        if self._device is None:
+            return data.device
+        return data.devices.get(self._device)
+
+    def _unique_id(self, key: str) -> str:
+        """Return a unique ID for the sensor, per printer device."""
+        # Based on the serial number as read, so existing IDs stay stable
+        unique_id = self.coordinator.data.device.serial_number
+        if self._device is not None:
+            unique_id = f"{unique_id}_device_{self._device}"
+        return f"{unique_id}_{key}"
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -88,18 +246,25 @@ class PrinterSensorBase(CoordinatorEntity, SensorEntity):
         """Check if printer is currently online."""
         if not self.coordinator.data:
             return False
-        return self.coordinator.data.get("is_online", True)
+        return self.coordinator.data.is_online
+
+    def _add_offline_attributes(self, attributes: dict[str, Any], key: str) -> None:
+        """Mark attributes as cached data while the printer is offline."""
+        if not self.is_printer_online:
+            attributes["using_cached_data"] = True
+            offline_since = self.coordinator.data.offline_since
+            if offline_since:
+                attributes[key] = offline_since
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         data = self.coordinator.data
-        info = data.get("info", {})
-        status = data.get("status", {})
+        info = data.info
 
         # Extract manufacturer and model from description
-        description = info.get("description", "")
-        location = info.get("location", "")
+        description = info.description or ""
+        location = info.location or ""
 
         # Try to get model name from description PID field
         model = "Unknown Printer"
@@ -127,8 +292,8 @@ class PrinterSensorBase(CoordinatorEntity, SensorEntity):
         elif "Xerox" in description:
             manufacturer = "Xerox"
 
-        # Use serial number or host as unique ID
-        unique_id = info.get("serial_number", self._entry.data[CONF_HOST])
+        # Use serial number as unique ID
+        unique_id = data.device.serial_number
 
         device_info = DeviceInfo(
             identifiers={(DOMAIN, unique_id)},
@@ -138,11 +303,27 @@ class PrinterSensorBase(CoordinatorEntity, SensorEntity):
         )
 
         # Add configuration URL if web interface is available
-        if data.get("web_interface_available"):
+        if data.web_interface_available:
             device_info["configuration_url"] = f"http://{self._entry.data[CONF_HOST]}"
 
-        if info.get("serial_number"):
-            device_info["serial_number"] = info["serial_number"]
+        if data.device.serial_number:
+            device_info["serial_number"] = data.device.serial_number
+
+        if self._device is not None:
+            # Other printer devices hang off the agent's first printer
+            device_data = self.device_data or DeviceSnapshot()
+            device_info["identifiers"] = {
+                (DOMAIN, f"{unique_id}_device_{self._device}")
+            }
+            device_info["name"] = device_data.description or (
+                f"{device_info['name']} ({self._device})"
+            )
+            device_info["model"] = device_data.description or model
+            device_info["via_device"] = (DOMAIN, unique_id)
+            if device_data.serial_number:
+                device_info["serial_number"] = device_data.serial_number
+            else:
+                device_info.pop("serial_number", None)
 
         return device_info
 
@@ -152,55 +333,49 @@ class PrinterStatusSensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._attr_translation_key = "status"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_status"
+        self._attr_unique_id = self._unique_id("status")
         self._attr_icon = "mdi:printer"
         self._attr_options = ["idle", "printing", "warming_up", "offline", "unknown"]
 
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        if not self.device_data:
             return "unknown"
 
         # If printer is offline, return offline status
         if not self.is_printer_online:
             return "offline"
 
-        status = self.coordinator.data.get("status", {})
-        return status.get("state", "unknown")
+        return self.device_data.state
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data:
+        if not self.device_data:
             return {}
 
-        info = self.coordinator.data.get("info", {})
-        status = self.coordinator.data.get("status", {})
+        info = self.coordinator.data.info
 
         attributes = {
-            "uptime": info.get("uptime"),
-            "contact": info.get("contact"),
-            "location": info.get("location"),
-            "serial_number": info.get("serial_number"),
-            "description": info.get("description"),
+            "uptime": info.uptime,
+            "contact": info.contact,
+            "location": info.location,
+            "serial_number": self.device_data.serial_number,
+            "description": info.description,
         }
+        if self._device is not None:
+            attributes["description"] = self.device_data.description
 
         # Add offline information if using cached data
-        if not self.is_printer_online:
-            attributes["using_cached_data"] = True
-            offline_since = self.coordinator.data.get("offline_since")
-            if offline_since:
-                attributes["offline_since"] = offline_since
+        self._add_offline_attributes(attributes, "offline_since")
 
         # Remove None values
         return {k: v for k, v in attributes.items() if v is not None}
@@ -211,16 +386,13 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "cover_status"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_cover_status"
+        self._attr_unique_id = self._unique_id("cover_status")
         self._attr_icon = "mdi:printer-3d-nozzle-alert"
 
     @property
@@ -229,8 +401,7 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
         # Disable by default if no cover data or state is unknown
         if not self.coordinator.data:
             return False
-        cover_status = self.coordinator.data.get("cover_status", {})
-        state = cover_status.get("state", "unknown")
+        state = self.coordinator.data.cover_status
         # Enable only if we have a valid state (not unknown)
         return state != "unknown" and state != ""
 
@@ -240,8 +411,7 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
         if not self.coordinator.data:
             return "unknown"
 
-        cover_status = self.coordinator.data.get("cover_status", {})
-        return cover_status.get("state", "unknown")
+        return self.coordinator.data.cover_status
 
 
 class PrinterPageCountSensor(PrinterSensorBase):
@@ -249,49 +419,101 @@ class PrinterPageCountSensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._attr_translation_key = "page_count"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_page_count"
+        self._attr_unique_id = self._unique_id("page_count")
         self._attr_icon = "mdi:counter"
         self._attr_native_unit_of_measurement = "pages"
 
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        if not self.device_data:
             return None
 
-        page_count = self.coordinator.data.get("page_count", {})
-        return page_count.get("total")
+        return self.device_data.page_count.total
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        if not self.device_data:
+            return {}
+
+        page_count = self.device_data.page_count
+        attrs = {}
+
+        if page_count.color is not None:
+            attrs["color_pages"] = page_count.color
+
+        if page_count.black_and_white is not None:
+            attrs["black_and_white_pages"] = page_count.black_and_white
+
+        if page_count.duplex is not None:
+            attrs["duplex_pages"] = page_count.duplex
+
+        # Add offline information if using cached data
+        self._add_offline_attributes(attrs, "last_updated")
+
+        return attrs
+
+
+class PrinterPageRateSensor(PrinterSensorBase):
+    """Representation of the pages printed in the last hour or day."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
+        entry: ConfigEntry,
+        rate: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._rate = rate
+        self._attr_translation_key = rate
+        self._attr_unique_id = self._unique_id(rate)
+        self._attr_icon = "mdi:speedometer"
+        self._attr_native_unit_of_measurement = (
+            "pages/h" if rate == "pages_per_hour" else "pages/d"
+        )
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def rates(self) -> PageCounts | None:
+        """Return the pages printed within this sensor's window."""
         if not self.coordinator.data:
+            return None
+        return getattr(self.coordinator.data.page_rates, self._rate)
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        if not self.rates:
+            return None
+
+        return self.rates.total
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        rates = self.rates
+        if not rates:
             return {}
 
-        page_count = self.coordinator.data.get("page_count", {})
         attrs = {}
 
-        if page_count.get("color") is not None:
-            attrs["color_pages"] = page_count.get("color")
+        if rates.color is not None:
+            attrs["color_pages"] = rates.color
 
-        if page_count.get("black_and_white") is not None:
-            attrs["black_and_white_pages"] = page_count.get("black_and_white")
+        if rates.black_and_white is not None:
+            attrs["black_and_white_pages"] = rates.black_and_white
 
         # Add offline information if using cached data
-        if not self.is_printer_online:
-            attrs["using_cached_data"] = True
-            offline_since = self.coordinator.data.get("offline_since")
-            if offline_since:
-                attrs["last_updated"] = offline_since
+        self._add_offline_attributes(attrs, "last_updated")
 
         return attrs
 
@@ -301,27 +523,25 @@ class PrinterSupplySensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
-        supply: dict[str, Any],
+        supply: Supply,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._supply = supply
 
         # Set translation key based on color (lowercase with underscores)
-        color = supply.get("color", "")
+        color = supply.color
         if color and color != "Unknown":
             color_key = color.lower().replace(" ", "_")
             self._attr_translation_key = color_key
         else:
             # Fallback to description for non-standard supplies
-            self._attr_name = supply.get("description", "Supply")
+            self._attr_name = supply.description or "Supply"
 
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_supply_{supply.get('index')}"
+        self._attr_unique_id = self._unique_id(f"supply_{supply.index}")
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
@@ -340,7 +560,7 @@ class PrinterSupplySensor(PrinterSensorBase):
             self._attr_icon = "mdi:water"
         else:
             # For unknown colors, check supply type
-            supply_type = supply.get("type", "").lower()
+            supply_type = supply.type.lower()
             if "toner" in supply_type or "ink" in supply_type:
                 self._attr_icon = "mdi:water"
             elif "drum" in supply_type or "image" in supply_type:
@@ -356,61 +576,110 @@ class PrinterSupplySensor(PrinterSensorBase):
         return True
 
     @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        # Update supply data from coordinator
-        if not self.coordinator.data or "supplies" not in self.coordinator.data:
+    def supply(self) -> Supply | None:
+        """Return the current data of this sensor's supply."""
+        if not self.device_data:
             return None
 
-        for supply in self.coordinator.data["supplies"]:
-            if supply.get("index") == self._supply.get("index"):
-                return supply.get("percentage")
+        for supply in self.device_data.supplies:
+            if supply.index == self._supply.index:
+                return supply
 
         return None
 
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        supply = self.supply
+        return supply.percentage if supply else None
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data or "supplies" not in self.coordinator.data:
+        supply = self.supply
+        if not supply:
             return {}
 
-        for supply in self.coordinator.data["supplies"]:
-            if supply.get("index") == self._supply.get("index"):
-                attributes = {
-                    "type": supply.get("type"),
-                    "color": supply.get("color"),
-                    "description": supply.get("description"),
-                }
-
-                # Add offline information if using cached data
-                if not self.is_printer_online:
-                    attributes["using_cached_data"] = True
-                    offline_since = self.coordinator.data.get("offline_since")
-                    if offline_since:
-                        attributes["last_updated"] = offline_since
-
-                # Add RGB color code for UI customization
-                color = supply.get("color", "")
-                if color == "Black":
-                    attributes["rgb_color"] = [0, 0, 0]
-                elif color == "Cyan":
-                    attributes["rgb_color"] = [0, 255, 255]
-                elif color == "Magenta":
-                    attributes["rgb_color"] = [255, 0, 255]
-                elif color == "Yellow":
-                    attributes["rgb_color"] = [255, 255, 0]
-                elif color == "Gray" or color == "Grey":
-                    attributes["rgb_color"] = [128, 128, 128]
-                elif color == "Light Cyan":
-                    attributes["rgb_color"] = [128, 255, 255]
-                elif color == "Light Magenta":
-                    attributes["rgb_color"] = [255, 128, 255]
-                elif color == "Photo":
-                    attributes["rgb_color"] = [128, 128, 255]
-
-                return attributes
-
-        return {}
+        attributes = {
+            "type": supply.type,
+            "color": supply.color,
+            "description": supply.description,
+        }
+
+        # Add offline information if using cached data
+        self._add_offline_attributes(attributes, "last_updated")
+
+        # Add RGB color code for UI customization
+        color = supply.color
+        if color == "Black":
+            attributes["rgb_color"] = [0, 0, 0]
+        elif color == "Cyan":
+            attributes["rgb_color"] = [0, 255, 255]
+        elif color == "Magenta":
+            attributes["rgb_color"] = [255, 0, 255]
+        elif color == "Yellow":
+            attributes["rgb_color"] = [255, 255, 0]
+        elif color == "Gray" or color == "Grey":
+            attributes["rgb_color"] = [128, 128, 128]
+        elif color == "Light Cyan":
+            attributes["rgb_color"] = [128, 255, 255]
+        elif color == "Light Magenta":
+            attributes["rgb_color"] = [255, 128, 255]
+        elif color == "Photo":
+            attributes["rgb_color"] = [128, 128, 255]
+
+        return attributes
+
+
+class PrinterSupplyForecastSensor(PrinterSensorBase):
+    """Representation of the estimated days or pages left of a supply."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
+        entry: ConfigEntry,
+        supply: Supply,
+        kind: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._supply = supply
+        self._kind = kind
+
+        color = supply.color
+        if color and color != "Unknown":
+            self._attr_translation_key = f"{color.lower().replace(' ', '_')}_{kind}"
+        else:
+            # Fallback to description for non-standard supplies
+            self._attr_name = (
+                f"{supply.description or 'Supply'} {kind.replace('_', ' ')}"
+            )
+
+        self._attr_unique_id = self._unique_id(f"supply_{supply.index}_{kind}")
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+        if kind == "days_remaining":
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.DAYS
+            self._attr_icon = "mdi:calendar-clock"
+        else:
+            self._attr_native_unit_of_measurement = "pages"
+            self._attr_icon = "mdi:file-document-multiple"
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return if the entity should be enabled when first added."""
+        # Supplies that don't report levels can't be forecast
+        return self._supply.percentage is not None
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the sensor."""
+        if not self.coordinator.data:
+            return None
+
+        forecast = self.coordinator.data.forecasts.get(self._supply.index)
+        return getattr(forecast, self._kind) if forecast else None
 
 
 class PrinterTraySensor(PrinterSensorBase):
@@ -418,17 +687,17 @@ class PrinterTraySensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
-        tray: dict[str, Any],
+        tray: Tray,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._tray = tray
 
         # Extract tray name from description (e.g., "Tray 1", "MP Tray")
-        description = tray.get("description", "")
-        tray_name = description if description else f"Tray {tray.get('index', '')}"
+        tray_name = tray.description or f"Tray {tray.index}"
 
         # Set translation key for standard trays (tray_1, tray_2, etc.)
         if "Tray" in tray_name and any(char.isdigit() for char in tray_name):
@@ -440,10 +709,7 @@ class PrinterTraySensor(PrinterSensorBase):
             # For non-standard trays (e.g., "MP Tray"), use explicit name
             self._attr_name = tray_name
 
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_tray_{tray.get('index')}"
+        self._attr_unique_id = self._unique_id(f"tray_{tray.index}")
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_icon = "mdi:tray"
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -453,46 +719,42 @@ class PrinterTraySensor(PrinterSensorBase):
         """Return if the entity should be enabled when first added."""
         # Only enable tray sensors that have valid percentage data
         # Trays without max_capacity or current_level won't have percentage
-        return self._tray.get("percentage") is not None
+        return self._tray.percentage is not None
 
     @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        # Update tray data from coordinator
-        if not self.coordinator.data or "input_trays" not in self.coordinator.data:
+    def tray(self) -> Tray | None:
+        """Return the current data of this sensor's tray."""
+        if not self.device_data:
             return None
 
-        for tray in self.coordinator.data["input_trays"]:
-            if tray.get("index") == self._tray.get("index"):
-                return tray.get("percentage")
+        for tray in self.device_data.input_trays:
+            if tray.index == self._tray.index:
+                return tray
 
         return None
 
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        tray = self.tray
+        return tray.percentage if tray else None
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data or "input_trays" not in self.coordinator.data:
+        tray = self.tray
+        if not tray:
             return {}
 
-        for tray in self.coordinator.data["input_trays"]:
-            if tray.get("index") == self._tray.get("index"):
-                attributes = {
-                    "status": tray.get("status"),
-                    "media_name": tray.get("media_name"),
-                    "max_capacity": tray.get("max_capacity"),
-                    "current_level": tray.get("current_level"),
-                }
-
-                # Add offline information if using cached data
-                if not self.is_printer_online:
-                    attributes["using_cached_data"] = True
-                    offline_since = self.coordinator.data.get("offline_since")
-                    if offline_since:
-                        attributes["last_updated"] = offline_since
+        attributes = {
+            "max_capacity": tray.max_capacity,
+            "current_level": tray.level,
+        }
 
-                return attributes
+        # Add offline information if using cached data
+        self._add_offline_attributes(attributes, "last_updated")
 
-        return {}
+        return attributes
 
 
 class PrinterErrorSensor(PrinterSensorBase):
@@ -500,26 +762,24 @@ class PrinterErrorSensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._attr_translation_key = "errors"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_errors"
+        self._attr_unique_id = self._unique_id("errors")
         self._attr_icon = "mdi:alert"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        if not self.device_data:
             return "none"
 
-        errors = self.coordinator.data.get("errors")
+        errors = self.device_data.errors
         return errors if errors else "none"
 
     @property
@@ -534,33 +794,31 @@ class PrinterDisplayTextSensor(PrinterSensorBase):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[PrinterSnapshot],
         entry: ConfigEntry,
+        device: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, entry, device)
         self._attr_translation_key = "display"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_display"
+        self._attr_unique_id = self._unique_id("display")
         self._attr_icon = "mdi:text-box"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        if not self.device_data:
             return "unknown"
 
-        display_text = self.coordinator.data.get("display_text")
+        display_text = self.device_data.display_text
         return display_text if display_text else "unknown"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added."""
         # Disable by default if no display text
-        if not self.coordinator.data:
+        if not self.device_data:
             return False
-        display_text = self.coordinator.data.get("display_text")
+        display_text = self.device_data.display_text
         return display_text is not None and display_text != ""
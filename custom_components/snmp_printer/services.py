@@ -0,0 +1,112 @@
+"""Services of the SNMP Printer integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    DEFAULT_PROFILE_CYCLES,
+    DISPLAY_WRITE_RATE,
+    DOMAIN,
+    SERVICE_PROFILE,
+    SERVICE_SET_DISPLAY_TEXT,
+)
+from .coordinator import SNMPPrinterCoordinator
+from .display import DisplayWriter
+from .profiler import ProfilerBusy
+
+ATTR_CYCLES = "cycles"
+ATTR_TEXT = "text"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+SET_DISPLAY_TEXT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_TEXT): cv.string,
+    }
+)
+
+
+def _target(hass: HomeAssistant, device_id: str) -> tuple[SNMPPrinterCoordinator, int]:
+    """Return the coordinator and hrDeviceIndex of a printer device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None:
+        for entry_id in device.config_entries:
+            if entry_id not in hass.data.get(DOMAIN, {}):
+                continue
+            coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
+            # Additional printers of an agent are "<serial>_device_<index>"
+            for domain, identifier in device.identifiers:
+                _, separator, index = identifier.rpartition("_device_")
+                if domain == DOMAIN and separator and index.isdigit():
+                    return coordinator, int(index)
+            return coordinator, coordinator.client.primary_device
+    raise HomeAssistantError(f"Device {device_id} is not a loaded SNMP printer")
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services, once for all entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        return
+
+    writer = DisplayWriter(DISPLAY_WRITE_RATE)
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next polls of a printer."""
+        coordinator, _ = _target(hass, call.data[ATTR_DEVICE_ID])
+        try:
+            coordinator.profile_polls(call.data[ATTR_CYCLES])
+        except ProfilerBusy as err:
+            raise HomeAssistantError(str(err)) from err
+
+    async def async_write(device_id: str, text: str) -> dict[str, Any]:
+        """Write the display text of one printer device."""
+        try:
+            coordinator, device = _target(hass, device_id)
+        except HomeAssistantError as err:
+            return {"success": False, "error": str(err)}
+        success = await writer.write(coordinator.client, device, text)
+        result: dict[str, Any] = {"host": coordinator.client.host, "success": success}
+        if not success:
+            result["error"] = "The printer did not accept the text"
+        return result
+
+    async def async_set_display_text(call: ServiceCall) -> ServiceResponse:
+        """Show a text on the display of one or more printers."""
+        device_ids = list(dict.fromkeys(call.data[ATTR_DEVICE_ID]))
+        results = await asyncio.gather(
+            *(async_write(device_id, call.data[ATTR_TEXT]) for device_id in device_ids)
+        )
+        return {"results": dict(zip(device_ids, results, strict=True))}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DISPLAY_TEXT,
+        async_set_display_text,
+        schema=SET_DISPLAY_TEXT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
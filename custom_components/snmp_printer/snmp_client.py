@@ -2,37 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
 import re
+import threading
 import time
-from typing import Any
-
-from pysnmp.hlapi.v3arch.asyncio import (
-    CommunityData,
-    ContextData,
-    ObjectIdentity,
-    ObjectType,
-    SnmpEngine,
-    UdpTransportTarget,
-    UsmUserData,
-    bulk_walk_cmd,
-    get_cmd,
-    set_cmd,
-    usmAesCfb128Protocol,
-    usmDESPrivProtocol,
-    usmHMACMD5AuthProtocol,
-    usmHMACSHAAuthProtocol,
-)
-from pysnmp.proto.rfc1902 import OctetString
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from types import ModuleType
+from typing import Any, TypeVar
 
 from .const import (
+    CAPABILITY_REPROBE_INTERVAL,
+    CAPABILITY_STRIKES,
     DEFAULT_ERROR_LOG_INTERVAL,
     DEVICE_STATUS,
+    DISPLAY_TEXT_REFRESH_INTERVAL,
+    HR_DEVICE_PRINTER,
     OID_COVER_DESCRIPTION,
     OID_COVER_STATUS,
     OID_DEVICE_DESCRIPTION,
+    OID_DEVICE_DESCRIPTION_COLUMN,
     OID_DEVICE_ERRORS,
     OID_DEVICE_STATE,
+    OID_DEVICE_TYPE,
+    OID_DEVICE_TYPE_COLUMN,
     OID_DISPLAY_BUFFER,
     OID_HARDWARE_ADDRESS,
     OID_INPUT_CURRENT_LEVEL,
@@ -53,12 +49,192 @@ from .const import (
     OID_SYSTEM_LOCATION,
     OID_SYSTEM_NAME,
     OID_SYSTEM_UPTIME,
+    REQUEST_MEMO_TTL,
     SUPPLY_CLASS,
     SUPPLY_TYPE,
 )
+from .profiles import FIELD_DISPLAY_TEXT, PAGE_COUNT_FIELDS, FetchPlan, compile_plan
+from .rtt import RttEstimator
 
 _LOGGER = logging.getLogger(__name__)
 
+_BACKEND: ModuleType | None = None
+
+# SNMPv3 state learned from printers, keyed by (username, host, port): the
+# authoritative engine ID, its boots/time and the keys localized to it
+_USM_STATE: dict[tuple[str, str, int], dict[str, Any]] = {}
+
+# pysnmp keeps discovered engine IDs and time windows in private attributes
+_MP_ENGINE_ID_CACHE = "_SnmpV3MessageProcessingModel__engineIdCache"
+_USM_TIMELINE = "_SnmpUSMSecurityModel__timeline"
+_SNMPV3_MODEL = 3  # Message processing and security model ID of SNMPv3/USM
+# Error indications of SNMPv3 requests rejected because the learned engine
+# ID or the keys localized to it no longer match the printer's engine
+_USM_ERRORS = frozenset(
+    (
+        "UnknownEngineID",
+        "UnknownSecurityName",
+        "UnknownUserName",
+        "WrongDigest",
+        "DecryptionError",
+        "AuthenticationFailure",
+    )
+)
+# OIDs every printer has, never skipped: when one of them times out it's
+# the printer that didn't answer. Device columns count for every device.
+_MANDATORY_OIDS = frozenset((OID_SYSTEM_DESCRIPTION,))
+_MANDATORY_DEVICE_COLUMNS = frozenset(
+    oid.rsplit(".", 1)[0]
+    for oid in (OID_DEVICE_STATE, OID_DEVICE_TYPE, OID_SERIAL_NUMBER)
+)
+# Engine cache entry holding the MIB view the command generator resolves with
+_MIB_VIEW_CACHE_KEY = "mibViewController"
+# Engine cache entry counting the messages sent to each printer address
+_SENDS_CACHE_KEY = "snmpPrinterSends"
+
+# MIB modules pysnmp loads into an engine on its first request, on the event
+# loop. create_engine() loads them in the executor instead.
+_ENGINE_MIB_MODULES = ("PYSNMP-MIB", "PYSNMP-SOURCE-MIB", "SNMPv2-TM")
+_COMMUNITY_MIB_MODULES = ("__SNMPv2-MIB",)
+_USM_MIB_MODULES = ("PYSNMP-USM-MIB", "__PYSNMP-USM-MIB")
+
+# MIB view shared by the engines of all clients, see create_engine()
+_MIB_VIEW: Any = None
+_MIB_VIEW_LOCK = threading.Lock()
+_NO_SUCH_NAME = 2  # SNMPv1 error-status for a missing OID
+
+# SNMP requests in flight and recent answers, shared by all clients of a
+# printer. Keyed by (printer, request, arguments).
+_IN_FLIGHT: dict[tuple, asyncio.Task] = {}
+_MEMO: dict[tuple, tuple[float, Any]] = {}
+_MEMO_PRUNE_SIZE = 256
+
+_T = TypeVar("_T")
+
+
+def _device_oid(oid: str, device: int) -> str:
+    """Return an OID indexed by hrDeviceIndex 1 for another device."""
+    return f"{oid.rsplit('.', 1)[0]}.{device}"
+
+
+def _is_mandatory(oid: str) -> bool:
+    """Return True for an OID that is never skipped."""
+    return oid in _MANDATORY_OIDS or oid.rsplit(".", 1)[0] in _MANDATORY_DEVICE_COLUMNS
+
+
+def _coalesced(
+    method: Callable[..., Awaitable[_T]],
+) -> Callable[..., Awaitable[_T]]:
+    """Share one SNMP request among identical concurrent requests.
+
+    Requests to the same printer for the same OIDs while one is in flight
+    wait for its answer instead of sending their own, and requests within
+    REQUEST_MEMO_TTL after it was answered reuse the answer. Only the raw
+    answer is shared: every client does its own bookkeeping on it, so all
+    clients of a printer keep the same connection and capability state.
+    Answers are only read and are not copied.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: SNMPClient, *args: Any) -> _T:
+        key = (self._peer_key, method.__name__, *args)
+        memo = _MEMO.get(key)
+        if memo is not None and memo[0] > time.monotonic():
+            return memo[1]
+
+        task = _IN_FLIGHT.get(key)
+        if task is not None:
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(method(self, *args))
+        _IN_FLIGHT[key] = task
+        task.add_done_callback(functools.partial(_finish_flight, key))
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def _finish_flight(key: tuple, task: asyncio.Task) -> None:
+    """Remember the result of a finished query."""
+    del _IN_FLIGHT[key]
+    # Retrieving the exception keeps it from being logged as never retrieved
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    now = time.monotonic()
+    if len(_MEMO) >= _MEMO_PRUNE_SIZE:
+        for expired in [k for k, (until, _) in _MEMO.items() if until <= now]:
+            del _MEMO[expired]
+    _MEMO[key] = (now + REQUEST_MEMO_TTL, task.result())
+
+
+def load_backend() -> ModuleType:
+    """Import the pysnmp high-level API on first use.
+
+    Importing pysnmp is slow (it builds its MIB machinery at import time),
+    so it is deferred until a client actually talks to a printer. This is
+    blocking and should run in an executor.
+    """
+    global _BACKEND  # pylint: disable=global-statement
+    if _BACKEND is None:
+        from pysnmp.hlapi.v3arch import asyncio as hlapi
+
+        _BACKEND = hlapi
+    return _BACKEND
+
+
+def _shared_mib_view() -> Any:
+    """Return the MIB view all engines resolve OIDs with.
+
+    Built on first use, with its MIB modules loaded and its OID index
+    built by resolving an OID. This is blocking and should run in an
+    executor.
+    """
+    global _MIB_VIEW  # pylint: disable=global-statement
+    with _MIB_VIEW_LOCK:
+        if _MIB_VIEW is None:
+            from pysnmp.smi import builder, view
+
+            hlapi = load_backend()
+            mib_view = view.MibViewController(builder.MibBuilder())
+            hlapi.ObjectType(
+                hlapi.ObjectIdentity(OID_SYSTEM_DESCRIPTION)
+            ).resolve_with_mib(mib_view)
+            _MIB_VIEW = mib_view
+    return _MIB_VIEW
+
+
+def create_engine(snmp_version: str) -> Any:
+    """Create an SNMP engine ready for requests.
+
+    pysnmp sets up more on an engine's first request, on the event loop:
+    it loads MIB modules into the engine and builds a MIB view of its own
+    to resolve OIDs with. Both are done here instead, the modules are loaded
+    and the engine gets the MIB view shared by all engines. This is blocking
+    and should run in an executor.
+    """
+    engine = load_backend().SnmpEngine()
+    engine.get_mib_builder().load_modules(
+        *_ENGINE_MIB_MODULES,
+        *(_USM_MIB_MODULES if snmp_version == "3" else _COMMUNITY_MIB_MODULES),
+    )
+    engine.cache[_MIB_VIEW_CACHE_KEY] = _shared_mib_view()
+    return engine
+
+
+def _count_send(engine: Any, execpoint: str, variables: dict, sends: Counter) -> None:
+    """Count a message sent by an engine, retransmits included."""
+    sends[tuple(variables["transportAddress"])] += 1
+
+
+def _sent_messages(engine: Any) -> Counter:
+    """Return the number of messages an engine sent, by printer address."""
+    sends = engine.cache.get(_SENDS_CACHE_KEY)
+    if sends is None:
+        sends = engine.cache[_SENDS_CACHE_KEY] = Counter()
+        engine.observer.register_observer(_count_send, "rfc3412.sendPdu", cbCtx=sends)
+    return sends
+
 
 class SNMPClient:
     """SNMP client for printer communication."""
@@ -76,12 +252,15 @@ class SNMPClient:
         priv_key: str | None = None,
         timeout: float = 1.0,
         retries: int = 3,
+        engine: Any = None,
     ):
         """Initialize the SNMP client.
 
         Args:
             timeout: Timeout in seconds for each SNMP request (default 1.0)
             retries: Number of retries for failed requests (default 3)
+            engine: Engine from create_engine() shared with other clients of
+                the same SNMP version, a client creates its own by default
         """
         self.host = host
         self.port = port
@@ -95,9 +274,47 @@ class SNMPClient:
         self.timeout = timeout
         self.retries = retries
 
-        self._engine = None  # Will be created on first use
+        self._engine = engine  # Will be created on first use unless shared
         self._transport = None  # Will be created async
-        self._auth_data = self._get_auth_data()
+        self._auth_data = None  # Needs the SNMP backend, created with the engine
+        self._usm_remembered = False
+        self._sends: Counter | None = None  # The engine's, by printer address
+
+        # Static columns of the supply and tray tables from the last full
+        # walk per device, keyed by row index. Missing until walked.
+        self._supply_rows: dict[int, dict[str, dict[str, Any]]] = {}
+        self._tray_rows: dict[int, dict[str, dict[str, Any]]] = {}
+        # Level columns the printer answered for every row of those walks
+        self._supply_columns: dict[int, tuple[str, ...]] = {}
+        self._tray_columns: dict[int, tuple[str, ...]] = {}
+
+        # Printer devices on the agent (hrDeviceIndex to hrDeviceDescr)
+        self._devices: dict[int, str | None] | None = None
+
+        # hrDeviceStatus and hrPrinterDetectedErrorState per device from the
+        # last get_device_info(), and the display text read under them with
+        # its time. The text is read again when they change, see
+        # get_display_text().
+        self._device_states: dict[int, tuple[str | None, str | None]] = {}
+        self._display_texts: dict[
+            int, tuple[tuple[str | None, str | None], float, str | None]
+        ] = {}
+
+        # Vendor OIDs to request, compiled from the sysDescr they belong to
+        self._plan = FetchPlan()
+        self._plan_description: str | None = None
+
+        # OIDs and tables the printer doesn't support, with the time they
+        # were found unsupported, and the sysDescr they were learned under
+        self._unsupported: dict[str, float] = {}
+        self._capability_description: str | None = None
+        # Timeouts and empty answers in a row of OIDs not skipped yet
+        self._strikes: dict[str, int] = {}
+        # OID whose request timed out while the printer was answering
+        self._timeout_suspect: str | None = None
+
+        # Retransmit timeout adapted to the printer's round trip time
+        self._rtt = RttEstimator(timeout)
 
         # Connection state tracking for better error logging
         self._connection_state = "unknown"  # unknown, online, offline
@@ -107,11 +324,16 @@ class SNMPClient:
     def _create_engine(self):
         """Create SNMP engine (blocking operation)."""
         if self._engine is None:
-            self._engine = SnmpEngine()
+            self._engine = create_engine(self.snmp_version)
+        if self._auth_data is None:
+            self._auth_data = self._get_auth_data()
         return self._engine
 
-    def _handle_snmp_error(self, error_message: str) -> None:
+    def _handle_snmp_error(self, error_message: str, indication: Any = None) -> None:
         """Handle SNMP errors with intelligent logging to reduce spam."""
+        if indication is not None:
+            self._check_usm_error(indication)
+            self._check_timeout(indication)
         current_time = time.time()
         self._consecutive_failures += 1
 
@@ -157,6 +379,11 @@ class SNMPClient:
 
     def _mark_connection_success(self) -> None:
         """Mark a successful connection to reset error tracking."""
+        # A single timeout between answers was the OID, not the printer
+        if self._timeout_suspect and self._consecutive_failures == 1:
+            self._strike(self._timeout_suspect, "timed out")
+        self._timeout_suspect = None
+
         if self._connection_state == "offline":
             _LOGGER.info(
                 "Printer %s is back online after %d failed attempts",
@@ -166,33 +393,340 @@ class SNMPClient:
         self._connection_state = "online"
         self._consecutive_failures = 0
 
+    def apply_settings(self, timeout: float, retries: int) -> None:
+        """Change the timeout and retries of a running client.
+
+        The timeout is the one used until the printer's round trip time is
+        known, the transport picks both up with the next request.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self._rtt.initial = timeout
+        if self._transport is not None:
+            self._transport.retries = retries
+
     async def _ensure_transport(self):
         """Ensure transport and engine are created (async operation)."""
-        if self._engine is None:
-            self._engine = SnmpEngine()
+        if self._auth_data is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._create_engine)
         if self._transport is None:
-            self._transport = await UdpTransportTarget.create(
+            self._transport = await load_backend().UdpTransportTarget.create(
                 (self.host, self.port),
                 timeout=self.timeout,
                 retries=self.retries,
             )
+            if self.snmp_version == "3":
+                self._seed_usm_state()
+        if self._sends is None:
+            self._sends = _sent_messages(self._engine)
+
+    def _auth_protocols(self) -> tuple[Any, Any]:
+        """Return the pysnmp auth and privacy protocol identifiers."""
+        hlapi = load_backend()
+        auth_proto = None
+        if self.auth_protocol == "MD5":
+            auth_proto = hlapi.usmHMACMD5AuthProtocol
+        elif self.auth_protocol == "SHA":
+            auth_proto = hlapi.usmHMACSHAAuthProtocol
+
+        priv_proto = None
+        if self.priv_protocol == "DES":
+            priv_proto = hlapi.usmDESPrivProtocol
+        elif self.priv_protocol == "AES":
+            priv_proto = hlapi.usmAesCfb128Protocol
+
+        return auth_proto, priv_proto
+
+    @property
+    def _usm_key(self) -> tuple[str, str, int]:
+        """Return the key of this client's SNMPv3 state."""
+        return (self.username or "", self.host, self.port)
+
+    @property
+    def _peer_key(self) -> tuple[str, int, str, str, str]:
+        """Return what identifies the printer and the view of it we get.
+
+        SNMPv3 clients of the same user with other keys, like a config flow
+        checking mistyped passwords, must not share the answers.
+        """
+        if self.snmp_version == "3":
+            return (
+                self.host,
+                self.port,
+                self.snmp_version,
+                self.username or "",
+                self._credentials_fingerprint(),
+            )
+        return (self.host, self.port, self.snmp_version, self.community, "")
+
+    def _credentials_fingerprint(self) -> str:
+        """Return a digest of the v3 credentials the cached keys belong to."""
+        material = "\0".join(
+            str(value)
+            for value in (
+                self.auth_protocol,
+                self.auth_key,
+                self.priv_protocol,
+                self.priv_key,
+            )
+        )
+        return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+    def _cached_usm_state(self) -> dict[str, Any] | None:
+        """Return the SNMPv3 state learned for these credentials, if any."""
+        state = _USM_STATE.get(self._usm_key)
+        if state and state.get("fingerprint") == self._credentials_fingerprint():
+            return state
+        return None
+
+    def _seed_usm_state(self) -> None:
+        """Prime the engine with a known engine ID and time window.
+
+        Without this every new engine starts with an engine ID discovery
+        round trip, and a second one to learn the time window.
+        """
+        state = self._cached_usm_state()
+        if state is None:
+            return
+
+        hlapi = load_backend()
+        engine_id = hlapi.OctetString(hexValue=state["engine_id"])
+        engine_time = min(
+            state["time"] + int(time.time() - state["timestamp"]), 2**31 - 1
+        )
+        try:
+            message_processing = self._engine.message_processing_subsystems[
+                _SNMPV3_MODEL
+            ]
+            getattr(message_processing, _MP_ENGINE_ID_CACHE)[
+                self._transport.get_transport_info()
+            ] = {
+                "securityEngineId": engine_id,
+                "contextEngineId": engine_id,
+                "contextName": hlapi.OctetString(b""),
+            }
+            getattr(self._engine.security_models[_SNMPV3_MODEL], _USM_TIMELINE)[
+                engine_id
+            ] = (
+                hlapi.Integer(state["boots"]),
+                hlapi.Integer(engine_time),
+                hlapi.Integer(engine_time),
+                int(time.time()),
+            )
+        except (AttributeError, KeyError, TypeError) as err:
+            _LOGGER.debug("Could not reuse SNMPv3 state for %s: %s", self.host, err)
+
+    def _read_usm_state(self) -> tuple[bytes, int, int] | None:
+        """Return the engine ID, boots and time the engine learned."""
+        try:
+            message_processing = self._engine.message_processing_subsystems[
+                _SNMPV3_MODEL
+            ]
+            peer = getattr(message_processing, _MP_ENGINE_ID_CACHE).get(
+                self._transport.get_transport_info()
+            )
+            if not peer:
+                return None
+            engine_id = peer["securityEngineId"]
+            boots, engine_time, _, _ = getattr(
+                self._engine.security_models[_SNMPV3_MODEL], _USM_TIMELINE
+            )[engine_id]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+        return bytes(engine_id), int(boots), int(engine_time)
+
+    def _localize_keys(self, engine_id: bytes) -> tuple[str | None, str | None]:
+        """Derive the keys localized to an engine ID (slow by design)."""
+        from pysnmp.proto.secmod.rfc3414.service import SnmpUSMSecurityModel
+
+        hlapi = load_backend()
+        auth_proto, priv_proto = self._auth_protocols()
+        security_engine_id = hlapi.OctetString(engine_id)
+
+        auth_key = priv_key = None
+        if auth_proto:
+            auth_service = SnmpUSMSecurityModel.AUTH_SERVICES[auth_proto]
+            auth_key = auth_service.localize_key(
+                auth_service.hash_passphrase(hlapi.OctetString(self.auth_key or "")),
+                security_engine_id,
+            )
+            if priv_proto:
+                priv_service = SnmpUSMSecurityModel.PRIV_SERVICES[priv_proto]
+                priv_key = priv_service.localize_key(
+                    auth_proto,
+                    priv_service.hash_passphrase(
+                        auth_proto, hlapi.OctetString(self.priv_key or "")
+                    ),
+                    security_engine_id,
+                )
+
+        return (
+            bytes(auth_key).hex() if auth_key is not None else None,
+            bytes(priv_key).hex() if priv_key is not None else None,
+        )
+
+    async def _remember_usm_state(self) -> None:
+        """Cache what this client learned about the printer's SNMPv3 engine."""
+        if self.snmp_version != "3" or self._usm_remembered:
+            return
+
+        # Nothing learned by an engine whose client got a shared answer
+        learned = self._read_usm_state()
+        if learned is None:
+            return
+        self._usm_remembered = True
+        engine_id, boots, engine_time = learned
+
+        state = self._cached_usm_state()
+        if state is None or state["engine_id"] != engine_id.hex():
+            auth_key, priv_key = await asyncio.get_running_loop().run_in_executor(
+                None, self._localize_keys, engine_id
+            )
+            state = {
+                "engine_id": engine_id.hex(),
+                "auth_key": auth_key,
+                "priv_key": priv_key,
+                "fingerprint": self._credentials_fingerprint(),
+            }
+        state.update(boots=boots, time=engine_time, timestamp=time.time())
+        _USM_STATE[self._usm_key] = state
+
+    def _check_usm_error(self, indication: Any) -> None:
+        """Forget the learned SNMPv3 state when the printer rejects it.
+
+        A printer whose engine ID changed, after a reset or because another
+        device took its address, doesn't accept the keys localized to the
+        old engine ID. The state is only learned from answers, so it has to
+        be dropped here: the next request authenticates with the passwords
+        and discovers the engine ID again.
+        """
+        if self.snmp_version != "3" or type(indication).__name__ not in _USM_ERRORS:
+            return
+        state = _USM_STATE.pop(self._usm_key, None)
+        if state is None and not self._usm_remembered:
+            return
+        _LOGGER.debug(
+            "Printer %s rejected the SNMPv3 state (%s), discovering it again",
+            self.host,
+            indication,
+        )
+        self._usm_remembered = False
+        if self._engine is None:
+            return
+        if self._transport is not None:
+            try:
+                message_processing = self._engine.message_processing_subsystems[
+                    _SNMPV3_MODEL
+                ]
+                getattr(message_processing, _MP_ENGINE_ID_CACHE).pop(
+                    self._transport.get_transport_info(), None
+                )
+            except (AttributeError, KeyError, TypeError):
+                pass
+        self._auth_data = self._get_auth_data()
+
+    def _is_unsupported(self, oid: str) -> bool:
+        """Return True if the OID is known to be unsupported.
+
+        Entries expire after CAPABILITY_REPROBE_INTERVAL so the OID is asked
+        for again, in case a firmware update added it.
+        """
+        found = self._unsupported.get(oid)
+        if found is None:
+            return False
+        if time.time() - found < CAPABILITY_REPROBE_INTERVAL:
+            return True
+        del self._unsupported[oid]
+        return False
+
+    def _mark_unsupported(self, oid: str, reason: str) -> None:
+        """Remember that the printer doesn't support an OID or table."""
+        self._strikes.pop(oid, None)
+        if _is_mandatory(oid):
+            return
+        _LOGGER.debug("Printer %s: %s %s, skipping it", self.host, oid, reason)
+        self._unsupported[oid] = time.time()
+
+    def _strike(self, oid: str, reason: str) -> None:
+        """Count a timeout or empty answer of an OID, skip it after several.
+
+        Unlike noSuchObject or noSuchName these can be passing, a slow
+        printer or a table without rows for a while.
+        """
+        strikes = self._strikes.get(oid, 0) + 1
+        if strikes < CAPABILITY_STRIKES:
+            self._strikes[oid] = strikes
+        else:
+            self._mark_unsupported(oid, f"{reason} {strikes} times")
+
+    def _check_capabilities(self, description: str | None) -> None:
+        """Forget unsupported OIDs when sysDescr shows a firmware change."""
+        if not description or description == self._capability_description:
+            return
+        if self._capability_description is not None and self._unsupported:
+            _LOGGER.debug("Printer %s changed, probing all OIDs again", self.host)
+            self._unsupported.clear()
+        self._capability_description = description
+
+    def export_state(self) -> dict[str, Any]:
+        """Return learned protocol state worth persisting across restarts."""
+        exported: dict[str, Any] = {}
+        state = self._cached_usm_state() if self.snmp_version == "3" else None
+        if state is not None:
+            # Keep the time window current so a restart stays inside it
+            learned = self._read_usm_state() if self._transport else None
+            if learned is not None and learned[0].hex() == state["engine_id"]:
+                state.update(boots=learned[1], time=learned[2], timestamp=time.time())
+            exported["usm"] = dict(state)
+        if self._rtt.srtt is not None:
+            exported["rtt"] = self._rtt.as_dict()
+        if self._capability_description is not None:
+            exported["capabilities"] = {
+                "description": self._capability_description,
+                "unsupported": dict(self._unsupported),
+            }
+        return exported
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restore protocol state saved by export_state()."""
+        if self.snmp_version == "3" and state.get("usm"):
+            _USM_STATE.setdefault(self._usm_key, dict(state["usm"]))
+        if state.get("rtt"):
+            self._rtt.restore(state["rtt"])
+        if state.get("capabilities"):
+            self._capability_description = state["capabilities"]["description"]
+            self._unsupported = {
+                oid: found
+                for oid, found in state["capabilities"]["unsupported"].items()
+                if not _is_mandatory(oid)
+            }
 
     def _get_auth_data(self):
         """Get authentication data based on SNMP version."""
+        hlapi = load_backend()
         if self.snmp_version == "3":
-            auth_proto = None
-            if self.auth_protocol == "MD5":
-                auth_proto = usmHMACMD5AuthProtocol
-            elif self.auth_protocol == "SHA":
-                auth_proto = usmHMACSHAAuthProtocol
-
-            priv_proto = None
-            if self.priv_protocol == "DES":
-                priv_proto = usmDESPrivProtocol
-            elif self.priv_protocol == "AES":
-                priv_proto = usmAesCfb128Protocol
-
-            return UsmUserData(
+            auth_proto, priv_proto = self._auth_protocols()
+
+            # Keys already localized to the printer's engine skip both the
+            # expensive key derivation and the engine ID discovery
+            state = self._cached_usm_state()
+            if state and auth_proto and state.get("auth_key"):
+                return hlapi.UsmUserData(
+                    self.username,
+                    authKey=bytes.fromhex(state["auth_key"]),
+                    authProtocol=auth_proto,
+                    privKey=(
+                        bytes.fromhex(state["priv_key"])
+                        if priv_proto and state.get("priv_key")
+                        else None
+                    ),
+                    privProtocol=priv_proto,
+                    securityEngineId=hlapi.OctetString(hexValue=state["engine_id"]),
+                    authKeyType=hlapi.USM_KEY_TYPE_LOCALIZED,
+                    privKeyType=hlapi.USM_KEY_TYPE_LOCALIZED,
+                )
+
+            return hlapi.UsmUserData(
                 self.username,
                 authKey=self.auth_key if auth_proto else None,
                 authProtocol=auth_proto,
@@ -201,7 +735,7 @@ class SNMPClient:
             )
         else:
             # SNMP v1 or v2c
-            return CommunityData(
+            return hlapi.CommunityData(
                 self.community, mpModel=0 if self.snmp_version == "1" else 1
             )
 
@@ -215,21 +749,121 @@ class SNMPClient:
             _LOGGER.error("Connection test failed: %s", err)
             raise
 
-    async def _get_oid(self, oid: str) -> Any:
-        """Get a single OID value."""
-        await self._ensure_transport()
-        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
+    async def probe(
+        self, timeout: float | None = None, retries: int | None = None
+    ) -> dict[str, str | None]:
+        """Read what identifies the printer in one request.
+
+        Gets sysDescr, sysName, sysLocation, the serial number and the
+        hrDeviceType of hrDeviceIndex 1 with a single GET, to check that a
+        printer answers without the many requests of a poll. The GET is sent
+        with `timeout` and `retries` when given, instead of the client's
+        settings. The result is empty when it didn't answer.
+        """
+        oids = {
+            "description": OID_SYSTEM_DESCRIPTION,
+            "name": OID_SYSTEM_NAME,
+            "location": OID_SYSTEM_LOCATION,
+            "serial_number": OID_SERIAL_NUMBER,
+            "device_type": OID_DEVICE_TYPE,
+        }
+        settings = (self.timeout, self.retries)
+        self.apply_settings(
+            settings[0] if timeout is None else timeout,
+            settings[1] if retries is None else retries,
+        )
+        try:
+            values = await self._get_oids(list(oids.values()))
+        finally:
+            self.apply_settings(*settings)
+        if not values:
+            return {}
+        return {name: values.get(oid) for name, oid in oids.items()}
+
+    def _start_request(self) -> tuple[float, int]:
+        """Apply the adaptive timeout to the next request, return its start.
+
+        The start is the time and the number of messages sent to the
+        printer before the request.
+        """
+        self._transport.timeout = self._rtt.timeout
+        return time.monotonic(), self._sends[tuple(self._transport.transport_address)]
+
+    def _record_rtt(self, started: tuple[float, int]) -> None:
+        """Feed the round trip time of an answered request to the estimator."""
+        elapsed = time.monotonic() - started[0]
+        # An answer to a request that was sent more than once can't be
+        # matched to a send time (Karn's algorithm). That covers retransmits,
+        # SNMPv3 discovery and other requests to the printer at the time.
+        sends = self._sends[tuple(self._transport.transport_address)] - started[1]
+        if sends == 1:
+            self._rtt.sample(elapsed)
+
+    def _check_timeout(self, indication: Any) -> None:
+        """Back the timeout off after a request the printer didn't answer."""
+        if type(indication).__name__ == "RequestTimedOut":
+            self._rtt.backoff()
+
+    @_coalesced
+    async def _request(
+        self, command: str, lookup_mib: bool, *oids: str
+    ) -> tuple[Any, Any, Any, Any]:
+        """Send a GET or GETNEXT (`command`) of OIDs, return the answer."""
+        hlapi = load_backend()
+        return await getattr(hlapi, command)(
             self._engine,
             self._auth_data,
             self._transport,
-            ContextData(),
-            ObjectType(ObjectIdentity(oid)),
+            hlapi.ContextData(),
+            *(hlapi.ObjectType(hlapi.ObjectIdentity(oid)) for oid in oids),
+            lookupMib=lookup_mib,
+        )
+
+    @_coalesced
+    async def _bulk_walk(self, oid: str) -> list[tuple[Any, Any, Any, Any]]:
+        """Bulk walk an OID tree, return the answers up to the first error."""
+        hlapi = load_backend()
+        answers = []
+        async for answer in hlapi.bulk_walk_cmd(
+            self._engine,
+            self._auth_data,
+            self._transport,
+            hlapi.ContextData(),
+            0,  # Non-repeaters
+            25,  # Max-repetitions
+            hlapi.ObjectType(hlapi.ObjectIdentity(oid)),
+            lexicographicMode=False,
+        ):
+            answers.append(answer)
+            if answer[0] or answer[1]:
+                break
+        return answers
+
+    async def _get_oid(self, oid: str) -> Any:
+        """Get a single OID value."""
+        if self._is_unsupported(oid):
+            return None
+
+        await self._ensure_transport()
+        hlapi = load_backend()
+        started = self._start_request()
+        errorIndication, errorStatus, errorIndex, varBinds = await self._request(
+            "get_cmd", True, oid
         )
+        if not errorIndication:
+            self._record_rtt(started)
 
         if errorIndication:
-            self._handle_snmp_error(f"SNMP error: {errorIndication}")
+            if self._connection_state == "online":
+                self._timeout_suspect = oid
+            self._handle_snmp_error(f"SNMP error: {errorIndication}", errorIndication)
             return None
         elif errorStatus:
+            if errorStatus == _NO_SUCH_NAME and self.snmp_version == "1":
+                # SNMPv1 agents answer for a missing OID with an error
+                self._mark_connection_success()
+                self._mark_unsupported(oid, "does not exist")
+                return None
             self._handle_snmp_error(
                 f"SNMP error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
             )
@@ -237,37 +871,49 @@ class SNMPClient:
 
         for varBind in varBinds:
             self._mark_connection_success()
+            await self._remember_usm_state()
+            if isinstance(varBind[1], hlapi.NoSuchObject):
+                self._mark_unsupported(oid, "does not exist")
+                return None
+            if isinstance(varBind[1], (hlapi.NoSuchInstance, hlapi.EndOfMibView)):
+                self._strike(oid, "has no instance")
+                return None
+            self._strikes.pop(oid, None)
             return varBind[1].prettyPrint()
 
         return None
 
     async def _walk_oid(self, oid: str) -> dict[str, str]:
         """Walk an OID tree (async operation) and return as dict."""
+        if self.snmp_version == "1":
+            return (await self._walk_table((oid,)))[oid]
+        if self._is_unsupported(oid):
+            return {}
+
         await self._ensure_transport()
 
         results = {}
-        async for errorIndication, errorStatus, errorIndex, varBinds in bulk_walk_cmd(
-            self._engine,
-            self._auth_data,
-            self._transport,
-            ContextData(),
-            0,  # Non-repeaters
-            25,  # Max-repetitions
-            ObjectType(ObjectIdentity(oid)),
-            lexicographicMode=False,
-        ):
+        failed = False
+        self._start_request()
+        answers = await self._bulk_walk(oid)
+        for errorIndication, errorStatus, errorIndex, varBinds in answers:
             if errorIndication:
-                self._handle_snmp_error(f"SNMP walk error: {errorIndication}")
+                self._handle_snmp_error(
+                    f"SNMP walk error: {errorIndication}", errorIndication
+                )
+                failed = True
                 break
             elif errorStatus:
                 self._handle_snmp_error(
                     f"SNMP walk error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
                 )
+                failed = True
                 break
             else:
                 # Mark success if we get any data
                 if not results and varBinds:
                     self._mark_connection_success()
+                    await self._remember_usm_state()
 
                 for varBind in varBinds:
                     # Extract the index from the OID (last part after the base OID)
@@ -275,20 +921,239 @@ class SNMPClient:
                     if full_oid.startswith(oid + "."):
                         index = full_oid[len(oid) + 1 :]
                         results[index] = str(varBind[1])
+
+        if results:
+            self._strikes.pop(oid, None)
+        elif not failed:
+            self._strike(oid, "is empty")
         return results
 
+    async def _walk_table(self, columns: tuple[str, ...]) -> dict[str, dict[str, str]]:
+        """Walk several columns of a table, return {column: {index: value}}.
+
+        SNMPv1 has no GETBULK, so v1 printers get all columns advanced
+        together, one multi-varbind GETNEXT per row. Other versions bulk walk
+        the columns one after the other.
+        """
+        if self.snmp_version != "1":
+            return {column: await self._walk_oid(column) for column in columns}
+
+        results: dict[str, dict[str, str]] = {column: {} for column in columns}
+        cursors = {
+            column: column for column in columns if not self._is_unsupported(column)
+        }
+        if not cursors:
+            return results
+
+        await self._ensure_transport()
+        walked = list(cursors)
+        while cursors:
+            pending = list(cursors)
+            started = self._start_request()
+            errorIndication, errorStatus, errorIndex, varBinds = await self._request(
+                "next_cmd", False, *(cursors[column] for column in pending)
+            )
+            if not errorIndication:
+                self._record_rtt(started)
+
+            if errorIndication:
+                self._handle_snmp_error(
+                    f"SNMP walk error: {errorIndication}", errorIndication
+                )
+                return results
+            elif errorStatus:
+                if errorStatus == _NO_SUCH_NAME and errorIndex:
+                    # The column was the last one in the agent's MIB view
+                    del cursors[pending[int(errorIndex) - 1]]
+                    continue
+                self._handle_snmp_error(
+                    f"SNMP walk error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
+                )
+                return results
+
+            self._mark_connection_success()
+            await self._remember_usm_state()
+            for column, (oid, value) in zip(pending, varBinds):
+                oid = str(oid)
+                # Past the column's last row, or an agent that doesn't advance
+                if not oid.startswith(column + ".") or oid == cursors[column]:
+                    del cursors[column]
+                    continue
+                results[column][oid[len(column) + 1 :]] = str(value)
+                cursors[column] = oid
+
+        for column in walked:
+            if results[column]:
+                self._strikes.pop(column, None)
+            else:
+                self._strike(column, "is empty")
+        return results
+
+    async def _get_oids(self, oids: list[str]) -> dict[str, str | None]:
+        """Get several OIDs in one request.
+
+        OIDs the printer doesn't have map to None. The result is empty if
+        the request failed.
+        """
+        results: dict[str, str | None] = dict.fromkeys(
+            filter(self._is_unsupported, oids)
+        )
+        pending = [oid for oid in oids if oid not in results]
+        if not pending:
+            return results
+
+        await self._ensure_transport()
+        hlapi = load_backend()
+        no_instance = (hlapi.NoSuchInstance, hlapi.EndOfMibView)
+        while pending:
+            started = self._start_request()
+            errorIndication, errorStatus, errorIndex, varBinds = await self._request(
+                "get_cmd", False, *pending
+            )
+            if not errorIndication:
+                self._record_rtt(started)
+
+            if errorIndication:
+                self._handle_snmp_error(
+                    f"SNMP error: {errorIndication}", errorIndication
+                )
+                return {}
+            elif errorStatus:
+                if (
+                    errorStatus == _NO_SUCH_NAME
+                    and errorIndex
+                    and self.snmp_version == "1"
+                ):
+                    # SNMPv1 agents fail the whole request on the first
+                    # missing OID, drop it and ask again for the rest
+                    oid = pending.pop(int(errorIndex) - 1)
+                    self._mark_connection_success()
+                    self._mark_unsupported(oid, "does not exist")
+                    results[oid] = None
+                    continue
+                # genErr, tooBig and the like can be passing, an OID the
+                # printer keeps failing on is only skipped when it repeats
+                if errorIndex:
+                    self._strike(
+                        pending[int(errorIndex) - 1], errorStatus.prettyPrint()
+                    )
+                self._handle_snmp_error(
+                    f"SNMP error: {errorStatus.prettyPrint()} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
+                )
+                return {}
+
+            self._mark_connection_success()
+            await self._remember_usm_state()
+            for oid, (_, value) in zip(pending, varBinds):
+                if isinstance(value, hlapi.NoSuchObject):
+                    self._mark_unsupported(oid, "does not exist")
+                    results[oid] = None
+                elif isinstance(value, no_instance):
+                    self._strike(oid, "has no instance")
+                    results[oid] = None
+                else:
+                    self._strikes.pop(oid, None)
+                    results[oid] = str(value)
+            break
+
+        return results
+
+    async def _get_next_oids(self, oids: list[str]) -> list[tuple[str, str]] | None:
+        """Send one GETNEXT for several OIDs, None if the request failed."""
+        await self._ensure_transport()
+        started = self._start_request()
+        errorIndication, errorStatus, errorIndex, varBinds = await self._request(
+            "next_cmd", False, *oids
+        )
+        if not errorIndication:
+            self._record_rtt(started)
+
+        if errorIndication:
+            self._handle_snmp_error(f"SNMP error: {errorIndication}", errorIndication)
+            return None
+        elif errorStatus:
+            # noSuchName from SNMPv1 agents at the end of the MIB view
+            _LOGGER.debug(
+                "SNMP error: %s at %s",
+                errorStatus.prettyPrint(),
+                errorIndex and varBinds[int(errorIndex) - 1][0] or "?",
+            )
+            return None
+
+        self._mark_connection_success()
+        return [(str(oid), str(value)) for oid, value in varBinds]
+
+    async def _refresh_table(
+        self, columns: tuple[str, ...], indexes: list[str]
+    ) -> dict[str, dict[str, str]] | None:
+        """Re-read columns of known table rows in a single request.
+
+        Asks for the successor of each row's predecessor, which returns
+        exactly the known rows while the table is unchanged. A row that
+        appeared or disappeared shows up as an unexpected OID.
+
+        Returns the values as {column: {index: value}}, or None when the
+        rows changed or the request failed and the table must be walked.
+        """
+        if not columns:
+            return None
+
+        oids = [
+            oid
+            for column in columns
+            for oid in (column, *(f"{column}.{index}" for index in indexes))
+        ]
+        response = await self._get_next_oids(oids)
+        if response is None or len(response) != len(oids):
+            return None
+
+        values: dict[str, dict[str, str]] = {}
+        position = 0
+        for column in columns:
+            column_values = values[column] = {}
+            for index in indexes:
+                oid, value = response[position]
+                if oid != f"{column}.{index}":
+                    return None
+                column_values[index] = value
+                position += 1
+            # The successor of the last row must be outside the column
+            if response[position][0].startswith(f"{column}."):
+                return None
+            position += 1
+
+        return values
+
+    @staticmethod
+    def _complete_columns(
+        rows: dict[str, Any], columns: dict[str, dict[str, str]]
+    ) -> tuple[str, ...]:
+        """Return the walked columns that hold a value for exactly the rows."""
+        return tuple(
+            column
+            for column, values in columns.items()
+            if values and values.keys() == rows.keys()
+        )
+
     async def _set_oid(self, oid: str, value: str) -> bool:
         """Set an OID value."""
         try:
             await self._ensure_transport()
-            errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
+            hlapi = load_backend()
+            started = self._start_request()
+            errorIndication, errorStatus, errorIndex, varBinds = await hlapi.set_cmd(
                 self._engine,
                 self._auth_data,
                 self._transport,
-                ContextData(),
-                ObjectType(ObjectIdentity(oid), OctetString(value)),
+                hlapi.ContextData(),
+                hlapi.ObjectType(hlapi.ObjectIdentity(oid), hlapi.OctetString(value)),
             )
+            if not errorIndication:
+                self._record_rtt(started)
 
+            if errorIndication:
+                self._check_usm_error(errorIndication)
+                self._check_timeout(errorIndication)
             if errorIndication or errorStatus:
                 _LOGGER.error("Failed to set OID: %s", errorIndication or errorStatus)
                 return False
@@ -300,6 +1165,52 @@ class SNMPClient:
 
     async def get_system_info(self) -> dict[str, Any]:
         """Get system information."""
+        info = await self._fetch_system_info()
+        description = info["description"]
+        if description and self._plan_description not in (None, description):
+            # Firmware updates can change the devices, enumerate them again
+            self._devices = None
+        self._check_capabilities(description)
+        await self._update_plan(description)
+        return info
+
+    async def get_printer_devices(self) -> dict[int, str | None]:
+        """Return the printer devices of the agent and their descriptions.
+
+        Print servers and some MFPs host several printers behind one
+        address. They are enumerated with one walk of hrDeviceTable, which
+        is repeated when sysDescr changes. Agents without a readable table
+        are assumed to have a single printer with hrDeviceIndex 1.
+        """
+        if self._devices is None:
+            types, descriptions = (
+                await self._walk_table(
+                    (OID_DEVICE_TYPE_COLUMN, OID_DEVICE_DESCRIPTION_COLUMN)
+                )
+            ).values()
+            devices = {
+                int(index): descriptions.get(index)
+                for index, device_type in types.items()
+                if device_type == HR_DEVICE_PRINTER and index.isdigit()
+            }
+            if not types:
+                # Not cached when the walk failed or the table is missing
+                return {1: None}
+            self._devices = dict(sorted(devices.items())) or {1: None}
+        return self._devices
+
+    @property
+    def primary_device(self) -> int:
+        """Return the hrDeviceIndex of the agent's first printer device."""
+        return next(iter(self._devices)) if self._devices else 1
+
+    @property
+    def round_trip_time(self) -> float | None:
+        """Return the smoothed round trip time in seconds, None before a reply."""
+        return self._rtt.srtt
+
+    async def _fetch_system_info(self) -> dict[str, Any]:
+        """Read the system group."""
         return {
             "description": await self._get_oid(OID_SYSTEM_DESCRIPTION),
             "name": await self._get_oid(OID_SYSTEM_NAME),
@@ -308,10 +1219,39 @@ class SNMPClient:
             "uptime": await self._get_oid(OID_SYSTEM_UPTIME),
         }
 
-    async def get_device_info(self) -> dict[str, Any]:
+    async def _update_plan(self, description: str | None) -> None:
+        """Compile the vendor fetch plan when sysDescr is new or changed."""
+        if not description or description == self._plan_description:
+            return
+        self._plan = await asyncio.get_running_loop().run_in_executor(
+            None, compile_plan, description
+        )
+        self._plan_description = description
+
+    async def _get_planned(
+        self, fields: tuple[str, ...], device: int
+    ) -> dict[str, str]:
+        """Get the planned vendor OIDs of some fields in one request.
+
+        Vendor OIDs describe the agent's first printer device, other devices
+        get nothing. OIDs the printer doesn't answer are skipped until they
+        are probed again, see _is_unsupported().
+        """
+        planned = self._plan.fields(fields) if device == self.primary_device else {}
+        if not planned:
+            return {}
+
+        values = await self._get_oids(list(planned.values()))
+        return {name: values[oid] for name, oid in planned.items() if values.get(oid)}
+
+    async def get_serial_number(self, device: int = 1) -> str | None:
+        """Get the serial number of a printer device."""
+        return await self._get_oid(_device_oid(OID_SERIAL_NUMBER, device))
+
+    async def get_device_info(self, device: int = 1) -> dict[str, Any]:
         """Get device information."""
-        device_state = await self._get_oid(OID_DEVICE_STATE)
-        serial = await self._get_oid(OID_SERIAL_NUMBER)
+        device_state = await self._get_oid(_device_oid(OID_DEVICE_STATE, device))
+        serial = await self._get_oid(_device_oid(OID_SERIAL_NUMBER, device))
         mac = await self._get_oid(OID_HARDWARE_ADDRESS)
 
         # Convert MAC address to standard format
@@ -323,13 +1263,15 @@ class SNMPClient:
                 pass
 
         # Get page counts
-        page_counts = await self.get_page_counts()
+        page_counts = await self.get_page_counts(device)
+        errors = await self._get_oid(_device_oid(OID_DEVICE_ERRORS, device))
+        self._device_states[device] = (device_state, errors)
 
         return {
             "state": DEVICE_STATUS.get(
                 int(device_state) if device_state else 1, "unknown"
             ),
-            "errors": await self._get_oid(OID_DEVICE_ERRORS),
+            "errors": errors,
             "serial_number": serial,
             "mac_address": mac,
             "memory_size": await self._get_oid(OID_MEMORY_SIZE),
@@ -337,109 +1279,204 @@ class SNMPClient:
             "page_counts": page_counts,  # Detailed page counts
         }
 
-    async def get_supplies(self) -> list[dict[str, Any]]:
-        """Get all printer supplies (toner, ink, drums, etc.)."""
-        descriptions = await self._walk_oid(OID_MARKER_SUPPLIES_DESCRIPTION)
-        types = await self._walk_oid(OID_MARKER_SUPPLIES_TYPE)
-        classes = await self._walk_oid(OID_MARKER_SUPPLIES_CLASS)
-        max_capacities = await self._walk_oid(OID_MARKER_SUPPLIES_MAX_CAPACITY)
-        levels = await self._walk_oid(OID_MARKER_SUPPLIES_LEVEL)
+    async def get_supplies(self, device: int = 1) -> list[dict[str, Any]]:
+        """Get all printer supplies (toner, ink, drums, etc.).
+
+        Only levels and capacities are re-read while the known supplies stay
+        the same, the whole table is walked again when a supply is added or
+        removed.
+        """
+        max_capacity_oid = _device_oid(OID_MARKER_SUPPLIES_MAX_CAPACITY, device)
+        level_oid = _device_oid(OID_MARKER_SUPPLIES_LEVEL, device)
+        known = self._supply_rows.get(device)
+        if known is not None:
+            values = await self._refresh_table(
+                self._supply_columns[device], list(known)
+            )
+            if values is not None:
+                return [
+                    self._build_supply(
+                        index,
+                        row,
+                        values.get(max_capacity_oid, {}).get(index, -2),
+                        values.get(level_oid, {}).get(index, -2),
+                    )
+                    for index, row in known.items()
+                ]
+            _LOGGER.debug("Supplies of %s changed, walking the table", self.host)
+
+        descriptions, types, classes, max_capacities, levels = (
+            await self._walk_table(
+                (
+                    _device_oid(OID_MARKER_SUPPLIES_DESCRIPTION, device),
+                    _device_oid(OID_MARKER_SUPPLIES_TYPE, device),
+                    _device_oid(OID_MARKER_SUPPLIES_CLASS, device),
+                    max_capacity_oid,
+                    level_oid,
+                )
+            )
+        ).values()
 
-        supplies = []
-        for index in descriptions.keys():
+        rows = {}
+        for index, description in descriptions.items():
             supply_type = int(types.get(index, 1))
             supply_class = int(classes.get(index, 1))
-            max_capacity = int(max_capacities.get(index, -2))
-            level = int(levels.get(index, -2))
+            rows[index] = {
+                "description": description,
+                "color": self._supply_color(index, description),
+                "type": SUPPLY_TYPE.get(supply_type, "unknown"),
+                "class": SUPPLY_CLASS.get(supply_class, "unknown"),
+            }
 
-            # Calculate percentage if capacity is known
-            percentage = None
-            if max_capacity > 0 and level >= 0:
-                percentage = int((level / max_capacity) * 100)
-            elif level == -2:  # Unknown
-                percentage = None
-            elif level == -3:  # At least one supply is at some level
-                percentage = 50
-
-            # Extract color from description
-            description = descriptions[index]
-            color = "Unknown"
-            description_lower = description.lower()
-
-            # Log the description for debugging color extraction
-            _LOGGER.debug(
-                "Supply %s: description='%s', extracting color...", index, description
+        # An empty walk is as likely a failed request as an empty table
+        if rows:
+            self._supply_rows[device] = rows
+            self._supply_columns[device] = self._complete_columns(
+                rows, {max_capacity_oid: max_capacities, level_oid: levels}
             )
-
-            # Check for common color names in description
-            if (
-                "black" in description_lower
-                or "blk" in description_lower
-                or "bk" in description_lower
-            ):
-                color = "Black"
-            elif "cyan" in description_lower:
-                color = "Cyan"
-            elif "magenta" in description_lower:
-                color = "Magenta"
-            elif "yellow" in description_lower or "ylw" in description_lower:
-                color = "Yellow"
-            elif "light cyan" in description_lower or "lightcyan" in description_lower:
-                color = "Light Cyan"
-            elif (
-                "light magenta" in description_lower
-                or "lightmagenta" in description_lower
-            ):
-                color = "Light Magenta"
-            elif "photo" in description_lower:
-                color = "Photo"
-            elif "gray" in description_lower or "grey" in description_lower:
-                color = "Gray"
-
-            _LOGGER.debug("Supply %s: extracted color='%s'", index, color)
-
-            supplies.append(
-                {
-                    "index": index,
-                    "description": description,
-                    "color": color,
-                    "type": SUPPLY_TYPE.get(supply_type, "unknown"),
-                    "class": SUPPLY_CLASS.get(supply_class, "unknown"),
-                    "max_capacity": max_capacity,
-                    "level": level,
-                    "percentage": percentage,
-                }
+        else:
+            self._supply_rows.pop(device, None)
+        return [
+            self._build_supply(
+                index, row, max_capacities.get(index, -2), levels.get(index, -2)
             )
+            for index, row in rows.items()
+        ]
 
-        return supplies
-
-    async def get_input_trays(self) -> list[dict[str, Any]]:
-        """Get all paper input trays."""
-        descriptions = await self._walk_oid(OID_INPUT_DESCRIPTION)
-        max_capacities = await self._walk_oid(OID_INPUT_MAX_CAPACITY)
-        levels = await self._walk_oid(OID_INPUT_CURRENT_LEVEL)
+    @staticmethod
+    def _supply_color(index: str, description: str) -> str:
+        """Extract the supply color from its description."""
+        color = "Unknown"
+        description_lower = description.lower()
 
-        trays = []
-        for index in descriptions.keys():
-            max_capacity = int(max_capacities.get(index, -2))
-            level = int(levels.get(index, -2))
+        # Log the description for debugging color extraction
+        _LOGGER.debug(
+            "Supply %s: description='%s', extracting color...", index, description
+        )
 
-            # Calculate percentage
+        # Check for common color names in description
+        if (
+            "black" in description_lower
+            or "blk" in description_lower
+            or "bk" in description_lower
+        ):
+            color = "Black"
+        elif "cyan" in description_lower:
+            color = "Cyan"
+        elif "magenta" in description_lower:
+            color = "Magenta"
+        elif "yellow" in description_lower or "ylw" in description_lower:
+            color = "Yellow"
+        elif "light cyan" in description_lower or "lightcyan" in description_lower:
+            color = "Light Cyan"
+        elif (
+            "light magenta" in description_lower or "lightmagenta" in description_lower
+        ):
+            color = "Light Magenta"
+        elif "photo" in description_lower:
+            color = "Photo"
+        elif "gray" in description_lower or "grey" in description_lower:
+            color = "Gray"
+
+        _LOGGER.debug("Supply %s: extracted color='%s'", index, color)
+        return color
+
+    @staticmethod
+    def _build_supply(
+        index: str, row: dict[str, Any], max_capacity: Any, level: Any
+    ) -> dict[str, Any]:
+        """Combine the static columns of a supply with its current level."""
+        max_capacity = int(max_capacity)
+        level = int(level)
+
+        # Calculate percentage if capacity is known
+        percentage = None
+        if max_capacity > 0 and level >= 0:
+            percentage = int((level / max_capacity) * 100)
+        elif level == -2:  # Unknown
             percentage = None
-            if max_capacity > 0 and level >= 0:
-                percentage = int((level / max_capacity) * 100)
-
-            trays.append(
-                {
-                    "index": index,
-                    "description": descriptions[index],
-                    "max_capacity": max_capacity,
-                    "level": level,
-                    "percentage": percentage,
-                }
+        elif level == -3:  # At least one supply is at some level
+            percentage = 50
+
+        return {
+            "index": index,
+            **row,
+            "max_capacity": max_capacity,
+            "level": level,
+            "percentage": percentage,
+        }
+
+    async def get_input_trays(self, device: int = 1) -> list[dict[str, Any]]:
+        """Get all paper input trays.
+
+        Like supplies, only levels and capacities are re-read while the
+        known trays stay the same.
+        """
+        max_capacity_oid = _device_oid(OID_INPUT_MAX_CAPACITY, device)
+        level_oid = _device_oid(OID_INPUT_CURRENT_LEVEL, device)
+        known = self._tray_rows.get(device)
+        if known is not None:
+            values = await self._refresh_table(self._tray_columns[device], list(known))
+            if values is not None:
+                return [
+                    self._build_tray(
+                        index,
+                        row,
+                        values.get(max_capacity_oid, {}).get(index, -2),
+                        values.get(level_oid, {}).get(index, -2),
+                    )
+                    for index, row in known.items()
+                ]
+            _LOGGER.debug("Input trays of %s changed, walking the table", self.host)
+
+        descriptions, max_capacities, levels = (
+            await self._walk_table(
+                (
+                    _device_oid(OID_INPUT_DESCRIPTION, device),
+                    max_capacity_oid,
+                    level_oid,
+                )
+            )
+        ).values()
+
+        rows = {
+            index: {"description": description}
+            for index, description in descriptions.items()
+        }
+        if rows:
+            self._tray_rows[device] = rows
+            self._tray_columns[device] = self._complete_columns(
+                rows, {max_capacity_oid: max_capacities, level_oid: levels}
+            )
+        else:
+            self._tray_rows.pop(device, None)
+        return [
+            self._build_tray(
+                index, row, max_capacities.get(index, -2), levels.get(index, -2)
             )
+            for index, row in rows.items()
+        ]
 
-        return trays
+    @staticmethod
+    def _build_tray(
+        index: str, row: dict[str, Any], max_capacity: Any, level: Any
+    ) -> dict[str, Any]:
+        """Combine the static columns of a tray with its current level."""
+        max_capacity = int(max_capacity)
+        level = int(level)
+
+        # Calculate percentage
+        percentage = None
+        if max_capacity > 0 and level >= 0:
+            percentage = int((level / max_capacity) * 100)
+
+        return {
+            "index": index,
+            **row,
+            "max_capacity": max_capacity,
+            "level": level,
+            "percentage": percentage,
+        }
 
     async def get_cover_status(self) -> str:
         """Get cover status."""
@@ -454,11 +1491,36 @@ class SNMPClient:
             return status_map.get(status, "unknown")
         return "unknown"
 
-    async def get_display_text(self) -> str | None:
-        """Get text from printer display."""
+    async def get_display_text(self, device: int = 1) -> str | None:
+        """Get text from printer display.
+
+        The panel text follows the device's status and error bits, so it is
+        only read again when get_device_info() saw those change, or after
+        DISPLAY_TEXT_REFRESH_INTERVAL. Printers without a display OID are
+        not asked at all, their OIDs are in the unsupported list.
+        """
+        state = self._device_states.get(device)
+        cached = self._display_texts.get(device)
+        if (
+            state is not None
+            and cached is not None
+            and cached[0] == state
+            and time.monotonic() - cached[1] < DISPLAY_TEXT_REFRESH_INTERVAL
+        ):
+            return cached[2]
+
+        text = await self._read_display_text(device)
+        if state is not None:
+            self._display_texts[device] = (state, time.monotonic(), text)
+        return text
+
+    async def _read_display_text(self, device: int) -> str | None:
+        """Read and decode the text of the printer display."""
         try:
-            # Try to get display buffer text
-            text = await self._get_oid(f"{OID_DISPLAY_BUFFER}.1.1")
+            # Prefer the vendor's display OID, then the display buffer
+            text = (await self._get_planned((FIELD_DISPLAY_TEXT,), device)).get(
+                FIELD_DISPLAY_TEXT
+            ) or await self._get_oid(f"{OID_DISPLAY_BUFFER}.{device}.1")
             if not text:
                 return None
 
@@ -476,21 +1538,46 @@ class SNMPClient:
         except Exception:
             return None
 
-    async def get_printer_errors(self) -> str | None:
+    async def get_printer_errors(self, device: int = 1) -> str | None:
         """Get printer error messages."""
-        errors = await self._get_oid(OID_DEVICE_ERRORS)
+        errors = await self._get_oid(_device_oid(OID_DEVICE_ERRORS, device))
         return errors if errors and errors != "0" and errors != "" else None
 
-    async def get_page_counts(self) -> dict[str, int]:
-        """Get page counts including total, color, and black/white pages."""
+    async def get_page_counts(self, device: int = 1) -> dict[str, int]:
+        """Get page counts including total, color, and black/white pages.
+
+        Printers with a vendor profile have their exact counters read in
+        one request, others have them guessed from the marker life counts.
+        """
+        counters = {
+            name: int(value)
+            for name, value in (
+                await self._get_planned(PAGE_COUNT_FIELDS, device)
+            ).items()
+            if value.isdigit()
+        }
+        if counters.get("total") is None and {"color", "black_and_white"} <= (
+            counters.keys()
+        ):
+            counters["total"] = counters["color"] + counters["black_and_white"]
+        if counters.get("total") is not None:
+            return {
+                "total": None,
+                "color": None,
+                "black_and_white": None,
+                "duplex": None,
+                **counters,
+            }
+
         # Walk the page count OID to get all marker impression counts
-        # OID 1.3.6.1.2.1.43.10.2.1.4.1.x where x is the marker index
-        page_counts = await self._walk_oid("1.3.6.1.2.1.43.10.2.1.4.1")
+        # OID 1.3.6.1.2.1.43.10.2.1.4.<device>.x where x is the marker index
+        page_counts = await self._walk_oid(f"1.3.6.1.2.1.43.10.2.1.4.{device}")
 
         result = {
             "total": None,
             "color": None,
             "black_and_white": None,
+            "duplex": None,
         }
 
         if not page_counts:
@@ -530,10 +1617,15 @@ class SNMPClient:
             "cover_status": await self.get_cover_status(),
         }
 
-    async def set_display_text(self, text: str) -> bool:
+    async def set_display_text(self, text: str, device: int = 1) -> bool:
         """Set text on printer display."""
         # Try to set display text (may not be supported on all printers)
-        return await self._set_oid(f"{OID_DISPLAY_BUFFER}.1.1", text)
+        result = await self._set_oid(f"{OID_DISPLAY_BUFFER}.{device}.1", text)
+        # Answers read from the printer before the write are stale
+        for key in [key for key in _MEMO if key[0] == self._peer_key]:
+            del _MEMO[key]
+        self._display_texts.pop(device, None)
+        return result
 
     async def get_manufacturer(self) -> str:
         """Extract manufacturer from system description."""
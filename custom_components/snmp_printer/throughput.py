@@ -0,0 +1,132 @@
+"""Page throughput rates from page counter deltas."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Sliding windows the rates are published for, in seconds
+RATE_WINDOWS = {"pages_per_hour": 3600, "pages_per_day": 86400}
+
+# Page counters of the coordinator's page_count dict
+PAGE_COUNTERS = ("total", "color", "black_and_white")
+
+
+class PageWindow:
+    """Sum of counter increases within a sliding time window."""
+
+    __slots__ = ("span", "total", "_events")
+
+    def __init__(self, span: float) -> None:
+        """Initialize an empty window."""
+        self.span = span
+        self.total = 0
+        self._events: deque[tuple[float, int]] = deque()
+
+    def add(self, timestamp: float, delta: int) -> None:
+        """Record pages printed at a point in time."""
+        self._events.append((timestamp, delta))
+        self.total += delta
+
+    def expire(self, timestamp: float) -> None:
+        """Drop the increases that fell out of the window."""
+        events = self._events
+        while events and events[0][0] <= timestamp - self.span:
+            self.total -= events.popleft()[1]
+
+    def events(self) -> list[tuple[float, int]]:
+        """Return the increases within the window."""
+        return list(self._events)
+
+
+class PageRateTracker:
+    """Track pages printed per hour and per day for each page counter.
+
+    Every poll adds the counter increase since the previous poll to the
+    windows and drops what expired, so the work per poll doesn't depend on
+    the length of the windows. Polls without printing add nothing. A counter
+    that goes backwards was reset and only sets the new baseline.
+
+    Pages counted after a gap longer than a window, like an outage or a
+    restart, were printed over the whole gap. A window only gets the share
+    of them that falls within its span, instead of a spike.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._last: dict[str, int] = {}
+        self._last_time: dict[str, float] = {}
+        self._windows: dict[str, dict[str, PageWindow]] = {}
+
+    def _counter_windows(self, counter: str) -> dict[str, PageWindow]:
+        """Return the windows of a counter, creating them when first seen."""
+        if counter not in self._windows:
+            self._windows[counter] = {
+                rate: PageWindow(span) for rate, span in RATE_WINDOWS.items()
+            }
+        return self._windows[counter]
+
+    def update(
+        self, page_count: dict[str, int | None], timestamp: float
+    ) -> dict[str, dict[str, int | None]]:
+        """Record the current page counters and return the rates.
+
+        Rates are returned as {rate: {counter: pages}} with None for
+        counters the printer doesn't report.
+        """
+        for counter in PAGE_COUNTERS:
+            value = page_count.get(counter)
+            if value is None:
+                continue
+
+            windows = self._counter_windows(counter)
+            last = self._last.get(counter)
+            last_time = self._last_time.get(counter)
+            self._last[counter] = value
+            self._last_time[counter] = timestamp
+            if last is None or last_time is None or value <= last:
+                continue
+            delta = value - last
+            interval = timestamp - last_time
+            for window in windows.values():
+                if interval > window.span:
+                    share = round(delta * window.span / interval)
+                    if share:
+                        window.add(timestamp, share)
+                else:
+                    window.add(timestamp, delta)
+
+        rates: dict[str, dict[str, int | None]] = {
+            rate: dict.fromkeys(PAGE_COUNTERS) for rate in RATE_WINDOWS
+        }
+        for counter, windows in self._windows.items():
+            for rate, window in windows.items():
+                window.expire(timestamp)
+                rates[rate][counter] = window.total
+        return rates
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and their windows in serializable form."""
+        return {
+            "last": dict(self._last),
+            "last_time": dict(self._last_time),
+            "events": {
+                counter: {rate: window.events() for rate, window in windows.items()}
+                for counter, windows in self._windows.items()
+            },
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore state saved with as_dict()."""
+        self._last = dict(data.get("last", {}))
+        # Without the time of the counters the next increase only sets them
+        self._last_time = dict(data.get("last_time", {}))
+        self._windows = {}
+        for counter, saved in data.get("events", {}).items():
+            windows = self._counter_windows(counter)
+            for rate, window in windows.items():
+                # Older state kept only the events of the longest window,
+                # the shorter ones drop what is too old on the next update
+                events = saved if isinstance(saved, list) else saved.get(rate, [])
+                for timestamp, delta in events:
+                    window.add(timestamp, delta)
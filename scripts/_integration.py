@@ -0,0 +1,26 @@
+"""Make the integration's HA-independent modules importable without Home Assistant.
+
+The package __init__ pulls in Home Assistant. Registering the package
+without executing it lets the scripts here, the benchmarks and the tests
+import snmp_client, const and the other plain-Python modules as
+`snmp_printer.<module>`.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+INTEGRATION_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "snmp_printer"
+)
+
+
+def register() -> None:
+    """Register the integration directory as the `snmp_printer` package."""
+    if "snmp_printer" in sys.modules:
+        return
+    package = types.ModuleType("snmp_printer")
+    package.__path__ = [str(INTEGRATION_DIR)]
+    sys.modules["snmp_printer"] = package
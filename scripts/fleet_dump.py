@@ -0,0 +1,259 @@
+"""Dump the inventory of a printer fleet without Home Assistant.
+
+Polls a list of printers with the integration's SNMP client, a bounded
+number at a time, and writes a row per printer as soon as it is done, as
+NDJSON (one JSON object per line) or CSV:
+
+    python scripts/fleet_dump.py hosts.txt --workers 64 --format csv > fleet.csv
+
+The host list has one printer per line, as `host` or `host:port`. Empty
+lines and lines starting with `#` are skipped, `-` reads it from stdin.
+Only pysnmp (see requirements.txt) is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _integration  # noqa: E402
+
+_integration.register()
+
+from snmp_printer import snmp_client  # noqa: E402
+
+# Columns of the CSV format, supplies and trays are joined into one column
+CSV_COLUMNS = (
+    "host",
+    "port",
+    "online",
+    "description",
+    "name",
+    "location",
+    "contact",
+    "serial_number",
+    "mac_address",
+    "state",
+    "errors",
+    "page_count",
+    "color_pages",
+    "black_and_white_pages",
+    "duplex_pages",
+    "supplies",
+    "input_trays",
+    "display_text",
+    "elapsed_ms",
+)
+
+
+def read_hosts(source: TextIO, default_port: int) -> Iterator[tuple[str, int]]:
+    """Yield (host, port) from a host list."""
+    for line in source:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        host, separator, port = line.rpartition(":")
+        if separator and port.isdigit() and ":" not in host:
+            yield host, int(port)
+        else:
+            yield line, default_port
+
+
+async def poll_printer(client: Any) -> dict[str, Any]:
+    """Return the inventory of one printer, parsed like the integration does."""
+    # A single GET first, so a dead host costs one timeout instead of one
+    # per system group OID
+    if not await client.test_connection():
+        return {"online": False}
+
+    system_info = await client.get_system_info()
+    if not any(system_info.values()):
+        return {"online": False}
+
+    devices = await client.get_printer_devices()
+    device = client.primary_device
+    device_info = await client.get_device_info(device)
+    return {
+        "online": True,
+        **system_info,
+        "serial_number": device_info.get("serial_number"),
+        "mac_address": device_info.get("mac_address"),
+        "memory_size": device_info.get("memory_size"),
+        "state": device_info.get("state"),
+        "errors": await client.get_printer_errors(device),
+        "page_counts": device_info.get("page_counts"),
+        "supplies": await client.get_supplies(device),
+        "input_trays": await client.get_input_trays(device),
+        "display_text": await client.get_display_text(device),
+        "printer_devices": {str(index): name for index, name in devices.items()},
+    }
+
+
+def _csv_row(result: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a result to the CSV columns."""
+    page_counts = result.get("page_counts") or {}
+    return {
+        **{column: result.get(column) for column in CSV_COLUMNS},
+        "page_count": page_counts.get("total"),
+        "color_pages": page_counts.get("color"),
+        "black_and_white_pages": page_counts.get("black_and_white"),
+        "duplex_pages": page_counts.get("duplex"),
+        "supplies": "; ".join(
+            f"{supply['description']}={supply['percentage']}%"
+            for supply in result.get("supplies") or ()
+        ),
+        "input_trays": "; ".join(
+            f"{tray['description']}={tray['percentage']}%"
+            for tray in result.get("input_trays") or ()
+        ),
+    }
+
+
+class RowWriter:
+    """Write results as they arrive, flushed row by row."""
+
+    def __init__(self, output: TextIO, output_format: str) -> None:
+        """Initialize the writer."""
+        self._output = output
+        self._csv: csv.DictWriter | None = None
+        if output_format == "csv":
+            self._csv = csv.DictWriter(output, CSV_COLUMNS)
+            self._csv.writeheader()
+
+    def write(self, result: dict[str, Any]) -> None:
+        """Write one result."""
+        if self._csv is not None:
+            self._csv.writerow(_csv_row(result))
+        else:
+            self._output.write(json.dumps(result, default=str) + "\n")
+        self._output.flush()
+
+
+async def dump(
+    hosts: Iterator[tuple[str, int]],
+    writer: RowWriter,
+    workers: int,
+    client_options: dict[str, Any],
+) -> tuple[int, int]:
+    """Poll all hosts, return the number polled and the number online."""
+    loop = asyncio.get_running_loop()
+    # Engine setup is the costly part of a new client, each worker creates
+    # one up front and shares it among the printers it polls. Setting them
+    # up while others poll would delay the answers past the timeout.
+    version = client_options["snmp_version"]
+    engines = await asyncio.gather(
+        *(
+            loop.run_in_executor(None, snmp_client.create_engine, version)
+            for _ in range(workers)
+        )
+    )
+
+    # Bounded, so the host list is read as it is polled
+    queue: asyncio.Queue[tuple[str, int] | None] = asyncio.Queue(workers * 2)
+    counts = [0, 0]
+
+    async def work(engine: Any) -> None:
+        while (target := await queue.get()) is not None:
+            host, port = target
+            started = time.monotonic()
+            # Anything a printer raises ends up in its row, a worker that
+            # died would leave the bounded queue full and the dump hanging
+            try:
+                client = snmp_client.SNMPClient(
+                    host, port, engine=engine, **client_options
+                )
+                result = await poll_printer(client)
+            except Exception as err:  # pylint: disable=broad-except
+                result = {"online": False, "error": str(err)}
+            writer.write(
+                {
+                    "host": host,
+                    "port": port,
+                    **result,
+                    "elapsed_ms": round((time.monotonic() - started) * 1000),
+                }
+            )
+            counts[0] += 1
+            counts[1] += result["online"]
+
+    tasks = [asyncio.create_task(work(engine)) for engine in engines]
+    try:
+        for target in hosts:
+            await queue.put(target)
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+    finally:
+        for engine in engines:
+            engine.close_dispatcher()
+    return counts[0], counts[1]
+
+
+def main() -> int:
+    """Run the dump."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("hosts", help="file with one printer per line, - for stdin")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--output", type=Path, help="write to a file, not stdout")
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--port", type=int, default=161)
+    parser.add_argument("--snmp-version", choices=("1", "2c", "3"), default="2c")
+    parser.add_argument("--community", default="public")
+    parser.add_argument("--username")
+    parser.add_argument("--auth-protocol")
+    parser.add_argument("--auth-key")
+    parser.add_argument("--priv-protocol")
+    parser.add_argument("--priv-key")
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument("--retries", type=int, default=1)
+    args = parser.parse_args()
+
+    client_options = {
+        "snmp_version": args.snmp_version,
+        "community": args.community,
+        "username": args.username,
+        "auth_protocol": args.auth_protocol,
+        "auth_key": args.auth_key,
+        "priv_protocol": args.priv_protocol,
+        "priv_key": args.priv_key,
+        "timeout": args.timeout,
+        "retries": args.retries,
+    }
+    started = time.monotonic()
+    with contextlib.ExitStack() as stack:
+        source = sys.stdin
+        if args.hosts != "-":
+            source = stack.enter_context(open(args.hosts, encoding="utf-8"))
+        output = sys.stdout
+        if args.output is not None:
+            output = stack.enter_context(
+                open(args.output, "w", encoding="utf-8", newline="")
+            )
+        polled, online = asyncio.run(
+            dump(
+                read_hosts(source, args.port),
+                RowWriter(output, args.format),
+                args.workers,
+                client_options,
+            )
+        )
+    print(
+        f"{polled} printers polled, {online} online, "
+        f"in {time.monotonic() - started:.1f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""Make the integration's HA-independent modules importable for the tests.
+
+The tests cover the plain-Python modules, which are imported as
+`snmp_printer.<module>` without running the package __init__, the same way
+the benchmarks do.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import _integration  # noqa: E402
+
+_integration.register()
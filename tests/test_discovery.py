@@ -0,0 +1,64 @@
+"""Tests of the subnet sweep helpers."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from snmp_printer.discovery import NetworkTooLarge, ProbeCache, parse_network
+
+
+def test_parse_network_hosts() -> None:
+    """Network and broadcast addresses are left out."""
+    assert parse_network(" 192.0.2.0/30 ") == ["192.0.2.1", "192.0.2.2"]
+    assert parse_network("192.0.2.7/24")[0] == "192.0.2.1"
+    assert len(parse_network("192.0.2.0/24")) == 254
+
+
+def test_parse_network_small_ranges() -> None:
+    """/31 and /32 ranges have no network or broadcast address."""
+    assert parse_network("192.0.2.4/31") == ["192.0.2.4", "192.0.2.5"]
+    assert parse_network("192.0.2.9") == ["192.0.2.9"]
+
+
+def test_parse_network_limits() -> None:
+    """Invalid and oversized ranges are rejected."""
+    with pytest.raises(ValueError):
+        parse_network("192.0.2.300/24")
+    with pytest.raises(NetworkTooLarge):
+        parse_network("10.0.0.0/8")
+
+
+def test_probe_cache_lru() -> None:
+    """The least recently used host is dropped when the cache is full."""
+    cache = ProbeCache(maxsize=2)
+    cache["a"] = {"description": "A"}
+    cache["b"] = {"description": "B"}
+    assert cache["a"] == {"description": "A"}
+    cache["c"] = {"description": "C"}
+    assert len(cache) == 2
+    with pytest.raises(KeyError):
+        cache["b"]
+    cache.discard("a")
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_probe_cache_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hosts that didn't answer as printers expire sooner."""
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = ProbeCache(ttl=100, negative_ttl=10)
+    cache["printer"] = {"description": "Printer"}
+    cache["other"] = None
+    assert cache["other"] is None
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 50)
+    assert cache["printer"] == {"description": "Printer"}
+    with pytest.raises(KeyError):
+        cache["other"]
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 150)
+    with pytest.raises(KeyError):
+        cache["printer"]
+    assert len(cache) == 0
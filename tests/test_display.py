@@ -0,0 +1,112 @@
+"""Tests of the rate-limited display text writer."""
+
+from __future__ import annotations
+
+import asyncio
+
+from snmp_printer.display import DisplayWriter
+
+
+class FakeClient:
+    """Record the display texts written, slowly."""
+
+    host = "printer"
+
+    def __init__(self, delay: float = 0.01, result: bool = True) -> None:
+        """Initialize the client."""
+        self.delay = delay
+        self.result = result
+        self.log: list[str] = []
+
+    async def set_display_text(self, text: str, device: int = 1) -> bool:
+        """Write a text, taking `delay` seconds."""
+        self.log.append(f"start {text}")
+        await asyncio.sleep(self.delay)
+        self.log.append(f"end {text}")
+        return self.result
+
+
+def test_writes_to_one_printer_run_in_order() -> None:
+    """A write queued while two others are sent waits for both."""
+
+    async def run() -> FakeClient:
+        writer = DisplayWriter(1000)
+        client = FakeClient(delay=0.05)
+        first = asyncio.create_task(writer.write(client, 1, "A"))
+        await asyncio.sleep(0.01)  # A is being sent
+        second = asyncio.create_task(writer.write(client, 1, "B"))
+        await asyncio.sleep(0.07)  # A is done, B is being sent
+        third = asyncio.create_task(writer.write(client, 1, "C"))
+        assert await asyncio.gather(first, second, third) == [True, True, True]
+        return client
+
+    client = asyncio.run(run())
+    assert client.log == ["start A", "end A", "start B", "end B", "start C", "end C"]
+
+
+def test_queued_writes_collapse_to_the_newest_text() -> None:
+    """Texts replacing a waiting write are sent once, as the newest."""
+
+    async def run() -> tuple[FakeClient, list[bool]]:
+        writer = DisplayWriter(1000)
+        client = FakeClient(delay=0.05)
+        first = asyncio.create_task(writer.write(client, 1, "A"))
+        await asyncio.sleep(0.01)
+        results = await asyncio.gather(
+            first,
+            writer.write(client, 1, "B"),
+            writer.write(client, 1, "C"),
+        )
+        return client, results
+
+    client, results = asyncio.run(run())
+    assert client.log == ["start A", "end A", "start C", "end C"]
+    assert results == [True, True, True]
+
+
+def test_writes_to_many_printers_are_rate_limited() -> None:
+    """Starts of writes to different printers are spaced by the rate."""
+
+    async def run() -> float:
+        writer = DisplayWriter(50)
+        clients = [FakeClient(delay=0) for _ in range(5)]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(writer.write(client, 1, "A") for client in clients))
+        return loop.time() - started
+
+    # Five starts at 50 per second span four intervals of 20 ms
+    assert asyncio.run(run()) >= 0.075
+
+
+def test_failed_write_returns_false() -> None:
+    """A write that raises is reported as not set."""
+
+    class BrokenClient(FakeClient):
+        async def set_display_text(self, text: str, device: int = 1) -> bool:
+            raise OSError("unreachable")
+
+    assert asyncio.run(DisplayWriter(10).write(BrokenClient(), 1, "A")) is False
+
+
+def test_cancelled_sends_resolve_their_writes() -> None:
+    """Callers of writes whose sending was cancelled get False."""
+
+    async def run() -> tuple[list[bool], DisplayWriter]:
+        writer = DisplayWriter(1000)
+        client = FakeClient(delay=1)
+        first = asyncio.create_task(writer.write(client, 1, "A"))
+        await asyncio.sleep(0.01)  # A is being sent
+        sending = writer._sending[(client, 1)]
+        second = asyncio.create_task(writer.write(client, 1, "B"))
+        await asyncio.sleep(0)
+        third = asyncio.create_task(writer.write(client, 1, "C"))
+        await asyncio.sleep(0.01)  # C replaced B, waiting for A
+        sending.cancel()
+        writer._sending[(client, 1)].cancel()
+        results = await asyncio.wait_for(asyncio.gather(first, second, third), 0.5)
+        return results, writer
+
+    results, writer = asyncio.run(run())
+    assert results == [False, False, False]
+    assert not writer._queued
@@ -0,0 +1,74 @@
+"""Tests of the supply depletion forecast."""
+
+from __future__ import annotations
+
+import json
+
+from snmp_printer.forecast import SupplyForecaster, SupplyHistory
+
+DAY = 86400
+START = 1_700_000_000.0
+
+
+def _supply(level: int, max_capacity: int = 100) -> dict:
+    """Return a supply dict as the client reads it."""
+    return {"index": "1", "level": level, "max_capacity": max_capacity}
+
+
+def test_forecast_from_level_drop() -> None:
+    """Days and pages left follow the rate since the oldest sample."""
+    forecaster = SupplyForecaster()
+    supply = _supply(80)
+    forecaster.update([supply], 1000, START)
+    assert supply["days_remaining"] is None
+    assert supply["pages_remaining"] is None
+
+    supply = _supply(60)
+    forecaster.update([supply], 3000, START + 10 * DAY)
+    assert supply["days_remaining"] == 30.0
+    assert supply["pages_remaining"] == 6000
+
+
+def test_refill_starts_a_new_history() -> None:
+    """A large rise is a new cartridge, small rises are jitter."""
+    history = SupplyHistory(100)
+    history.add(START, 50, None)
+    history.add(START + DAY, 52, None)
+    assert len(history) == 1
+
+    history.add(START + 2 * DAY, 95, None)
+    assert len(history) == 1
+    assert history.forecast(START + 3 * DAY, 95, None) == (None, None)
+
+
+def test_history_keeps_newest_samples() -> None:
+    """A full ring buffer drops its oldest sample."""
+    history = SupplyHistory(100, size=3)
+    for day, level in enumerate((90, 80, 70, 60)):
+        history.add(START + day * DAY, level, None)
+    assert len(history) == 3
+    # The oldest sample left is 80 of day 1
+    assert history.forecast(START + 3 * DAY, 60, None) == (6.0, None)
+
+
+def test_supplies_without_levels_are_not_forecast() -> None:
+    """Unknown levels or capacities get no forecast and no history."""
+    forecaster = SupplyForecaster()
+    supply = _supply(-3)
+    forecaster.update([supply], None, START)
+    assert supply["days_remaining"] is None
+    assert forecaster.as_dict() == {}
+
+
+def test_history_round_trip() -> None:
+    """Histories survive a JSON round trip of the store."""
+    forecaster = SupplyForecaster()
+    forecaster.update([_supply(80)], 1000, START)
+    forecaster.update([_supply(70)], None, START + DAY)
+
+    restored = SupplyForecaster()
+    restored.restore(json.loads(json.dumps(forecaster.as_dict())))
+    supply = _supply(60)
+    restored.update([supply], 2000, START + 2 * DAY)
+    assert supply["days_remaining"] == 6.0
+    assert supply["pages_remaining"] == 3000
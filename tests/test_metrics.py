@@ -0,0 +1,98 @@
+"""Tests of the OpenMetrics exporter."""
+
+from __future__ import annotations
+
+from snmp_printer.metrics import MetricsExporter, PollStats
+from snmp_printer.model import build_snapshot
+
+DATA = {
+    "info": {"description": "HP LaserJet"},
+    "status": {"state": "online", "serial_number": "CN123"},
+    "page_count": {"total": 1200},
+    "supplies": [
+        {"index": "1", "description": "Toner", "color": "Black", "percentage": 40},
+        {"index": "2", "description": "Toner", "color": "Black", "percentage": 90},
+    ],
+    "input_trays": [
+        {"index": "1", "description": "Tray", "percentage": 50},
+        {"index": "2", "description": "Tray", "percentage": None},
+    ],
+}
+
+
+def _update(exporter: MetricsExporter, snapshot, online: bool = True) -> None:
+    """Render a printer after a poll."""
+    exporter.update(
+        "entry",
+        "192.0.2.1",
+        'Office "A"',
+        1,
+        snapshot,
+        online,
+        PollStats(polls=3, failures=1, last_duration=0.25),
+        0.012,
+    )
+
+
+def test_render_families_and_samples() -> None:
+    """Every family is declared, the printer's samples follow it."""
+    exporter = MetricsExporter()
+    _update(exporter, build_snapshot(DATA))
+    text = exporter.render().decode()
+
+    assert text.startswith("# TYPE snmp_printer info\n")
+    assert text.endswith("# EOF\n")
+    base = 'host="192.0.2.1",printer="Office \\"A\\""'
+    assert f'snmp_printer_info{{{base},model="HP LaserJet",serial="CN123"}} 1\n' in text
+    assert f"snmp_printer_up{{{base}}} 1\n" in text
+    assert f"snmp_printer_polls_total{{{base}}} 3\n" in text
+    assert f'snmp_printer_pages_total{{{base},device="1",kind="total"}} 1200\n' in text
+    assert (
+        f'snmp_printer_device_state{{{base},device="1",'
+        'snmp_printer_device_state="online"} 1\n'
+    ) in text
+    assert "# UNIT snmp_printer_supply_level_percent percent\n" in text
+
+
+def test_rows_with_equal_descriptions_stay_apart() -> None:
+    """Supplies and trays of the same description differ by their index."""
+    exporter = MetricsExporter()
+    _update(exporter, build_snapshot(DATA))
+    lines = exporter.render().decode().splitlines()
+
+    supplies = [line for line in lines if line.startswith("snmp_printer_supply")]
+    assert len(supplies) == 2
+    assert len({line.rsplit(" ", 1)[0] for line in supplies}) == 2
+    assert 'index="2",supply="Toner",color="Black"} 90' in supplies[1]
+
+    # Trays without a level have no sample
+    trays = [line for line in lines if line.startswith("snmp_printer_tray")]
+    assert len(trays) == 1
+    assert 'index="1",tray="Tray"} 50' in trays[0]
+
+
+def test_unchanged_devices_are_reused() -> None:
+    """A device equal to the previous poll's keeps its rendered samples."""
+    exporter = MetricsExporter()
+    snapshot = build_snapshot(DATA)
+    _update(exporter, snapshot)
+    rendered = exporter._printers["entry"].devices["1"]
+
+    _update(exporter, build_snapshot(DATA, snapshot))
+    assert exporter._printers["entry"].devices["1"] is rendered
+
+
+def test_render_is_cached_until_an_update() -> None:
+    """Scrapes get the same bytes until a printer changes."""
+    exporter = MetricsExporter()
+    _update(exporter, build_snapshot(DATA))
+    first = exporter.render()
+    assert exporter.render() is first
+
+    _update(exporter, build_snapshot(DATA), online=False)
+    assert exporter.render() is not first
+    assert b"snmp_printer_up{" in exporter.render()
+
+    exporter.remove("entry")
+    assert len(exporter) == 0
+    assert b"snmp_printer_up{" not in exporter.render()
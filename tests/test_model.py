@@ -0,0 +1,84 @@
+"""Tests of the printer snapshots."""
+
+from __future__ import annotations
+
+import json
+
+from snmp_printer.model import (
+    PageCounts,
+    PrinterSnapshot,
+    SupplyForecast,
+    build_snapshot,
+    from_store,
+    to_store,
+)
+
+DATA = {
+    "info": {"description": "HP LaserJet", "name": "office", "uptime": 1234},
+    "status": {"state": "online", "serial_number": "CN123"},
+    "page_count": {"total": 1200, "duplex": 300},
+    "supplies": [
+        {
+            "index": "1",
+            "description": "Black Toner",
+            "color": "Black",
+            "level": 40,
+            "max_capacity": 100,
+            "percentage": 40,
+            "days_remaining": 12.5,
+            "pages_remaining": 900,
+        }
+    ],
+    "input_trays": [{"index": "2", "description": "Tray 2", "percentage": None}],
+    "cover_status": {"state": "closed"},
+    "web_interface_available": True,
+    "page_rates": {"pages_per_hour": {"total": 4}, "pages_per_day": {"total": 40}},
+    "display_text": "Ready",
+    "devices": {
+        "2": {
+            "description": "Fax",
+            "status": {"state": "warning"},
+            "page_count": {"total": 7},
+        }
+    },
+}
+
+
+def test_build_snapshot() -> None:
+    """The dicts of a poll become the snapshot's fields."""
+    snapshot = build_snapshot(DATA)
+    assert snapshot.info.name == "office"
+    assert snapshot.device.serial_number == "CN123"
+    assert snapshot.device.page_count == PageCounts(total=1200, duplex=300)
+    assert snapshot.device.supplies[0].percentage == 40
+    assert snapshot.device.input_trays[0].percentage is None
+    assert snapshot.cover_status == "closed"
+    assert snapshot.page_rates.pages_per_day.total == 40
+    assert snapshot.forecasts == {"1": SupplyForecast(12.5, 900)}
+    assert snapshot.devices["2"].state == "warning"
+    assert snapshot.devices["2"].description == "Fax"
+
+
+def test_unchanged_parts_are_shared() -> None:
+    """A poll equal to the previous one reuses its objects."""
+    first = build_snapshot(DATA)
+    changed = {**DATA, "page_count": {"total": 1201, "duplex": 300}}
+    second = build_snapshot(changed, first)
+    assert second.info is first.info
+    assert second.device.supplies is first.device.supplies
+    assert second.devices is first.devices
+    assert second.device.page_count is not first.device.page_count
+
+    again = build_snapshot(DATA, first)
+    assert again == first
+    assert again.device is first.device
+
+
+def test_store_round_trip() -> None:
+    """A snapshot restored from the store equals the one saved."""
+    snapshot = build_snapshot(DATA).offline("2026-01-01T00:00:00")
+    restored = from_store(json.loads(json.dumps(to_store(snapshot))))
+    assert restored == snapshot
+    assert restored.is_online is False
+
+    assert from_store(to_store(PrinterSnapshot())) == PrinterSnapshot()
@@ -0,0 +1,58 @@
+"""Tests of the poll profiler."""
+
+from __future__ import annotations
+
+import pytest
+from snmp_printer import profiler as profiler_module
+from snmp_printer.profiler import TIMED_METHODS, PollProfiler, ProfilerBusy
+
+
+async def _query(self: FakeClient) -> dict:
+    """Return nothing."""
+    return {}
+
+
+class FakeClient:
+    """A client whose query methods the profiler wraps."""
+
+
+for _name in TIMED_METHODS:
+    setattr(FakeClient, _name, _query)
+
+
+@pytest.fixture(autouse=True)
+def no_active_profiler():
+    """Don't let a failed test block the profilers of the next ones."""
+    yield
+    profiler_module._ACTIVE = None
+
+
+def test_one_profiler_at_a_time() -> None:
+    """A second profiler can only start once the first one is done."""
+    client = FakeClient()
+    profiler = PollProfiler(1)
+    with pytest.raises(ProfilerBusy):
+        PollProfiler(1)
+
+    profiler.start(client)
+    profiler.stop(client)
+    assert profiler.done
+    PollProfiler(1).release()
+
+
+def test_released_profiler_lets_another_run() -> None:
+    """A cancelled profiler doesn't block the next one."""
+    profiler = PollProfiler(5)
+    profiler.release()
+    PollProfiler(5).release()
+
+
+def test_stop_without_start() -> None:
+    """A poll that failed before profiling started adds no time."""
+    client = FakeClient()
+    profiler = PollProfiler(1)
+    profiler.stop(client)
+    report = profiler.report()
+    assert report["polls"] == 1
+    assert report["wall_ms_per_poll"] == 0.0
+    assert "get_system_info" not in vars(client)
@@ -0,0 +1,50 @@
+"""Tests of the vendor profiles."""
+
+from __future__ import annotations
+
+import pytest
+from snmp_printer.profiles import (
+    FIELD_COLOR,
+    FIELD_DUPLEX,
+    FIELD_TOTAL,
+    FetchPlan,
+    compile_plan,
+    profile_module,
+)
+
+
+@pytest.mark.parametrize(
+    ("description", "module"),
+    [
+        ("HP Color LaserJet MFP M479fdw", "hp"),
+        ("HP ETHERNET MULTI-ENVIRONMENT,ROM none,JETDIRECT,JD153", "hp"),
+        ("Hewlett-Packard LaserJet 4250", "hp"),
+        ("Canon iR-ADV C5535 /P", "canon"),
+        ("Xerox WorkCentre 6515", "xerox"),
+        ("Brother NC-8300h, Firmware Ver.1.02", None),
+        ("Ricoh MP C3004 PHP 1.0", None),
+        ("OKI-C332-HPC", None),
+    ],
+)
+def test_profile_module(description: str, module: str | None) -> None:
+    """Vendors are recognized by whole words of sysDescr."""
+    assert profile_module(description) == module
+
+
+def test_compile_plan_adds_model_oids() -> None:
+    """Color models get the color counters on top of the vendor's OIDs."""
+    mono = compile_plan("HP LaserJet Pro M404dn")
+    color = compile_plan("HP Color LaserJet Pro M454dw")
+    assert mono.manufacturer == color.manufacturer == "HP"
+    assert FIELD_COLOR not in mono.oids
+    assert FIELD_COLOR in color.oids
+    assert color.fields((FIELD_TOTAL, FIELD_DUPLEX)).keys() == {
+        FIELD_TOTAL,
+        FIELD_DUPLEX,
+    }
+
+
+def test_no_plan_without_profile() -> None:
+    """Printers of other vendors get an empty plan."""
+    assert compile_plan("Lexmark MS610de") == FetchPlan()
+    assert compile_plan(None) == FetchPlan()
@@ -0,0 +1,74 @@
+"""Tests of the round trip time estimator."""
+
+from __future__ import annotations
+
+import pytest
+from snmp_printer.const import ADAPTIVE_TIMEOUT_MAX, ADAPTIVE_TIMEOUT_MIN
+from snmp_printer.rtt import RttEstimator
+
+
+def test_initial_timeout_until_first_sample() -> None:
+    """The configured timeout is used before anything was measured."""
+    rtt = RttEstimator(2.0)
+    assert rtt.timeout == 2.0
+
+    rtt.sample(0.2)
+    assert rtt.srtt == 0.2
+    assert rtt.rttvar == 0.1
+    assert rtt.timeout == pytest.approx(0.6)
+
+
+def test_timeout_stays_within_limits() -> None:
+    """Fast printers get the minimum timeout, slow ones the maximum."""
+    fast = RttEstimator(2.0)
+    fast.sample(0.001)
+    assert fast.timeout == ADAPTIVE_TIMEOUT_MIN
+
+    slow = RttEstimator(2.0)
+    slow.sample(4.0)
+    assert slow.timeout == ADAPTIVE_TIMEOUT_MAX
+
+
+def test_backoff_doubles_until_the_cap() -> None:
+    """Every timed out request doubles the timeout, up to the maximum."""
+    rtt = RttEstimator(2.0)
+    rtt.sample(0.2)
+
+    timeouts = []
+    for _ in range(5):
+        rtt.backoff()
+        timeouts.append(rtt.timeout)
+    assert timeouts == pytest.approx([1.2, 2.4, 4.8, 5.0, 5.0])
+
+
+def test_backoff_stays_until_a_sample() -> None:
+    """The backed off timeout is kept until an answer is measured."""
+    rtt = RttEstimator(2.0)
+    rtt.sample(0.2)
+    rtt.backoff()
+    assert rtt.timeout == pytest.approx(1.2)
+    assert rtt.timeout == pytest.approx(1.2)
+
+    rtt.sample(0.2)
+    assert rtt.backed_off is None
+    assert rtt.timeout == pytest.approx(0.5)
+
+
+def test_backoff_keeps_a_longer_initial_timeout() -> None:
+    """Backing off never shortens a timeout configured above the maximum."""
+    rtt = RttEstimator(8.0)
+    rtt.backoff()
+    assert rtt.timeout == 8.0
+
+
+def test_state_round_trip() -> None:
+    """The smoothed values are restored, the backoff isn't."""
+    rtt = RttEstimator(2.0)
+    rtt.sample(0.2)
+    rtt.sample(0.4)
+    rtt.backoff()
+
+    restored = RttEstimator(2.0)
+    restored.restore(rtt.as_dict())
+    assert (restored.srtt, restored.rttvar) == (rtt.srtt, rtt.rttvar)
+    assert restored.backed_off is None
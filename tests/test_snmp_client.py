@@ -0,0 +1,153 @@
+"""Tests of the SNMP client's bookkeeping that needs no printer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from snmp_printer.const import (
+    CAPABILITY_STRIKES,
+    OID_DEVICE_STATE,
+    OID_PAGE_COUNT,
+    OID_SYSTEM_DESCRIPTION,
+    OID_SYSTEM_NAME,
+)
+from snmp_printer.snmp_client import _MEMO, SNMPClient, _device_oid, load_backend
+
+
+@pytest.fixture(autouse=True)
+def _forget_answers() -> None:
+    """Don't share answers between tests."""
+    _MEMO.clear()
+
+
+def test_oid_skipped_after_strikes_in_a_row() -> None:
+    """Timeouts or empty answers only skip an OID when they repeat."""
+    client = SNMPClient("printer")
+    for _ in range(CAPABILITY_STRIKES - 1):
+        client._strike(OID_PAGE_COUNT, "timed out")
+    assert not client._is_unsupported(OID_PAGE_COUNT)
+
+    client._strike(OID_PAGE_COUNT, "timed out")
+    assert client._is_unsupported(OID_PAGE_COUNT)
+
+
+def test_answer_resets_strikes() -> None:
+    """An answer in between starts the count again."""
+    client = SNMPClient("printer")
+    for _ in range(CAPABILITY_STRIKES - 1):
+        client._strike(OID_PAGE_COUNT, "timed out")
+    client._strikes.pop(OID_PAGE_COUNT, None)
+    client._strike(OID_PAGE_COUNT, "timed out")
+    assert not client._is_unsupported(OID_PAGE_COUNT)
+
+
+def test_mandatory_oids_never_skipped() -> None:
+    """sysDescr and the device status of any device are always requested."""
+    client = SNMPClient("printer")
+    device_state = _device_oid(OID_DEVICE_STATE, 2)
+    for oid in (OID_SYSTEM_DESCRIPTION, device_state):
+        client._mark_unsupported(oid, "does not exist")
+        for _ in range(CAPABILITY_STRIKES):
+            client._strike(oid, "timed out")
+        assert not client._is_unsupported(oid)
+
+    client.restore_state(
+        {
+            "capabilities": {
+                "description": "printer",
+                "unsupported": {OID_SYSTEM_DESCRIPTION: 0.0, OID_PAGE_COUNT: 0.0},
+            }
+        }
+    )
+    assert list(client._unsupported) == [OID_PAGE_COUNT]
+
+
+def test_v3_peer_key_includes_credentials() -> None:
+    """Clients of one user with other keys don't share query results."""
+    right = SNMPClient("printer", snmp_version="3", username="u", auth_key="a" * 8)
+    wrong = SNMPClient("printer", snmp_version="3", username="u", auth_key="b" * 8)
+    assert right._peer_key != wrong._peer_key
+
+    same = SNMPClient("printer", snmp_version="3", username="u", auth_key="a" * 8)
+    assert right._peer_key == same._peer_key
+
+
+def test_probe_restores_settings() -> None:
+    """A probe with its own timeout leaves the client's settings alone."""
+    client = SNMPClient("127.0.0.1", port=9, timeout=3.0, retries=2)
+    assert asyncio.run(client.probe(0.3, 0)) == {}
+    assert (client.timeout, client.retries) == (3.0, 2)
+    assert client._transport.retries == 2
+
+
+class _Status(int):
+    """An error-status as pysnmp returns it."""
+
+    def prettyPrint(self) -> str:
+        """Return the name of the status."""
+        return {2: "noSuchName", 5: "genErr"}[self]
+
+
+def _answer(monkeypatch: pytest.MonkeyPatch, status: int, index: int) -> None:
+    """Answer the first GET with an error-status, later ones with values."""
+    hlapi = load_backend()
+    answers = [(None, _Status(status), index)]
+
+    async def get_cmd(engine, auth, transport, context, *var_binds, **options):
+        error_status, error_index = answers.pop()[1:] if answers else (0, 0)
+        values = [("oid", "value") for _ in var_binds]
+        return None, error_status, error_index, values
+
+    monkeypatch.setattr(hlapi, "get_cmd", get_cmd)
+
+
+def test_v1_no_such_name_marks_oid(monkeypatch: pytest.MonkeyPatch) -> None:
+    """SNMPv1 noSuchName drops the OID and asks again for the rest."""
+    _answer(monkeypatch, 2, 2)
+    client = SNMPClient("127.0.0.1", port=9, snmp_version="1")
+    values = asyncio.run(client._get_oids([OID_SYSTEM_NAME, OID_PAGE_COUNT]))
+    assert values == {OID_SYSTEM_NAME: "value", OID_PAGE_COUNT: None}
+    assert client._is_unsupported(OID_PAGE_COUNT)
+
+
+def test_other_error_status_is_a_failed_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """genErr, or noSuchName from a v2c agent, only counts a strike."""
+    for version, status in (("2c", 5), ("2c", 2), ("1", 5)):
+        _answer(monkeypatch, status, 2)
+        client = SNMPClient("127.0.0.1", port=9, snmp_version=version)
+        values = asyncio.run(client._get_oids([OID_SYSTEM_NAME, OID_PAGE_COUNT]))
+        assert values == {}
+        assert not client._is_unsupported(OID_PAGE_COUNT)
+        assert client._strikes == {OID_PAGE_COUNT: 1}
+        assert client._consecutive_failures == 1
+
+
+def test_shared_answer_is_booked_by_every_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Clients of one printer that share an answer both account for it."""
+    requests = []
+
+    async def get_cmd(engine, auth, transport, context, *var_binds, **options):
+        requests.append(var_binds)
+        await asyncio.sleep(0.01)
+        return None, 0, 0, [("oid", "value") for _ in var_binds]
+
+    monkeypatch.setattr(load_backend(), "get_cmd", get_cmd)
+    clients = [SNMPClient("127.0.0.1", port=9) for _ in range(2)]
+    for client in clients:
+        client._strike(OID_PAGE_COUNT, "timed out")
+
+    async def query() -> list[dict]:
+        return await asyncio.gather(
+            *(client._get_oids([OID_PAGE_COUNT]) for client in clients)
+        )
+
+    assert asyncio.run(query()) == [{OID_PAGE_COUNT: "value"}] * 2
+    assert len(requests) == 1
+    for client in clients:
+        assert client._connection_state == "online"
+        assert client._strikes == {}
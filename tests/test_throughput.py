@@ -0,0 +1,99 @@
+"""Tests of the page throughput rates."""
+
+from __future__ import annotations
+
+import json
+
+from snmp_printer.throughput import PageRateTracker
+
+HOUR = 3600
+START = 1_700_000_000.0
+
+
+def test_rates_sum_increases_within_windows() -> None:
+    """Increases count in each window until they expire."""
+    tracker = PageRateTracker()
+    tracker.update({"total": 100}, START)
+    tracker.update({"total": 110}, START + 60)
+    rates = tracker.update({"total": 115}, START + 120)
+    assert rates["pages_per_hour"]["total"] == 15
+    assert rates["pages_per_day"]["total"] == 15
+    assert rates["pages_per_hour"]["color"] is None
+
+    rates = tracker.update({"total": 115}, START + 60 + HOUR)
+    assert rates["pages_per_hour"]["total"] == 5
+    assert rates["pages_per_day"]["total"] == 15
+
+
+def test_counter_reset_sets_baseline() -> None:
+    """A counter that goes backwards adds nothing."""
+    tracker = PageRateTracker()
+    tracker.update({"total": 500}, START)
+    tracker.update({"total": 10}, START + 60)
+    rates = tracker.update({"total": 12}, START + 120)
+    assert rates["pages_per_hour"]["total"] == 2
+
+
+def test_gap_is_spread_over_its_length() -> None:
+    """Pages counted after an outage don't spike the shorter windows."""
+    tracker = PageRateTracker()
+    tracker.update({"total": 1000}, START)
+    # Offline polls have no page count
+    tracker.update({}, START + HOUR)
+    rates = tracker.update({"total": 1400}, START + 4 * HOUR)
+    assert rates["pages_per_hour"]["total"] == 100
+    assert rates["pages_per_day"]["total"] == 400
+
+
+def test_restart_keeps_counters_and_their_time() -> None:
+    """After a restart the first increase covers the time it was down."""
+    tracker = PageRateTracker()
+    tracker.update({"total": 1000}, START)
+    tracker.update({"total": 1010}, START + 60)
+
+    restored = PageRateTracker()
+    restored.restore(tracker.as_dict())
+    rates = restored.update({"total": 1210}, START + 60 + 2 * HOUR)
+    assert rates["pages_per_hour"]["total"] == 100
+    assert rates["pages_per_day"]["total"] == 210
+
+
+def test_restore_without_counter_times() -> None:
+    """State saved before the times were kept only sets the baseline."""
+    tracker = PageRateTracker()
+    tracker.restore({"last": {"total": 1000}, "events": {}})
+    rates = tracker.update({"total": 1500}, START)
+    assert rates["pages_per_hour"]["total"] == 0
+    rates = tracker.update({"total": 1510}, START + 60)
+    assert rates["pages_per_hour"]["total"] == 10
+
+
+def test_restore_keeps_each_window() -> None:
+    """Every window is restored with its own increases."""
+    tracker = PageRateTracker()
+    tracker.update({"total": 1000}, START)
+    tracker.update({"total": 1010}, START + 60)
+    # The first increase has left the hour, the gap is spread over 4 hours
+    tracker.update({"total": 1010}, START + 120 + HOUR)
+    tracker.update({"total": 1410}, START + 120 + 5 * HOUR)
+
+    restored = PageRateTracker()
+    restored.restore(json.loads(json.dumps(tracker.as_dict())))
+    rates = restored.update({"total": 1410}, START + 180 + 5 * HOUR)
+    assert rates["pages_per_hour"]["total"] == 100
+    assert rates["pages_per_day"]["total"] == 410
+
+
+def test_restore_events_of_longest_window() -> None:
+    """State saved with only the daily events still restores every window."""
+    tracker = PageRateTracker()
+    tracker.restore(
+        {
+            "last": {"total": 1010},
+            "last_time": {"total": START + 60},
+            "events": {"total": [[START + 60, 10]]},
+        }
+    )
+    rates = tracker.update({"total": 1010}, START + 120 + HOUR)
+    assert rates["pages_per_hour"]["total"] == 0
+    assert rates["pages_per_day"]["total"] == 10